@@ -5,9 +5,11 @@ See Also:
     :obj:`connect.Connect` for creating a client for using this package.
 
 """
+import importlib
 import logging
-import sys
 import pathlib
+import sys
+import typing as t
 
 from . import setup_env, version
 
@@ -38,71 +40,104 @@ POST_DOTENV: dict = setup_env.get_env_ax()
 """AX.* env variables after loading dotenv."""
 
 # short term hack for projects until they are moved to their own repos
-try:
-    sys.path.insert(0, str(PROJECTS_PATH))
-    from .projects import cf_token, cert_human, url_parser
-
-except Exception:  # pragma: no cover
-    raise
-
-
-try:
-    # noinspection PyCompatibility
-    from . import (
-        api,
-        auth,
-        cli,
-        constants,
-        data,
-        exceptions,
-        http,
-        logs,
-        tools,
-        projects,
-    )
-
-    from .api import (
-        ActivityLogs,
-        Adapters,
-        ApiEndpoints,
-        Cnx,
-        Dashboard,
-        DashboardSpaces,
-        Devices,
-        Enforcements,
-        Instances,
-        Meta,
-        RemoteSupport,
-        Runner,
-        SettingsGlobal,
-        SettingsGui,
-        SettingsLifecycle,
-        Signup,
-        SystemRoles,
-        SystemUsers,
-        Users,
-        Vulnerabilities,
-        Wizard,
-        WizardCsv,
-        WizardText,
-        json_api,
-    )
-    from .auth import AuthApiKey, AuthCredentials, AuthModel, AuthNull
-    from .connect import Connect
-    from .features import Features
-    from .http import Http
-except Exception:  # pragma: no cover
-    raise
+sys.path.insert(0, str(PROJECTS_PATH))
 
+from . import logs  # noqa: E402
 
 LOG = logs.LOG
 
+LAZY_ATTRS: t.Dict[str, t.Tuple[str, t.Optional[str]]] = {
+    # modules
+    "api": (".api", None),
+    "auth": (".auth", None),
+    "cli": (".cli", None),
+    "constants": (".constants", None),
+    "data": (".data", None),
+    "exceptions": (".exceptions", None),
+    "http": (".http", None),
+    "tools": (".tools", None),
+    "projects": (".projects", None),
+    "json_api": (".api.json_api", None),
+    # projects
+    "cert_human": (".projects.cert_human", None),
+    "cf_token": (".projects.cf_token", None),
+    "url_parser": (".projects.url_parser", None),
+    # API client
+    "Connect": (".connect", "Connect"),
+    "AsyncConnect": (".async_connect", "AsyncConnect"),
+    # HTTP client
+    "Http": (".http", "Http"),
+    "AsyncHttp": (".async_connect", "AsyncHttp"),
+    # API authentication
+    "AuthApiKey": (".auth", "AuthApiKey"),
+    "AuthModel": (".auth", "AuthModel"),
+    "AuthCredentials": (".auth", "AuthCredentials"),
+    "AuthNull": (".auth", "AuthNull"),
+    "Features": (".features", "Features"),
+    # API
+    **{
+        x: (".api", x)
+        for x in [
+            "ActivityLogs",
+            "Adapters",
+            "ApiEndpoints",
+            "Cnx",
+            "Dashboard",
+            "DashboardSpaces",
+            "Devices",
+            "Enforcements",
+            "Instances",
+            "Meta",
+            "RemoteSupport",
+            "Runner",
+            "SettingsGlobal",
+            "SettingsGui",
+            "SettingsLifecycle",
+            "Signup",
+            "SystemRoles",
+            "SystemUsers",
+            "Users",
+            "Vulnerabilities",
+            "Wizard",
+            "WizardCsv",
+            "WizardText",
+        ]
+    },
+}
+"""Map of attribute name to (module, attribute) to import on first access (PEP 562).
+
+Notes:
+    Importing the API models, the CLI, and the cert_human project takes most of the time
+    spent importing this package, so they are only imported when they are first used.
+"""
+
+
+def __getattr__(name: str) -> t.Any:
+    """Import the module or attribute of a module for ``name`` on first access."""
+    if name not in LAZY_ATTRS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module_name, attr = LAZY_ATTRS[name]
+    value = importlib.import_module(module_name, __name__)
+    if attr:
+        value = getattr(value, attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> t.List[str]:
+    """Get the names of this module including the names that are imported on first access."""
+    return sorted(set(globals()) | set(LAZY_ATTRS))
+
+
 __all__ = (
     "PACKAGE_ROOT",
     # API client
     "Connect",
+    "AsyncConnect",
     # HTTP client
     "Http",
+    "AsyncHttp",
     # API authentication
     "AuthApiKey",
     "AuthModel",
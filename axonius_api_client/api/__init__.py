@@ -1,31 +1,61 @@
 # -*- coding: utf-8 -*-
 """API library package."""
-from . import api_endpoints, json_api
-from .adapters import Adapters, Cnx
-from .api_endpoint import ApiEndpoint
-from .api_endpoints import ApiEndpoints
-from .assets import Devices, Runner, Users, Vulnerabilities, AssetMixin
-from .enforcements import Enforcements
-from .folders import Folders
-from .mixins import ChildMixins, ModelMixins
-from .openapi import OpenAPISpec
-from .system import (
-    ActivityLogs,
-    Dashboard,
-    DashboardSpaces,
-    DataScopes,
-    Instances,
-    Meta,
-    RemoteSupport,
-    SettingsGlobal,
-    SettingsGui,
-    SettingsIdentityProviders,
-    SettingsLifecycle,
-    Signup,
-    SystemRoles,
-    SystemUsers,
-)
-from .wizards import Wizard, WizardCsv, WizardText
+import importlib
+import typing as t
+
+LAZY_ATTRS: t.Dict[str, str] = {
+    "api_endpoints": ".api_endpoints",
+    "json_api": ".json_api",
+    "Adapters": ".adapters",
+    "Cnx": ".adapters",
+    "ApiEndpoint": ".api_endpoint",
+    "ApiEndpoints": ".api_endpoints",
+    "AssetMixin": ".assets",
+    "Devices": ".assets",
+    "Runner": ".assets",
+    "Users": ".assets",
+    "Vulnerabilities": ".assets",
+    "Enforcements": ".enforcements",
+    "Folders": ".folders",
+    "ChildMixins": ".mixins",
+    "ModelMixins": ".mixins",
+    "OpenAPISpec": ".openapi",
+    "ActivityLogs": ".system",
+    "Dashboard": ".system",
+    "DashboardSpaces": ".system",
+    "DataScopes": ".system",
+    "Instances": ".system",
+    "Meta": ".system",
+    "RemoteSupport": ".system",
+    "SettingsGlobal": ".system",
+    "SettingsGui": ".system",
+    "SettingsIdentityProviders": ".system",
+    "SettingsLifecycle": ".system",
+    "Signup": ".system",
+    "SystemRoles": ".system",
+    "SystemUsers": ".system",
+    "Wizard": ".wizards",
+    "WizardCsv": ".wizards",
+    "WizardText": ".wizards",
+}
+"""Map of attribute name to the module to import it from on first access (PEP 562)."""
+
+
+def __getattr__(name: str) -> t.Any:
+    """Import the module or attribute of a module for ``name`` on first access."""
+    if name not in LAZY_ATTRS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(LAZY_ATTRS[name], __name__)
+    value = module if module.__name__.endswith(f".{name}") else getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> t.List[str]:
+    """Get the names of this module including the names that are imported on first access."""
+    return sorted(set(globals()) | set(LAZY_ATTRS))
+
 
 __all__ = (
     "Adapters",
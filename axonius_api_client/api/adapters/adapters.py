@@ -157,7 +157,20 @@ class Adapters(ModelMixins):
     @cached(cache=CACHE_GET_BASIC)
     def get_basic_cached(self) -> AdaptersList:
         """Get basic adapter data cached."""
-        return self.get_basic()
+        fetched: t.List[AdaptersList] = []
+
+        def get_document_meta() -> dict:
+            fetched.append(self.get_basic())
+            return fetched[0].document_meta
+
+        document_meta = self._disk_cached(name="adapters_basic", func=get_document_meta)
+        if fetched:
+            return fetched[0]
+
+        ret = AdaptersList(document_meta=document_meta)
+        ret.HTTP = self.auth.http
+        ret.RESPONSE = None
+        return ret
 
     def get_basic(self) -> AdaptersList:
         """Get basic adapter data."""
@@ -3,10 +3,12 @@
 import dataclasses
 import inspect
 import logging
+import time
 import typing as t
 
 import requests
 
+from .. import json_backend
 from ..constants.general import JSON_TYPES, RERAISE
 from ..constants.logs import LOG_LEVEL_ENDPOINTS
 from ..exceptions import (
@@ -133,11 +135,11 @@ class ApiEndpoint:
         Returns:
             the data loaded from the response received
         """
-        self.log.debug(f"{self!r} Performing request with request_obj type {type(request_obj)}")
+        self.log.debug("%r Performing request with request_obj type %s", self, type(request_obj))
         response: requests.Response = self.perform_request_raw(
             http=http, request_obj=request_obj, **kwargs
         )
-        self.log.debug(f"{self!r} Received response {response}")
+        self.log.debug("%r Received response %s", self, response)
         kwargs["response"] = response
         return response if raw else self.handle_response(http=http, **kwargs)
 
@@ -188,7 +190,7 @@ class ApiEndpoint:
                     remove_unknown_arguments=remove_unknown_arguments,
                     warn_unknown_arguments=warn_unknown_arguments,
                 )
-            self.log.debug(f"{self!r} Loading request with load_cls {load_cls} kwargs {kwargs}")
+            self.log.debug("%r Loading request with load_cls %s kwargs %s", self, load_cls, kwargs)
             try:
                 ret = load_cls.load_request(**kwargs)
             except Exception as exc:
@@ -198,7 +200,7 @@ class ApiEndpoint:
                 details = [f"cls: {load_cls}", f"kwargs: {json_log(kwargs)}"]
                 raise RequestLoadObjectError(api_endpoint=self, err=err, details=details, exc=exc)
 
-            self.log.debug(f"{self!r} Loaded request into {load_cls}")
+            self.log.debug("%r Loaded request into %s", self, load_cls)
         return ret
 
     def load_response(
@@ -221,7 +223,7 @@ class ApiEndpoint:
             load_cls = self.response_load_cls
             if load_cls:
                 self.log.debug(
-                    f"{self!r} Loading response with data type {type(data)}, load_cls={load_cls}"
+                    "%r Loading response with data type %s, load_cls=%s", self, type(data), load_cls
                 )
                 try:
                     data = load_cls.load_response(data=data, http=http, **kwargs)
@@ -234,7 +236,7 @@ class ApiEndpoint:
                         api_endpoint=self, err=err, details=details, exc=exc
                     )
 
-                self.log.debug(f"{self!r} Loaded response into {load_cls}")
+                self.log.debug("%r Loaded response into %s", self, load_cls)
         return data
 
     @property
@@ -265,6 +267,7 @@ class ApiEndpoint:
             data = response.text
             self.check_response_status(http=http, response=response, **kwargs)
         else:
+            load_start = time.perf_counter()
             data = self.get_response_json(response=response, **kwargs)
             self.check_response_status(http=http, response=response, **kwargs)
             data = self.load_response(
@@ -273,6 +276,7 @@ class ApiEndpoint:
             # noinspection PyBroadException
             try:
                 setattr(data, "RESPONSE", response)
+                setattr(data, "RESPONSE_LOAD_SECONDS", time.perf_counter() - load_start)
             except Exception:
                 pass
         return data
@@ -292,7 +296,7 @@ class ApiEndpoint:
         reraise = kwargs.get("reraise", RERAISE)
 
         try:
-            return response.json()
+            return json_backend.loads(response.content)
         except Exception as exc:
             if reraise:
                 raise
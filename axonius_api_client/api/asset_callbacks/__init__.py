@@ -4,6 +4,7 @@ from .base import Base, ExportMixins
 from .base_csv import Csv
 from .base_json import Json
 from .base_json_to_csv import JsonToCsv
+from .base_parquet import Arrow, Parquet
 from .base_table import Table
 from .base_xlsx import Xlsx
 from .base_xml import Xml
@@ -18,6 +19,8 @@ __all__ = (
     "Xlsx",
     "Xml",
     "JsonToCsv",
+    "Parquet",
+    "Arrow",
     "get_callbacks_cls",
     "CB_MAP",
 )
@@ -36,6 +36,7 @@ from ...tools import (
     path_backup_file,
     strip_right,
 )
+from ..json_api.assets import FetchTelemetry
 
 
 # noinspection SpellCheckingInspection
@@ -206,7 +207,9 @@ class Base:
         Args:
             arg: key to get from :attr:`GETARGS` with a default value from :meth:`args_map`
         """
-        return self.GETARGS.get(arg, self.args_map()[arg])
+        if not hasattr(self, "_args_map"):
+            self._args_map = self.args_map()
+        return self.GETARGS.get(arg, self._args_map[arg])
 
     def set_arg_value(self, arg: str, value: t.Any):
         """Set an argument value.
@@ -223,6 +226,7 @@ class Base:
         store: dict,
         state: Optional[dict] = None,
         getargs: dict = None,
+        telemetry: Optional[FetchTelemetry] = None,
     ):
         """Callbacks base class for assets.
 
@@ -232,6 +236,7 @@ class Base:
             store: store tracker of get method that created this callback
             state: state tracker of get method that created this callback
             getargs: kwargs passed to assets get method that created this callback
+            telemetry: page telemetry collector of get method that created this callback
         """
         self.LOG: logging.Logger = apiobj.LOG.getChild(self.__class__.__name__)
         """logger for this object."""
@@ -242,6 +247,7 @@ class Base:
         self.STORE: dict = store or {}
         self.CURRENT_ROWS: List[dict] = []
         self.GETARGS: dict = getargs or {}
+        self.TELEMETRY: FetchTelemetry = telemetry or FetchTelemetry()
         self.TAG_ROWS_ADD: List[dict] = []
         self.TAG_ROWS_REMOVE: List[dict] = []
         self.CUSTOM_CB_EXC: List[dict] = []
@@ -304,25 +310,42 @@ class Base:
         self.do_tagging()
         self.echo(msg=f"Stopping {self}")
 
+    def get_checkpoint(self) -> dict:
+        """Get the position of the export to save in a checkpoint after each page.
+
+        Notes:
+            The rows of this callbacks object are only returned to the caller, so there is no
+            export position to resume from.
+        """
+        return {}
+
     def echo_page_progress(self):
-        """Echo progress per N rows using an echo method."""
+        """Echo progress per N rows using an echo method.
+
+        Notes:
+            The total is the count from the metadata of the last page, or the initial count
+            if no page has been processed yet.
+        """
         page_progress = self.get_arg_value("page_progress")
         if not page_progress or not isinstance(page_progress, int):
             return
 
         proc = self.STATE.get("rows_processed_total", 0) or 0
         total = self.STATE.get("rows_to_fetch_total", 0) or 0
+        total = total or self.STATE.get("rows_initial_count", 0) or 0
         taken = self.STATE.get("fetch_seconds_total", 0) or 0
         page_total = self.STATE.get("pages_to_fetch_total", 0) or 0
         page_num = self.STATE.get("page_number", 0) or 0
 
-        if not ((proc % page_progress == 0) or (proc >= total) or (proc <= 1)):
+        if not ((proc % page_progress == 0) or (total and proc >= total) or (proc <= 1)):
             return
 
+        # the total is not known until a count or the metadata of a page has been received
         percent = calc_percent(part=proc, whole=total)
-        percent = f"{percent:.2f}%"
+        percent = f"{percent:.2f}%" if total else "?"
         percent = f"{percent:>7}"
 
+        total = total or "?"
         total_len = len(str(total))
         rows = f"[ROWS: {proc:>{total_len}} / {total}]"
 
@@ -379,6 +402,187 @@ class Base:
             self.do_change_field_replace,
         ]
 
+    @property
+    def callbacks_compiled(self) -> list:
+        """Get order of callbacks to run, with :attr:`CALLBACKS_COMPILED` fused into one.
+
+        Notes:
+            If a subclass overrides any of the callbacks in :attr:`CALLBACKS_COMPILED` or the
+            methods they use, the callbacks from :attr:`callbacks` are returned as is.
+        """
+        if hasattr(self, "_callbacks_compiled"):
+            return self._callbacks_compiled
+
+        callbacks = self.callbacks
+        compiled = [getattr(self, x) for x in self.CALLBACKS_COMPILED]
+        count = len(compiled)
+        overridden = [
+            x
+            for x in self.CALLBACKS_COMPILED + self.CALLBACKS_COMPILED_USES
+            if getattr(type(self), x) is not getattr(Base, x)
+        ]
+
+        if overridden or callbacks[-count:] != compiled:
+            self.LOG.debug(f"Not compiling callbacks, overridden methods: {overridden}")
+            self._callbacks_compiled = callbacks
+        else:
+            self._callbacks_compiled = callbacks[:-count] + [self.do_row_transform]
+        return self._callbacks_compiled
+
+    def do_row_transform(self, rows: Union[List[dict], dict]) -> List[dict]:
+        """Execute the callbacks in :attr:`CALLBACKS_COMPILED` as one transform.
+
+        Args:
+            rows: rows to process
+        """
+        if not hasattr(self, "_row_transform"):
+            self._row_transform = self.compile_row_transform()
+        return self._row_transform(listify(rows))
+
+    def compile_row_transform(self) -> t.Callable[[List[dict]], List[dict]]:
+        """Compile the callbacks in :attr:`CALLBACKS_COMPILED` into a single transform.
+
+        Notes:
+            The arguments and schemas used by each callback are resolved once, instead of
+            for every row and every field of every row. The rows returned by the transform
+            are the same as the rows returned by running each callback in turn.
+
+            The selected schemas are based on the keys of the first row, so this must be
+            called after :meth:`do_pre_row` has processed the first row.
+        """
+        null_value = self.get_arg_value("field_null_value")
+        complex_null_value = self.get_arg_value("field_null_value_complex")
+
+        excludes = []
+        if self.get_arg_value("field_excludes"):
+            for schema in self.schemas_selected:
+                field = schema["name_qual"]
+                if self.is_excluded(schema=schema):
+                    excludes.append((field, None))
+                elif schema["is_complex"]:
+                    subs = [x["name"] for x in schema["sub_fields"] if self.is_excluded(schema=x)]
+                    if subs:
+                        excludes.append((field, subs))
+
+        def get_nulls(schemas, key):
+            nulls = []
+            for schema in schemas:
+                if self.is_excluded(schema=schema) or schema.get("is_details", False):
+                    continue
+                if schema["is_complex"]:
+                    subs = get_nulls(schemas=self.get_sub_schemas(schema=schema), key="name")
+                    nulls.append((schema[key], complex_null_value, subs))
+                else:
+                    nulls.append((schema[key], null_value, None))
+            return nulls
+
+        nulls = []
+        if self.get_arg_value("field_null"):
+            nulls = get_nulls(schemas=self.schemas_selected, key="name_qual")
+
+        flattens = []
+        if self.get_arg_value("field_flatten"):
+            for schema in self.schemas_selected:
+                if self.schema_to_explode == schema or schema.get("is_details", False):
+                    continue
+                if self.is_excluded(schema=schema) or not schema["is_complex"]:
+                    continue
+                subs = [(x["name_qual"], x["name"]) for x in self.get_sub_schemas(schema=schema)]
+                flattens.append((schema["name_qual"], subs))
+
+        explode_entities = self.get_arg_value("explode_entities")
+        explode_field = self.get_arg_value("field_explode") and not self.is_excluded(
+            schema=self.schema_to_explode
+        )
+
+        join = self.get_arg_value("field_join")
+        joiner = str(self.get_arg_value("field_join_value"))
+        trim_len = coerce_int(self.get_arg_value("field_join_trim"))
+        trim_str = FIELD_TRIM_STR
+
+        titles = []
+        if self.get_arg_value("field_titles"):
+            for schema in self.final_schemas:
+                default = complex_null_value if schema["is_complex"] else null_value
+                titles.append((schema["column_title"], schema["name_qual"], default))
+
+        compress = self.get_arg_value("field_compress")
+        compress_keys = {}
+        replace = bool(self.field_replacements)
+        replace_keys = {}
+
+        def add_nulls(row, nulls):
+            for field, value, subs in nulls:
+                if field not in row:
+                    row[field] = value
+                if subs is not None:
+                    for item in row[field]:
+                        add_nulls(row=item, nulls=subs)
+
+        def transform_field(row):
+            for field, subs in flattens:
+                items = listify(row.pop(field, []))
+                for sub_field, sub_short in subs:
+                    row[sub_field] = values = []
+                    for item in items:
+                        value = item.pop(sub_short, null_value)
+                        if isinstance(value, list):
+                            values += value
+                        else:
+                            values.append(value)
+
+            return self._do_explode_field(row=row) if explode_field else [row]
+
+        def transform_value(row):
+            if join:
+                for field in row:
+                    value = row[field]
+                    if isinstance(value, list):
+                        row[field] = value = joiner.join([str(x) for x in value])
+
+                    if trim_len and isinstance(value, str) and len(value) >= trim_len:
+                        msg = trim_str.format(field_len=len(value), trim_len=trim_len)
+                        row[field] = joiner.join([value[:trim_len], msg])
+
+            for title, name, default in titles:
+                row[title] = row.pop(name, default)
+
+            if compress:
+                for key in row:
+                    if key not in compress_keys:
+                        compress_keys[key] = self._field_compress(key=key)
+                row = {compress_keys[k]: v for k, v in row.items()}
+
+            if replace:
+                for key in row:
+                    if key not in replace_keys:
+                        replace_keys[key] = self._field_replace(key=key)
+                row = {replace_keys[k]: v for k, v in row.items()}
+            return row
+
+        def transform(rows: List[dict]) -> List[dict]:
+            new_rows = []
+            for row in rows:
+                for field, subs in excludes:
+                    if subs is None:
+                        row.pop(field, None)
+                        continue
+                    items = listify(row.get(field, []))
+                    for sub_field in subs:
+                        for item in items:
+                            if sub_field in item:
+                                item.pop(sub_field)
+
+                add_nulls(row=row, nulls=nulls)
+
+                entities = self._do_explode_entities(row=row) if explode_entities else [row]
+                for entity in entities:
+                    for new_row in transform_field(row=entity):
+                        new_rows.append(transform_value(row=new_row))
+            return new_rows
+
+        return transform
+
     def do_row(self, rows: Union[List[dict], dict]) -> List[dict]:
         """Execute the callbacks for current row.
 
@@ -392,7 +596,10 @@ class Base:
         if debug_timing:  # pragma: no cover
             p_start = dt_now()
 
-        for cb in self.callbacks:
+        # per callback timing needs each callback to run on its own
+        callbacks = self.callbacks if debug_timing else self.callbacks_compiled
+
+        for cb in callbacks:
             if debug_timing:  # pragma: no cover
                 cb_start = dt_now()
 
@@ -1257,6 +1464,9 @@ class Base:
     CB_NAME: str = "base"
     """name for this callback"""
 
+    RESUMABLE: bool = True
+    """this callback can resume a get of assets from a checkpoint, see :meth:`get_checkpoint`"""
+
     FIND_KEYS: List[str] = ["name", "name_qual", "column_title"]
     """field schema keys to use when finding a fields schema"""
 
@@ -1287,11 +1497,36 @@ class Base:
     CUSTOM_CB_EXC: List[dict] = None
     """tracker of custom callbacks that have been executed by :meth:`do_custom_cbs`"""
 
+    CALLBACKS_COMPILED: List[str] = [
+        "do_excludes",
+        "do_add_null_values",
+        "do_explode_entities",
+        "do_flatten_fields",
+        "do_explode_field",
+        "do_join_values",
+        "do_change_field_titles",
+        "do_change_field_compress",
+        "do_change_field_replace",
+    ]
+    """callbacks fused into one by :meth:`compile_row_transform`, must be last in callbacks"""
+
+    CALLBACKS_COMPILED_USES: List[str] = [
+        "_do_excludes",
+        "_do_add_null_values",
+        "_do_flatten_fields",
+        "_do_join_values",
+        "_do_change_field_titles",
+    ]
+    """methods used by :attr:`CALLBACKS_COMPILED` that :meth:`compile_row_transform` inlines"""
+
 
 # noinspection PyAttributeOutsideInit
 class ExportMixins(Base):
     """Export mixins for callbacks."""
 
+    RESUMABLE: bool = False
+    """this callback can resume a get of assets from a checkpoint, see :meth:`get_checkpoint`"""
+
     @classmethod
     def args_map_export(cls) -> dict:
         """Get the export argument names and their defaults for this callbacks object.
@@ -1338,6 +1573,9 @@ class ExportMixins(Base):
 
     def open_fd_path(self) -> IO:
         """Open a file descriptor for a path."""
+        if self.resume_checkpoint.get("export_file"):
+            return self.open_fd_resume()
+
         export_fd_close = self.arg_export_fd_close
         export_backup = self.arg_export_backup
         export_overwrite = self.arg_export_overwrite
@@ -1378,6 +1616,47 @@ class ExportMixins(Base):
         self._fd: IO = self._file_path.open(mode="w", encoding="utf-8")
         return self._fd
 
+    def open_fd_resume(self) -> IO:
+        """Open the file descriptor of the path from a checkpoint to append to it."""
+        resume = self.resume_checkpoint
+        position = resume.get("export_position") or 0
+
+        self._file_path: pathlib.Path = get_path(resume["export_file"])
+        self._file_path_backup: Optional[pathlib.Path] = None
+        self._fd_close: bool = self.arg_export_fd_close
+        self._file_mode: str = f"Resumed existing file at position {position}"
+
+        size = self._file_path.stat().st_size if self._file_path.is_file() else -1
+        if size < position:
+            msg = (
+                f"Export file {str(self._file_path)!r} is missing or smaller than the "
+                f"position {position} in the checkpoint, unable to resume!"
+            )
+            self.echo(msg=msg, error=ApiError, level="error")
+
+        self._fd_info: str = f"file {str(self._file_path)!r} ({self._file_mode})"
+        self.echo(msg=f"Exporting to {self._fd_info}")
+
+        self._fd: IO = self._file_path.open(mode="r+", encoding="utf-8")
+        self._fd.seek(position)
+        self._fd.truncate()
+        return self._fd
+
+    def get_checkpoint(self) -> dict:
+        """Get the position of the export to save in a checkpoint after each page."""
+        fd = getattr(self, "_fd", None)
+        path = getattr(self, "_file_path", None)
+        if fd is None or path is None or fd.closed:
+            return {}
+
+        fd.flush()
+        return {"export_file": str(path), "export_position": fd.tell()}
+
+    @property
+    def resume_checkpoint(self) -> dict:
+        """Export position of the checkpoint being resumed, from :meth:`get_checkpoint`."""
+        return self.STORE.get("resume_export") or {}
+
     def open_fd_stdout(self) -> IO:
         """Open a file descriptor to STDOUT."""
         self._fd_close: bool = False
@@ -1461,10 +1740,12 @@ ARG_DESCRIPTIONS: dict = {
     "do_echo": "Echo messages to console",
     "custom_cbs": "Custom callbacks to perform on assets",
     "json_flat": "For JSON Export: Use JSONL format",
+    "json_fast": "For JSON Export: Use the fastest installed JSON backend",
     "csv_key_miss": "For CSV Export: Value to use when keys are missing",
     "csv_key_extras": "For CSV Export: What to do with extra CSV columns",
     "csv_dialect": "For CSV Export: CSV Dialect to use",
     "csv_quoting": "For CSV Export: CSV quoting style",
+    "csv_spill": "For JSON to CSV Export: Spill rows to a temp file to find all columns",
     "csv_field_flatten": "For CSV/XLSX Export: Enable flattening of complex fields",
     "csv_field_join": "For CSV/XLSX Export: Enable joining of list fields",
     "csv_field_null": "For CSV/XLSX Export: Enable null values for missing fields",
@@ -1478,8 +1759,14 @@ ARG_DESCRIPTIONS: dict = {
     "table_format": "For Table export: Table format to use",
     "table_max_rows": "For Table export: Maximum rows to output",
     "table_api_fields": "For Table export: Include API fields in output",
+    "table_stream": "For Table export: Write rows as they are fetched",
+    "table_stream_sample": "For Table export: Rows to sample for column widths when streaming",
+    "table_stream_width": "For Table export: Maximum column width when streaming",
+    "table_stream_header_every": "For Table export: Repeat the header every N rows when streaming",
     "xlsx_column_length": "For XLSX export: Length to use for every column",
     "xlsx_cell_format": "For XLSX Export: Formatting to apply to every cell",
+    "parquet_batch_size": "For Parquet/Arrow Export: Rows to write in each record batch",
+    "parquet_compression": "For Parquet Export: Compression codec to use",
     "debug_timing": "Enable logging of time taken for each callback",
     "explode_entities": "Split rows into one row for each asset entity",
     "include_dates": "Include history date and current date as a columns in the output",
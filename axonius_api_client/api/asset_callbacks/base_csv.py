@@ -140,6 +140,20 @@ class Csv(ExportMixins):
 
         quote = getattr(csv, f"QUOTE_{quote.upper()}")
 
+        resume_columns = self.resume_checkpoint.get("export_columns")
+        if resume_columns:
+            # the header and schema rows were written before the checkpoint was saved
+            self._stream = csv.DictWriter(
+                self._fd,
+                fieldnames=resume_columns,
+                quoting=quote,
+                lineterminator="\n",
+                restval=restval,
+                dialect=dialect,
+                extrasaction=extras,
+            )
+            return
+
         try:
             self._fd.write(codecs.BOM_UTF8.decode("utf-8"))
         except Exception:  # pragma: no cover
@@ -168,6 +182,14 @@ class Csv(ExportMixins):
         self._fd.write("\n")
         self.close_fd()
 
+    def get_checkpoint(self) -> dict:
+        """Get the position and columns of the export to save in a checkpoint after each page."""
+        checkpoint = super(Csv, self).get_checkpoint()
+        stream = getattr(self, "_stream", None)
+        if checkpoint and stream:
+            checkpoint["export_columns"] = list(stream.fieldnames)
+        return checkpoint
+
     def write_rows(self, rows: Union[List[dict], dict]):
         """Write rows to the file descriptor.
 
@@ -191,7 +213,8 @@ class Csv(ExportMixins):
         row_return = [{"internal_axon_id": row["internal_axon_id"]} for row in rows]
         rows = self.do_pre_row(rows=rows)
         rows = self.do_row(rows=rows)
-        self.write_rows(rows=rows)
+        with self.TELEMETRY.timer("write_seconds"):
+            self.write_rows(rows=rows)
         del rows, row
         return row_return
 
@@ -213,3 +236,6 @@ class Csv(ExportMixins):
 
     CB_NAME: str = "csv"
     """name for this callback"""
+
+    RESUMABLE: bool = True
+    """this callback can resume a get of assets from a checkpoint, see :meth:`get_checkpoint`"""
@@ -1,9 +1,11 @@
 # -*- coding: utf-8 -*-
 """JSON export callbacks."""
+import functools
 import json
 import textwrap
 from typing import List, Union
 
+from ... import json_backend
 from ...tools import listify
 from .base import ExportMixins
 
@@ -55,6 +57,11 @@ class Json(ExportMixins):
 
             >>> assets = apiobj.get(export="json", export_file="test.json", json_flat=True)
 
+            Serialize each asset using the fastest installed JSON backend (i.e. orjson) instead
+            of the standard library.
+
+            >>> assets = apiobj.get(export="json", export_file="test.json", json_fast=True)
+
         See Also:
             * :meth:`args_map` for callback generic arguments to format assets.
 
@@ -63,10 +70,13 @@ class Json(ExportMixins):
             :meth:`axonius_api_client.api.assets.users.Users.get` or
             :meth:`axonius_api_client.api.assets.devices.Devices.get`
 
+            With ``json_fast``, the output is equivalent JSON but not byte for byte identical
+            to the standard library output, see :mod:`axonius_api_client.json_backend`.
+
         """
         args = {}
         args.update(cls.args_map_export())
-        args.update({"json_flat": False})
+        args.update({"json_flat": False, "json_fast": False})
         return args
 
     def start(self, **kwargs):
@@ -74,8 +84,18 @@ class Json(ExportMixins):
         super(Json, self).start(**kwargs)
         flat = self.get_arg_value("json_flat")
 
+        indent = None if flat else 2
+        if self.get_arg_value("json_fast"):
+            self._dumps = json_backend.get_dumps(indent=indent)
+        else:
+            self._dumps = functools.partial(json.dumps, indent=indent)
+
         self._first_row = True
         self.open_fd()
+        if self.resume_checkpoint.get("export_file"):
+            # the beginning and the rows up to the checkpoint were written before
+            self._first_row = self.resume_checkpoint.get("export_first_row", False)
+            return
         begin = "" if flat else "["
         self._fd.write(begin)
 
@@ -99,10 +119,18 @@ class Json(ExportMixins):
         rows = self.do_pre_row(rows=rows)
         row_return = [{"internal_axon_id": row["internal_axon_id"]} for row in rows]
         rows = self.do_row(rows=rows)
-        self.write_rows(rows=rows)
+        with self.TELEMETRY.timer("write_seconds"):
+            self.write_rows(rows=rows)
         del rows, row
         return row_return
 
+    def get_checkpoint(self) -> dict:
+        """Get the position of the export to save in a checkpoint after each page."""
+        checkpoint = super(Json, self).get_checkpoint()
+        if checkpoint:
+            checkpoint["export_first_row"] = self._first_row
+        return checkpoint
+
     def write_rows(self, rows: Union[List[dict], dict]):
         """Write rows to the file descriptor.
 
@@ -124,7 +152,7 @@ class Json(ExportMixins):
             self._first_row = False
             self._fd.write(pre)
 
-            value = json.dumps(row, indent=indent)
+            value = self._dumps(row)
             value = textwrap.indent(value, prefix=prefix) if indent else value
             self._fd.write(value)
             del value, row
@@ -140,3 +168,6 @@ class Json(ExportMixins):
 
     CB_NAME: str = "json"
     """name for this callback"""
+
+    RESUMABLE: bool = True
+    """this callback can resume a get of assets from a checkpoint, see :meth:`get_checkpoint`"""
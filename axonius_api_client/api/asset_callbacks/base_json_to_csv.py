@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 """JSON to CSV export callbacks."""
-import json
+import pickle
 import tempfile
 from typing import List, Union
 
@@ -9,7 +9,7 @@ from .base_csv import Csv
 
 
 class JsonToCsv(Csv):
-    """Callbacks for formatting asset data and exporting it in CSV format using a temp JSON file.
+    """Callbacks for formatting asset data and exporting it in CSV format with every column.
 
     Examples:
         Create a ``client`` using :obj:`axonius_api_client.connect.Connect` and assume
@@ -89,10 +89,27 @@ class JsonToCsv(Csv):
             ...     export="json_to_csv", export_file="test.csv", csv_quoting='all'
             ... )
 
+            Always spill processed rows to a temporary file so that columns that are not known
+            until every row has been processed are included in the header.
+
+            >>> assets = apiobj.get(
+            ...     export="json_to_csv", export_file="test.csv", csv_spill=True
+            ... )
+
         See Also:
             * :meth:`args_map` for callback generic arguments to format assets.
 
         Notes:
+            The columns are determined from :attr:`final_schemas` once the first row has been
+            processed, and each row is written as soon as it is processed.
+
+            If ``csv_spill`` is True, or if ``csv_spill`` is None and the columns can not be
+            determined from the field schemas (custom callbacks are supplied or a selected field
+            has no schema), each processed row is instead spilled to a temporary file in pickle
+            format and any columns that are not in :attr:`final_schemas` are added to the
+            header. The rows are then copied from the temporary file to the CSV in
+            :meth:`stop`, without being processed again.
+
             This callbacks object forces the following arguments to True in order to make the
             output usable in the exported format: ``field_null``, ``field_flatten``,
             and ``field_join``
@@ -114,6 +131,7 @@ class JsonToCsv(Csv):
                 "csv_key_extras": "ignore",
                 "csv_dialect": "excel",
                 "csv_quoting": "nonnumeric",
+                "csv_spill": None,
             }
         )
         return args
@@ -122,27 +140,29 @@ class JsonToCsv(Csv):
         """Start this callbacks object."""
         super(Csv, self).start(**kwargs)
         self.open_fd()
-        self._temp_file = tempfile.NamedTemporaryFile(mode="w+", encoding="utf-8")
-        self.echo(msg=f"Writing JSON to temporary file {self._temp_file.name!r}")
+        self._spill_file = None
+        self._spill_rows: List[dict] = []
+        self._columns_extra: List[str] = []
 
     def stop(self, **kwargs):
         """Stop this callbacks object."""
-        self.STATE["rows_processed_total"] = 0
         self.do_start(**kwargs)
 
-        self.echo(msg="Re-reading temporary file and converting to CSV")
-        self._temp_file.file.seek(0)
-
-        for line in self._temp_file.file.readlines():
-            row = json.loads(line.strip())
-            rows = listify(row)
-            rows = self.do_pre_row(rows=rows)
-            rows = self.do_row(rows=rows)
-            self.write_rows(rows=rows)
-            del rows, row, line
-
-        self.echo(msg=f"Closing and deleting temporary file {self._temp_file.name!r}")
-        self._temp_file.file.close()
+        if self._spill_file:
+            self.spill_rows(rows=[], flush=True)
+            self.echo(msg="Copying rows from temporary file to CSV")
+            self._spill_file.seek(0)
+
+            while True:
+                try:
+                    rows = pickle.load(self._spill_file)
+                except EOFError:
+                    break
+                self.write_rows(rows=rows)
+                del rows
+
+            self.echo(msg="Closing and deleting temporary file")
+            self._spill_file.close()
         super(JsonToCsv, self).stop(**kwargs)
 
     def process_row(self, row: Union[List[dict], dict]) -> List[dict]:
@@ -155,12 +175,71 @@ class JsonToCsv(Csv):
 
         row_return = [{"internal_axon_id": row["internal_axon_id"]} for row in rows]
         rows = self.do_pre_row(rows=rows)
-        for row in rows:
-            value = json.dumps(row)
-            self._temp_file.file.write(f"{value}\n")
-            del row, value
+
+        if self._spill_file is None and not getattr(self, "_stream", None):
+            if self.check_spill():
+                self._spill_file = tempfile.TemporaryFile(mode="w+b")
+                self.echo(msg="Spilling rows to temporary file to find all columns")
+            else:
+                self.do_start()
+
+        rows = self.do_row(rows=rows)
+        with self.TELEMETRY.timer("write_seconds"):
+            if self._spill_file:
+                self.spill_rows(rows=rows)
+            else:
+                self.write_rows(rows=rows)
+        del rows
 
         return row_return
 
+    def check_spill(self) -> bool:
+        """Check if rows need to be spilled to a temporary file to find all columns."""
+        spill = self.get_arg_value("csv_spill")
+        if spill is not None:
+            return bool(spill)
+
+        if listify(self.get_arg_value("custom_cbs")):
+            return True
+
+        names = [x.get(key) for x in self.schemas_selected for key in self.FIND_KEYS]
+        unknown = [x for x in self.fields_selected if x not in names]
+        if unknown:
+            self.LOG.debug(f"Fields with no schema: {unknown}")
+        return bool(unknown)
+
+    def spill_rows(self, rows: List[dict], flush: bool = False):
+        """Add processed rows to the temporary file and track columns not in the schemas.
+
+        Args:
+            rows: rows to add
+            flush: write any rows being held to the temporary file
+        """
+        if not hasattr(self, "_columns_seen"):
+            self._columns_seen = set(self.final_columns)
+
+        for row in rows:
+            for column in row:
+                if column not in self._columns_seen:
+                    self._columns_seen.add(column)
+                    self._columns_extra.append(column)
+
+        self._spill_rows += rows
+        if self._spill_rows and (flush or len(self._spill_rows) >= self.SPILL_ROWS):
+            pickle.dump(self._spill_rows, self._spill_file, protocol=pickle.HIGHEST_PROTOCOL)
+            self._spill_rows = []
+
+    @property
+    def final_columns(self) -> List[str]:
+        """Get the columns that will be returned, including columns found in spilled rows."""
+        columns = super(JsonToCsv, self).final_columns
+        return columns + getattr(self, "_columns_extra", [])
+
     CB_NAME: str = "json_to_csv"
     """name for this callback"""
+
+    RESUMABLE: bool = False
+    """this callback can resume a get of assets from a checkpoint, see :meth:`get_checkpoint`"""
+
+    SPILL_ROWS: int = 1000
+    """number of rows to pickle at a time to the temporary file"""
@@ -0,0 +1,412 @@
+# -*- coding: utf-8 -*-
+"""Apache Parquet and Arrow export callbacks."""
+from typing import Any, Callable, List, Optional, Union
+
+from ...exceptions import ApiError
+from ...tools import coerce_bool, json_dump, listify
+from .base import ExportMixins
+
+
+class Parquet(ExportMixins):
+    """Callbacks for formatting asset data and exporting it in Apache Parquet format.
+
+    Examples:
+        Create a ``client`` using :obj:`axonius_api_client.connect.Connect` and assume
+        ``apiobj`` is either ``client.devices`` or ``client.users``
+
+        >>> apiobj = client.devices  # or client.users
+
+        * :meth:`args_map` for callback generic arguments to format assets.
+        * :meth:`args_map_custom` for callback specific arguments to format and export data.
+
+    """
+
+    @classmethod
+    def args_map_custom(cls) -> dict:
+        """Get the custom argument names and their defaults for this callbacks object.
+
+        Examples:
+            Export the output to a file in the default path
+            :attr:`axonius_api_client.setup_env.DEFAULT_PATH`.
+
+            >>> assets = apiobj.get(export="parquet", export_file="test.parquet")
+
+            Export the output to an absolute path file (ignoring ``export_path``) and overwrite
+            the file if it exists.
+
+            >>> assets = apiobj.get(
+            ...     export="parquet",
+            ...     export_file="/tmp/output.parquet",
+            ...     export_overwrite=True,
+            ... )
+
+            Write a row group for every 50,000 rows and compress with zstd.
+
+            >>> assets = apiobj.get(
+            ...     export="parquet",
+            ...     export_file="test.parquet",
+            ...     parquet_batch_size=50000,
+            ...     parquet_compression="zstd",
+            ... )
+
+            Add the name, title, and type of each field to the metadata of each column.
+
+            >>> assets = apiobj.get(
+            ...     export="parquet", export_file="test.parquet", export_schema=True
+            ... )
+
+        See Also:
+            * :meth:`args_map` for callback generic arguments to format assets.
+
+        Notes:
+            Requires the ``pyarrow`` package to be installed.
+
+            If ``export_file`` does not end with ``.parquet``, it will be appended to the filename.
+
+            The type of each column is derived from the schema of each field in
+            :attr:`final_schemas`: integer, number, and boolean fields are typed as such,
+            array fields are typed as lists, complex fields that are not flattened are
+            serialized as JSON strings, and all other fields are strings. Values that do not
+            match the type of their column are converted to it, or set to null if they
+            can not be converted.
+
+            Rows are buffered into record batches of ``parquet_batch_size`` rows and each
+            batch is written as a row group, so memory used is bounded by the batch size.
+
+            The columns of the file are fixed by the first batch, values in columns that first
+            appear in later batches are dropped and a warning with their counts is echoed.
+
+            This callbacks object forces the following arguments to True in order to make the
+            output usable in the exported format: ``field_null`` and ``field_flatten``.
+
+            These arguments can be supplied as extra kwargs passed to
+            :meth:`axonius_api_client.api.assets.users.Users.get` or
+            :meth:`axonius_api_client.api.assets.devices.Devices.get`
+
+        """
+        args = {}
+        args.update(cls.args_map_export())
+        args.update(
+            {
+                "field_titles": True,
+                "field_flatten": True,
+                "field_join": False,
+                "field_null": True,
+                "parquet_batch_size": 10000,
+                "parquet_compression": "snappy",
+            }
+        )
+        return args
+
+    def _init(self, **kwargs):
+        """Override defaults to make export readable."""
+        self.set_arg_value("field_null", self.get_arg_value("csv_field_null"))
+        self.set_arg_value("field_flatten", self.get_arg_value("csv_field_flatten"))
+
+    def start(self, **kwargs):
+        """Start this callbacks object."""
+        super(Parquet, self).start(**kwargs)
+        self.do_start(**kwargs)
+
+    def do_start(self, **kwargs):
+        """Start this callbacks object."""
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            self.echo(
+                msg=f"Must install 'pyarrow' for this export method ({self.CB_NAME})",
+                error=ApiError,
+                level="error",
+            )
+
+        export_file = self.get_arg_value("export_file")
+        if export_file:
+            if not str(export_file).endswith(self.FILE_EXT):
+                self.set_arg_value("export_file", f"{export_file}{self.FILE_EXT}")
+            self.open_fd_path()
+            self._fd.close()
+        else:
+            self.echo(
+                msg="Must supply export_file for this export method", error=ApiError, level="error"
+            )
+
+        batch_size = self.get_arg_value("parquet_batch_size")
+        if not isinstance(batch_size, int) or batch_size < 1:
+            self.echo(
+                msg=f"parquet_batch_size must be an integer above 0, not {batch_size!r}",
+                error=ApiError,
+                level="error",
+            )
+
+        self._batch_size: int = batch_size
+        self._batch: List[dict] = []
+        self._writer: Any = None
+        self._schema: Any = None
+        self._coercers: List[Callable] = []
+        self._coerced: dict = {}
+        self._dropped: dict = {}
+        self._rowtracker: int = 0
+
+    def stop(self, **kwargs):
+        """Stop this callbacks object."""
+        super(Parquet, self).stop(**kwargs)
+        self.do_stop(**kwargs)
+
+    def do_stop(self, **kwargs):
+        """Write the rows left in the batch and close the writer."""
+        self.write_batch()
+        if self._writer is None:
+            self._writer = self.open_writer(schema=self.get_arrow_schema())
+        self._writer.close()
+
+        for column, count in self._coerced.items():
+            if count:
+                msg = f"Set {count} values that could not be converted to null in {column!r}"
+                self.echo(msg=msg, warning=True)
+        for column, count in self._dropped.items():
+            msg = (
+                f"Dropped values from {count} rows in {column!r}, a column that was not in the "
+                f"first batch of {self._batch_size} rows"
+            )
+            self.echo(msg=msg, warning=True)
+        self.echo(msg=f"Finished exporting {self._rowtracker} rows to {self._fd_info}")
+
+    def process_row(self, row: Union[List[dict], dict]) -> List[dict]:
+        """Process the callbacks for current row.
+
+        Args:
+            row: row to process
+        """
+        rows = listify(row)
+
+        row_return = [{"internal_axon_id": row["internal_axon_id"]} for row in rows]
+        rows = self.do_pre_row(rows=rows)
+        rows = self.do_row(rows=rows)
+        with self.TELEMETRY.timer("write_seconds"):
+            self.write_rows(rows=rows)
+        del rows, row
+        return row_return
+
+    def write_rows(self, rows: Union[List[dict], dict]):
+        """Add rows to the current batch and write the batch if it is full.
+
+        Args:
+            rows: rows to process
+        """
+        self._batch += listify(rows)
+        if len(self._batch) >= self._batch_size:
+            self.write_batch()
+
+    def write_batch(self):
+        """Write the rows in the current batch as a record batch."""
+        if not self._batch:
+            return
+
+        import pyarrow
+
+        if self._writer is None:
+            self._schema = self.get_arrow_schema()
+            self._coercers = [self.get_coercer(arrow_type=x.type) for x in self._schema]
+            self._writer = self.open_writer(schema=self._schema)
+
+        rows, self._batch = self._batch, []
+        self.check_dropped(rows=rows)
+        arrays = []
+        for field, coercer in zip(self._schema, self._coercers):
+            values = [row.get(field.name) for row in rows]
+            try:
+                array = pyarrow.array(values, type=field.type)
+            except (pyarrow.ArrowException, TypeError, ValueError, OverflowError):
+                coerced = [coercer(x) for x in values]
+                self._coerced[field.name] = self._coerced.get(field.name, 0) + sum(
+                    x is not None and y is None for x, y in zip(values, coerced)
+                )
+                array = pyarrow.array(coerced, type=field.type)
+            arrays.append(array)
+
+        batch = pyarrow.RecordBatch.from_arrays(arrays, schema=self._schema)
+        self._writer.write_batch(batch)
+        self._rowtracker += len(rows)
+        self.LOG.debug(f"Wrote record batch of {len(rows)} rows ({self._rowtracker} total)")
+
+    def check_dropped(self, rows: List[dict]):
+        """Count the rows with columns that are not in the schema of the file.
+
+        Args:
+            rows: rows about to be written
+        """
+        names = set(self._schema.names)
+        for row in rows:
+            for column in row.keys() - names:
+                self._dropped[column] = self._dropped.get(column, 0) + 1
+
+    def open_writer(self, schema: Any) -> Any:
+        """Open a Parquet writer for the export file.
+
+        Args:
+            schema (:obj:`pyarrow.Schema`): schema of the columns to write
+        """
+        import pyarrow.parquet
+
+        compression = self.get_arg_value("parquet_compression")
+        return pyarrow.parquet.ParquetWriter(
+            str(self._file_path), schema=schema, compression=compression
+        )
+
+    def get_arrow_schema(self) -> Any:
+        """Get the schema of the columns to write from :attr:`final_schemas`.
+
+        Notes:
+            Columns in the first batch that are not in :attr:`final_columns` are added as
+            string columns, columns that first appear after the first batch are dropped and
+            a warning with the number of rows dropped from each is echoed once finished.
+        """
+        import pyarrow
+
+        export_schema = self.get_arg_value("export_schema")
+        fields = []
+        for column, schema in zip(self.final_columns, self.final_schemas):
+            metadata = None
+            if export_schema:
+                metadata = {
+                    "name_qual": schema["name_qual"],
+                    "column_title": schema["column_title"],
+                    "type_norm": schema.get("type_norm", ""),
+                }
+            fields.append(
+                pyarrow.field(column, self.get_arrow_type(schema=schema), metadata=metadata)
+            )
+
+        columns = list(self.final_columns)
+        for row in self._batch:
+            for column in row:
+                if column not in columns:
+                    columns.append(column)
+                    fields.append(pyarrow.field(column, pyarrow.string()))
+        return pyarrow.schema(fields)
+
+    def get_arrow_type(self, schema: dict) -> Any:
+        """Get the arrow type of the column for a field schema.
+
+        Args:
+            schema: field schema from :attr:`final_schemas`
+        """
+        import pyarrow
+
+        def get_scalar(field_type: Optional[str]):
+            return getattr(pyarrow, self.ARROW_TYPES.get(field_type, "string"))()
+
+        is_list = schema.get("type") == "array"
+        items_type = (schema.get("items") or {}).get("type")
+        field_type = items_type if is_list else schema.get("type")
+
+        if schema.get("is_complex") or (is_list and items_type == "array"):
+            return pyarrow.string()
+
+        arrow_type = get_scalar(field_type=field_type)
+
+        parent = schema.get("parent", "root")
+        explode = self.schema_to_explode.get("name_qual", "")
+        # sub fields of flattened complex fields are lists of values from each item
+        is_flat = parent not in ["root", explode] and self.get_arg_value("field_flatten")
+        if is_list or is_flat:
+            arrow_type = pyarrow.list_(arrow_type)
+        return arrow_type
+
+    def get_coercer(self, arrow_type: Any) -> Callable:
+        """Get a function that converts a value to an arrow type or None.
+
+        Args:
+            arrow_type (:obj:`pyarrow.DataType`): type to convert values to
+        """
+        import pyarrow
+
+        def to_str(value):
+            if value is None or isinstance(value, str):
+                return value
+            if isinstance(value, (dict, list, tuple)):
+                return json_dump(obj=value, indent=None)
+            return str(value)
+
+        def to_int(value):
+            try:
+                return None if isinstance(value, bool) else int(value)
+            except Exception:
+                return None
+
+        def to_float(value):
+            try:
+                return float(value)
+            except Exception:
+                return None
+
+        def to_bool(value):
+            try:
+                return coerce_bool(obj=value)
+            except Exception:
+                return None
+
+        def get_scalar(value_type):
+            if pyarrow.types.is_integer(value_type):
+                return to_int
+            if pyarrow.types.is_floating(value_type):
+                return to_float
+            if pyarrow.types.is_boolean(value_type):
+                return to_bool
+            return to_str
+
+        if pyarrow.types.is_list(arrow_type):
+            item = get_scalar(value_type=arrow_type.value_type)
+
+            def to_list(value):
+                return None if value is None else [item(x) for x in listify(value)]
+
+            return to_list
+        return get_scalar(value_type=arrow_type)
+
+    CB_NAME: str = "parquet"
+    """name for this callback"""
+
+    ARROW_TYPES: dict = {"integer": "int64", "number": "float64", "bool": "bool_"}
+    """map of field schema types to pyarrow type functions, all others are strings"""
+
+    FILE_EXT: str = ".parquet"
+    """extension to add to export_file if it does not end with it"""
+
+
+class Arrow(Parquet):
+    """Callbacks for formatting asset data and exporting it in Apache Arrow IPC format.
+
+    Examples:
+        Create a ``client`` using :obj:`axonius_api_client.connect.Connect` and assume
+        ``apiobj`` is either ``client.devices`` or ``client.users``
+
+        >>> apiobj = client.devices  # or client.users
+
+        Export the output to an Arrow IPC file, writing a record batch for every 50,000 rows.
+
+        >>> assets = apiobj.get(
+        ...     export="arrow", export_file="test.arrow", parquet_batch_size=50000
+        ... )
+
+        * :meth:`Parquet.args_map_custom` for the arguments to format and export data.
+
+    Notes:
+        ``parquet_compression`` is ignored, record batches are written uncompressed.
+    """
+
+    def open_writer(self, schema: Any) -> Any:
+        """Open an Arrow IPC file writer for the export file.
+
+        Args:
+            schema (:obj:`pyarrow.Schema`): schema of the columns to write
+        """
+        import pyarrow
+
+        return pyarrow.ipc.new_file(str(self._file_path), schema=schema)
+
+    CB_NAME: str = "arrow"
+    """name for this callback"""
+
+    FILE_EXT: str = ".arrow"
+    """extension to add to export_file if it does not end with it"""
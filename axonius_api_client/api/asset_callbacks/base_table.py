@@ -1,10 +1,17 @@
 # -*- coding: utf-8 -*-
 """Table export callbacks."""
-from typing import List, Union
+import textwrap
+from typing import Any, List, Optional, Set, Union
 
 import tabulate
 
-from ...constants.api import TABLE_FORMAT, TABLE_MAX_ROWS
+from ...constants.api import (
+    TABLE_FORMAT,
+    TABLE_MAX_ROWS,
+    TABLE_STREAM_HEADER_EVERY,
+    TABLE_STREAM_SAMPLE,
+    TABLE_STREAM_WIDTH,
+)
 from ...exceptions import ApiError, StopFetch
 from ...tools import listify
 from .base import ExportMixins
@@ -76,12 +83,35 @@ class Table(ExportMixins):
             ...     table_api_fields=True,
             ... )
 
+            Write each row as it is fetched instead of after all rows are fetched, wrapping
+            values longer than 80 characters, and repeating the header every 50 rows.
+
+            >>> assets = apiobj.get(
+            ...     export="table",
+            ...     export_file="test.txt",
+            ...     table_stream=True,
+            ...     table_stream_width=80,
+            ...     table_stream_header_every=50,
+            ... )
+
         See Also:
             * :meth:`args_map` for callback generic arguments to format assets.
 
         Notes:
             If ``export_file`` is not supplied, the default is to print the output to STDOUT.
 
+            By default, all rows are held in memory until the fetch is finished, so that the
+            width of each column can be calculated from every row, making ``table_max_rows``
+            the only protection against exhausting memory. If ``table_stream`` is True, the
+            column widths are fixed from the first ``table_stream_sample`` rows and every row
+            after that is written as it is fetched, wrapping values that are wider than their
+            column. Columns that first appear after the sampled rows are not included, and a
+            warning is echoed the first time each of them is seen. ``table_format`` must be a
+            format that does not need the whole table to render, i.e. not html, latex, or pipe.
+
+            Since streaming does not hold rows in memory, ``table_max_rows`` only stops the
+            fetch when streaming if it is supplied, its default is not applied.
+
             This callbacks object forces the following arguments to True in order to make the
             output usable in the exported format: ``field_null``, ``field_flatten``,
             and ``field_join``
@@ -102,6 +132,10 @@ class Table(ExportMixins):
                 "table_format": TABLE_FORMAT,
                 "table_max_rows": TABLE_MAX_ROWS,
                 "table_api_fields": False,
+                "table_stream": False,
+                "table_stream_sample": TABLE_STREAM_SAMPLE,
+                "table_stream_width": TABLE_STREAM_WIDTH,
+                "table_stream_header_every": TABLE_STREAM_HEADER_EVERY,
             }
         )
         return args
@@ -124,11 +158,25 @@ class Table(ExportMixins):
         """Start this callbacks object."""
         super(Table, self).start(**kwargs)
         self._rows = []
+        self._stream_fmt: Optional[tabulate.TableFormat] = None
+        self._stream_columns: Optional[List[str]] = None
+        self._stream_columns_set: Set[str] = set()
+        self._stream_widths: Optional[List[int]] = None
+        self._stream_count: int = 0
+        self._stream_dropped: Set[str] = set()
+
+        if self.get_arg_value("table_stream"):
+            self._stream_fmt = self.get_stream_format()
         self.open_fd()
 
     def stop(self, **kwargs):
         """Stop this callbacks object."""
         super(Table, self).stop(**kwargs)
+        if getattr(self, "_stream_fmt", None):
+            self.write_stream(rows=[], final=True)
+            self.close_fd()
+            return
+
         tablefmt = self.get_arg_value("table_format") or TABLE_FORMAT
         rows = getattr(self, "_rows", [])
 
@@ -154,12 +202,183 @@ class Table(ExportMixins):
         self.check_stop()
         rows = self.do_row(rows=rows)
         # TBD textwrap key/values
-        self._rows += rows
+        if getattr(self, "_stream_fmt", None):
+            with self.TELEMETRY.timer("write_seconds"):
+                self.write_stream(rows=rows)
+        else:
+            self._rows += rows
         return rows
 
+    def get_stream_format(self) -> Optional[tabulate.TableFormat]:
+        """Get the definition of table_format if it can be written one row at a time.
+
+        Notes:
+            tabulate has no public way to get the definition of a format by name, so if its
+            private table of formats is missing or does not have table_format, the table is
+            not streamed.
+        """
+        tablefmt = self.get_arg_value("table_format") or TABLE_FORMAT
+        if isinstance(tablefmt, tabulate.TableFormat):
+            fmt = tablefmt
+        else:
+            formats = getattr(tabulate, "_table_formats", None)
+            fmt = formats.get(tablefmt) if isinstance(formats, dict) else None
+
+        if isinstance(fmt, tabulate.TableFormat):
+            lines = [fmt.lineabove, fmt.linebelowheader, fmt.linebetweenrows, fmt.linebelow]
+            rows = [fmt.headerrow, fmt.datarow]
+            if all(x is None or isinstance(x, tabulate.Line) for x in lines) and all(
+                isinstance(x, tabulate.DataRow) for x in rows
+            ):
+                return fmt
+
+        msg = f"Table format {tablefmt!r} can not be streamed, all rows will be held in memory"
+        self.echo(msg=msg, warning=True)
+        return None
+
+    def write_stream(self, rows: List[dict], final: bool = False):
+        """Write rows to the table as they are processed.
+
+        Notes:
+            Rows are held in memory until ``table_stream_sample`` rows have been processed
+            or final is True, then the column widths are fixed and the header is written.
+
+        Args:
+            rows: rows to write
+            final: write any rows being held and the bottom border of the table
+        """
+        if self._stream_widths is None:
+            self._rows += rows
+            if len(self._rows) < self.get_arg_value("table_stream_sample") and not final:
+                return
+
+            rows, self._rows = self._rows, []
+            self.set_stream_widths(rows=rows)
+            self._write_lines(self._build_line(self._stream_fmt.lineabove))
+            self._write_lines(self._build_header())
+
+        header_every = self.get_arg_value("table_stream_header_every")
+        for row in rows:
+            if self._stream_count:
+                if header_every and self._stream_count % header_every == 0:
+                    self._write_lines(self._build_line(self._stream_fmt.linebelowheader))
+                    self._write_lines(self._build_header())
+                else:
+                    self._write_lines(self._build_line(self._stream_fmt.linebetweenrows))
+
+            self.check_stream_columns(row=row)
+            cells = [row.get(x) for x in self._stream_columns]
+            self._write_lines(self._build_row(cells=cells, rowfmt=self._stream_fmt.datarow))
+            self._stream_count += 1
+
+        if final:
+            self._write_lines(self._build_line(self._stream_fmt.linebelow))
+
+    def check_stream_columns(self, row: dict):
+        """Warn the first time a column that is not in the table is seen in a row.
+
+        Args:
+            row: row being written
+        """
+        dropped = row.keys() - self._stream_columns_set - self._stream_dropped
+        if dropped:
+            self._stream_dropped.update(dropped)
+            sample = self.get_arg_value("table_stream_sample")
+            msg = (
+                f"Dropping columns that were not in the first {sample} rows used to fix the "
+                f"columns of the table: {sorted(dropped)}"
+            )
+            self.echo(msg=msg, warning=True)
+
+    def set_stream_widths(self, rows: List[dict]):
+        """Fix the columns and the widths of the columns from a sample of rows.
+
+        Args:
+            rows: rows to calculate column widths from
+        """
+        max_width = self.get_arg_value("table_stream_width") or TABLE_STREAM_WIDTH
+        columns = list(self.final_columns)
+        for row in rows:
+            columns += [x for x in row if x not in columns]
+
+        widths = []
+        for column in columns:
+            values = [column] + [row.get(column) for row in rows]
+            width = max(len(x) for value in values for x in self._get_lines(value=value))
+            widths.append(max(min(width, max_width), 1))
+
+        self._stream_columns = columns
+        self._stream_columns_set = set(columns)
+        self._stream_widths = widths
+
+    def _build_header(self) -> List[str]:
+        """Build the lines of the header of the table and the line below it."""
+        headerrow = self._stream_fmt.headerrow
+        lines = self._build_row(cells=self._stream_columns, rowfmt=headerrow)
+        return lines + self._build_line(self._stream_fmt.linebelowheader)
+
+    def _build_row(self, cells: List[Any], rowfmt: tabulate.DataRow) -> List[str]:
+        """Build the lines of a row of the table, wrapping cells to the width of their column.
+
+        Args:
+            cells: value of each column
+            rowfmt: format of the row
+        """
+        pad = " " * self._stream_fmt.padding
+        cells_lines = []
+        for cell, width in zip(cells, self._stream_widths):
+            lines = []
+            for line in self._get_lines(value=cell):
+                lines += textwrap.wrap(line, width=width) or [""]
+            cells_lines.append(lines)
+
+        height = max(len(x) for x in cells_lines)
+        lines = []
+        for idx in range(height):
+            line = [
+                f"{pad}{(x[idx] if idx < len(x) else ''):<{width}}{pad}"
+                for x, width in zip(cells_lines, self._stream_widths)
+            ]
+            lines.append(f"{rowfmt.begin}{rowfmt.sep.join(line)}{rowfmt.end}".rstrip())
+        return lines
+
+    def _build_line(self, linefmt: Optional[tabulate.Line]) -> List[str]:
+        """Build a horizontal line of the table.
+
+        Args:
+            linefmt: format of the line, if None no line is built
+        """
+        if not linefmt:
+            return []
+        padding = self._stream_fmt.padding * 2
+        cells = [linefmt.hline * (x + padding) for x in self._stream_widths]
+        return [f"{linefmt.begin}{linefmt.sep.join(cells)}{linefmt.end}".rstrip()]
+
+    def _write_lines(self, lines: List[str]):
+        """Write lines to the file descriptor.
+
+        Args:
+            lines: lines to write
+        """
+        for line in lines:
+            self._fd.write(f"{line}\n")
+
+    @staticmethod
+    def _get_lines(value: Any) -> List[str]:
+        """Get the lines of the str of a value.
+
+        Args:
+            value: value to get lines of, None is an empty str
+        """
+        value = "" if value is None else str(value)
+        return value.splitlines() or [""]
+
     def check_stop(self):
         """Check if rows processed is greater than table_max_rows."""
         max_rows = self.get_arg_value("table_max_rows")
+        if getattr(self, "_stream_fmt", None) and "table_max_rows" not in self.GETARGS:
+            # streamed rows are not held in memory, so the default row limit is not needed
+            max_rows = None
         rows_processed = self.STATE.get("rows_processed_total", 0)
 
         if all([rows_processed, max_rows]) and rows_processed >= max_rows:
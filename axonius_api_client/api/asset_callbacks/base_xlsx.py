@@ -2,8 +2,6 @@
 """Excel export callbacks class."""
 from typing import List
 
-import xlsxwriter
-
 from ...constants.api import FIELD_TRIM_LEN
 from ...exceptions import ApiError
 from ...tools import listify
@@ -128,6 +126,8 @@ class Xlsx(ExportMixins):
                 msg="Must supply export_file for this export method", error=ApiError, level="error"
             )
 
+        import xlsxwriter
+
         self._workbook = xlsxwriter.Workbook(str(self._file_path), {"constant_memory": True})
         self._cell_format = self._workbook.add_format(cell_format)
 
@@ -156,14 +156,15 @@ class Xlsx(ExportMixins):
         row_return = [{"internal_axon_id": row["internal_axon_id"]} for row in rows]
         rows = self.do_row(rows=rows)
 
-        for row in listify(rows):
-            for idx, column_name in enumerate(self.final_columns):
-                self._worksheet.write(
-                    self._rowtracker, idx, row.get(column_name), self._cell_format
-                )
+        with self.TELEMETRY.timer("write_seconds"):
+            for row in listify(rows):
+                for idx, column_name in enumerate(self.final_columns):
+                    self._worksheet.write(
+                        self._rowtracker, idx, row.get(column_name), self._cell_format
+                    )
 
-            self._rowtracker += 1
-            del row
+                self._rowtracker += 1
+                del row
 
         del rows
 
@@ -3,7 +3,7 @@
 from .asset_mixin import AssetMixin
 from .devices import Devices
 from .fields import Fields
-from .labels import Labels
+from .labels import Labels, LabelsBulkResult, LabelsChunk
 from .runner import Runner
 from .saved_query import SavedQuery
 from .users import Users
@@ -16,6 +16,8 @@ __all__ = (
     "SavedQuery",
     "Fields",
     "Labels",
+    "LabelsBulkResult",
+    "LabelsChunk",
     "Vulnerabilities",
     "Runner",
 )
@@ -1,5 +1,9 @@
 # -*- coding: utf-8 -*-
 """API model mixin for device and user assets."""
+import collections
+import concurrent.futures
+import copy
+import dataclasses
 import datetime
 import pathlib
 import time
@@ -8,12 +12,45 @@ import typing as t
 import uuid
 
 import cachetools
-
-from ...constants.api import DEFAULT_CALLBACKS_CLS, MAX_PAGE_SIZE, PAGE_SIZE
+import requests
+
+from ...constants.api import (
+    COUNT_MODE,
+    COUNT_MODES,
+    DEFAULT_CALLBACKS_CLS,
+    DISK_CACHE_TTL_HISTORY_DATES,
+    LOOKUP_CACHE_MAXSIZE,
+    LOOKUP_CACHE_TTL,
+    LOOKUP_CHUNK_SIZE,
+    LOOKUP_WORKERS,
+    MAX_PAGE_SIZE,
+    PAGE_SIZE,
+    PARALLEL_PAGES,
+    PARALLEL_PAGES_MAX,
+    PREFETCH_PAGES,
+    PREFETCH_PAGES_MAX,
+    RUNNER_CHUNK_SIZE,
+    RUNNER_WORKERS,
+    STREAM_PAGES,
+)
 from ...constants.fields import AXID
 from ...exceptions import ApiError, NotFoundError, ResponseNotOk, StopFetch
+from ...http import RetryPolicy
+from ...logs import lazy_json
 from ...parsers.grabber import Grabber
-from ...tools import PathLike, dt_now, dt_now_file, get_subcls, json_dump, listify
+from ...tools import (
+    PathLike,
+    bounded_map,
+    chunk_by_size,
+    dt_now,
+    dt_now_file,
+    dt_sec_ago,
+    get_path,
+    get_subcls,
+    json_dump,
+    listify,
+    parse_int_min_max,
+)
 from ..api_endpoints import ApiEndpoint, ApiEndpoints
 from ..asset_callbacks.tools import Base as BaseCallbacks
 from ..asset_callbacks.tools import get_callbacks_cls
@@ -21,11 +58,15 @@ from ..json_api.assets import (
     AssetById,
     AssetRequest,
     AssetsPage,
+    AssetsPageStream,
     AssetTypeHistoryDates,
     Count,
     CountRequest,
+    FetchCheckpoint,
+    FetchTelemetry,
     HistoryDates,
 )
+from ..json_api.resources import PaginationRequest
 from ..mixins import ModelMixins
 from ..wizards import Wizard, WizardCsv, WizardText
 from .runner import ENFORCEMENT, Runner
@@ -84,6 +125,9 @@ class AssetMixin(ModelMixins):
         src_fields: t.Optional[t.List[str]] = None,
         check_stdin: bool = True,
         grabber: t.Optional[Grabber] = None,
+        chunk_size: int = RUNNER_CHUNK_SIZE,
+        workers: int = RUNNER_WORKERS,
+        run_chunked: bool = False,
     ) -> Runner:
         """Run an enforcement set against a manually selected list of assets.
 
@@ -130,6 +174,9 @@ class AssetMixin(ModelMixins):
             src_fields (list): fields to use to get $ids
             check_stdin (bool): error if stdin is a TTY when prompting
             grabber: (grabber): Grabber used to get IDs
+            chunk_size (int): maximum number of Asset IDs in each query used to verify $ids
+            workers (int): number of count queries to send concurrently to verify $ids
+            run_chunked (bool): run $eset against chunks of $ids in separate requests
 
         Returns:
             Runner: Runner object used to verify and run $eset
@@ -147,6 +194,9 @@ class AssetMixin(ModelMixins):
             src_fields=src_fields,
             grabber=grabber,
             check_stdin=check_stdin,
+            chunk_size=chunk_size,
+            workers=workers,
+            run_chunked=run_chunked,
         )
         if verify_and_run:
             runner.verify_and_run()
@@ -1049,6 +1099,9 @@ class AssetMixin(ModelMixins):
             If ``export`` equals ``xlsx``, see
             :meth:`axonius_api_client.api.asset_callbacks.base_xlsx.Xlsx.args_map`.
 
+            If ``export`` equals ``parquet`` or ``arrow``, see
+            :meth:`axonius_api_client.api.asset_callbacks.base_parquet.Parquet.args_map`.
+
             :obj:`axonius_api_client.constants.asset_helpers.ASSET_HELPERS` for a list of
             helpers that translate between GUI titles, API request attributes, and saved query
             paths.
@@ -1113,6 +1166,13 @@ class AssetMixin(ModelMixins):
         export_templates: t.Optional[dict] = None,
         http_args: t.Optional[dict] = None,
         return_plain_data: t.Optional[bool] = None,
+        parallel_pages: t.Optional[int] = PARALLEL_PAGES,
+        parallel_ordered: bool = True,
+        prefetch_pages: t.Optional[int] = PREFETCH_PAGES,
+        stream_pages: bool = STREAM_PAGES,
+        count_mode: str = COUNT_MODE,
+        checkpoint: t.Optional[PathLike] = None,
+        resume_from: t.Optional[PathLike] = None,
         **kwargs,
     ) -> t.Generator[dict, None, None]:
         """Get assets from a query.
@@ -1136,6 +1196,9 @@ class AssetMixin(ModelMixins):
             If ``export`` equals ``xlsx``, see
             :meth:`axonius_api_client.api.asset_callbacks.base_xlsx.Xlsx.args_map`.
 
+            If ``export`` equals ``parquet`` or ``arrow``, see
+            :meth:`axonius_api_client.api.asset_callbacks.base_parquet.Parquet.args_map`.
+
             :obj:`axonius_api_client.constants.asset_helpers.ASSET_HELPERS` for a list of
             helpers that translate between GUI titles, API request attributes, and saved query
             paths.
@@ -1192,8 +1255,82 @@ class AssetMixin(ModelMixins):
             http_args: http args to pass to :meth:`axonius_api_client.http.Http.__call__` for each
                 page fetched
             request_obj: request object to use for this query
+            parallel_pages: fetch N pages at a time using offset paging instead of cursor paging,
+                0 or 1 will fetch one page at a time using cursor paging
+            parallel_ordered: when parallel_pages is more than 1, process pages in the order of
+                their offsets instead of the order in which they are received
+            prefetch_pages: when fetching one page at a time, request up to N pages ahead in a
+                background thread while the current page is being processed, 0 disables
+            stream_pages: when fetching one page at a time without prefetch_pages, deserialize
+                each asset as it is read from the response instead of reading the whole page
+                into memory first, see :obj:`AssetsPageStream` for the tradeoffs
+            count_mode: how to get the total count of assets if initial_count is not supplied,
+                one of :data:`axonius_api_client.constants.api.COUNT_MODES`
+            checkpoint: file to save a :obj:`FetchCheckpoint` to after each page, removed once
+                the fetch finishes
+            resume_from: file of a :obj:`FetchCheckpoint` to resume a fetch from, the query,
+                fields, paging and export arguments (the kwargs passed thru to the asset
+                callback, except ones that can not be saved as JSON) of the checkpoint are used
+                instead of the supplied ones and the checkpoint keeps being saved to this file
+                unless checkpoint is supplied
             **kwargs: passed thru to the asset callback defined in ``export``
         """
+        if count_mode not in COUNT_MODES:
+            raise ApiError(f"Invalid count_mode {count_mode!r}, valid: {COUNT_MODES}")
+
+        resume: t.Optional[FetchCheckpoint] = None
+        if resume_from:
+            resume = FetchCheckpoint.load(path=resume_from)
+            resume.check(asset_type=self.ASSET_TYPE)
+            self.LOG.info(f"Resuming fetch from {resume_from}: {resume}")
+            checkpoint = checkpoint or resume_from
+            kwargs, replaced = resume.get_getargs(getargs=kwargs)
+            if replaced:
+                self.LOG.warning(
+                    f"Using the export arguments of the checkpoint instead of the supplied "
+                    f"values for: {replaced}"
+                )
+            request_obj = resume.get_request()
+            use_cursor, cursor_id = request_obj.use_cursor, request_obj.cursor_id
+            wiz_parsed = {}
+            query = resume.store["query"]
+            export = resume.store["export"]
+            fields_parsed = resume.store["fields_parsed"]
+            sort_field_parsed = resume.store["sort_field_parsed"]
+            history_date_parsed = resume.store["history_date_parsed"]
+            include_details = resume.store["include_details"]
+            include_notes = resume.store["include_notes"]
+            max_rows = resume.store["max_rows"]
+            max_pages = resume.store["max_pages"]
+            page_size = resume.store["page_size"]
+            page_sleep = resume.store["page_sleep"]
+            initial_count = resume.store["initial_count"]
+            export_templates = resume.store["export_templates"]
+            page_start, row_start = 0, resume.state["rows_offset"]
+            sort_field = history_date = history_days_ago = None
+
+        if checkpoint and not get_callbacks_cls(export=export).RESUMABLE:
+            raise ApiError(f"Export {export!r} does not support checkpoint or resume_from")
+
+        parallel_pages: int = parse_int_min_max(
+            value=parallel_pages, default=PARALLEL_PAGES, min_value=0, max_value=PARALLEL_PAGES_MAX
+        )
+        if parallel_pages > 1:
+            # offsets can be fetched out of order, a cursor can not
+            use_cursor = False
+            cursor_id = None
+            if checkpoint and not parallel_ordered:
+                # the offset of a checkpoint must only follow pages that have been processed
+                self.LOG.warning("parallel_ordered is forced to True with checkpoint")
+                parallel_ordered = True
+        prefetch_pages: int = parse_int_min_max(
+            value=prefetch_pages, default=PREFETCH_PAGES, min_value=0, max_value=PREFETCH_PAGES_MAX
+        )
+        if stream_pages and (parallel_pages > 1 or prefetch_pages):
+            # pages fetched in other threads would be read in full before being processed
+            self.LOG.warning("stream_pages is not supported with parallel_pages or prefetch_pages")
+            stream_pages = False
+
         request_obj: AssetRequest = self.build_get_request(
             request_obj=request_obj,
             search=search,
@@ -1259,14 +1396,15 @@ class AssetMixin(ModelMixins):
                 date=history_date, days_ago=history_days_ago, exact=history_exact
             )
 
-        if not isinstance(initial_count, int):
-            initial_count: int = self.count(
-                query=query,
-                frontend_sent_time=request_obj.frontend_sent_time,
-                history_date_parsed=history_date_parsed,
-                query_id=request_obj.query_id,
-                saved_query_id=request_obj.saved_query_id,
-            )
+        count_args: dict = {
+            "query": query,
+            "frontend_sent_time": request_obj.frontend_sent_time,
+            "history_date_parsed": history_date_parsed,
+            "query_id": request_obj.query_id,
+            "saved_query_id": request_obj.saved_query_id,
+        }
+        if not isinstance(initial_count, int) and count_mode == "before":
+            initial_count: int = self.count(**count_args)
 
         if not isinstance(file_date, str):
             file_date: str = dt_now_file()
@@ -1305,6 +1443,14 @@ class AssetMixin(ModelMixins):
             "row_start": row_start,
             "initial_count": initial_count,
             "export_templates": export_templates,
+            "parallel_pages": parallel_pages,
+            "parallel_ordered": parallel_ordered,
+            "prefetch_pages": prefetch_pages,
+            "stream_pages": stream_pages,
+            "count_mode": count_mode,
+            "checkpoint": checkpoint,
+            "resume_from": resume_from,
+            "resume_export": resume.export if resume else {},
             "request_obj": request_obj,
         }
         state: dict = AssetsPage.create_state(
@@ -1316,42 +1462,106 @@ class AssetMixin(ModelMixins):
             row_start=row_start,
             initial_count=initial_count,
         )
+        if resume:
+            state.update(resume.state)
+        telemetry: FetchTelemetry = FetchTelemetry()
+        # callbacks objects can change their arguments, save the ones that were supplied
+        checkpoint_getargs: dict = FetchCheckpoint.dump_getargs(getargs=kwargs)
         callbacks_cls: t.Type[BaseCallbacks] = get_callbacks_cls(export=export)
         callbacks: BaseCallbacks = callbacks_cls(
-            apiobj=self, getargs=kwargs, state=state, store=store
+            apiobj=self, getargs=kwargs, state=state, store=store, telemetry=telemetry
         )
         self.LAST_CALLBACKS: BaseCallbacks = callbacks
         callbacks.start()
-        self.LOG.info(f"STARTING FETCH store={json_dump(store)}")
-        self.LOG.debug(f"STARTING FETCH state={json_dump(state)}")
-
-        while not state["stop_fetch"]:
-            request_obj.filter = store["query"]
-            request_obj.fields = {self.ASSET_TYPE: store["fields_parsed"]}
-            request_obj.include_details = store["include_details"]
-            request_obj.include_notes = store["include_notes"]
-            request_obj.set_offset(state["rows_offset"])
-            request_obj.set_limit(state["page_size"])
+        self.LOG.info("STARTING FETCH store=%s", lazy_json(store))
+        self.LOG.debug("STARTING FETCH state=%s", lazy_json(state))
 
-            try:
-                start_dt: datetime.datetime = dt_now()
-                page: AssetsPage = self._get(request_obj=request_obj, http_args=http_args)
+        count_future: t.Optional[concurrent.futures.Future] = None
+        if not isinstance(initial_count, int) and count_mode == "concurrent":
+            count_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix=f"{self.ASSET_TYPE}_count"
+            )
+            count_future = count_executor.submit(self.count, **count_args)
+            count_executor.shutdown(wait=False)
+
+        pages: t.Generator[t.Tuple[AssetsPage, datetime.datetime], None, None]
+        if parallel_pages > 1:
+            pages = self._get_pages_parallel(
+                request_obj=request_obj,
+                state=state,
+                store=store,
+                http_args=http_args,
+                workers=parallel_pages,
+                ordered=parallel_ordered,
+            )
+        elif prefetch_pages:
+            pages = self._get_pages_prefetch(
+                request_obj=request_obj,
+                state=state,
+                store=store,
+                http_args=http_args,
+                prefetch=prefetch_pages,
+            )
+        else:
+            pages = self._get_pages_serial(
+                request_obj=request_obj,
+                state=state,
+                store=store,
+                http_args=http_args,
+                stream=stream_pages,
+            )
 
-                if request_obj.use_cursor:
-                    request_obj.cursor_id = page.cursor
-                state: dict = page.process_page(state=state, start_dt=start_dt, apiobj=self)
+        try:
+            for page, start_dt in pages:
+                telemetry.start_page(page=page, start_dt=start_dt)
+                if count_future is not None and count_future.done():
+                    self._set_initial_count(state=state, store=store, future=count_future)
+                    count_future = None
+                if not stream_pages:
+                    state: dict = page.process_page(state=state, start_dt=start_dt, apiobj=self)
+                    self._set_initial_count(state=state, store=store)
+                if parallel_pages > 1 and not parallel_ordered:
+                    # page numbers arrive out of order, track how many pages have been processed
+                    state["page_number"] = state["page_start"] + state["page_loop"]
                 for row in page.assets:
                     state: dict = page.start_row(state=state, apiobj=self, row=row)
-                    yield from listify(obj=callbacks.process_row(row=row))
+                    with telemetry.timer("process_seconds"):
+                        rows: t.List[dict] = listify(obj=callbacks.process_row(row=row))
+                    yield from rows
                     state: dict = page.process_row(state=state, apiobj=self, row=row)
+                if stream_pages:
+                    # page metadata is only available once all of the rows have been read
+                    state: dict = page.process_page(state=state, start_dt=start_dt, apiobj=self)
+                    self._set_initial_count(state=state, store=store)
+                if checkpoint:
+                    self._save_checkpoint(
+                        path=checkpoint,
+                        request_obj=request_obj,
+                        state=state,
+                        store=store,
+                        callbacks=callbacks,
+                        getargs=checkpoint_getargs,
+                    )
                 state: dict = page.process_loop(state=state, apiobj=self)
                 time.sleep(state["page_sleep"])
-            except StopFetch as exc:
-                self.LOG.debug(f"Received {type(exc)}: {exc.reason}")
-                break
-        self.LOG.info(f"FINISHED FETCH store={json_dump(store)}")
-        self.LOG.debug(f"FINISHED FETCH state={json_dump(state)}")
+        except StopFetch as exc:
+            self.LOG.debug(f"Received {type(exc)}: {exc.reason}")
+        finally:
+            pages.close()
+            if count_future is not None:
+                count_future.cancel()
+        telemetry.finish()
+        self.LOG.info("FINISHED FETCH store=%s", lazy_json(store))
+        self.LOG.debug("FINISHED FETCH state=%s", lazy_json(state))
+        stop_start: float = time.perf_counter()
         callbacks.stop()
+        telemetry.stop_seconds = time.perf_counter() - stop_start
+        if checkpoint:
+            path: pathlib.Path = get_path(checkpoint)
+            if path.is_file():
+                path.unlink()
+                self.LOG.info(f"Removed checkpoint {path} of finished fetch")
+        self.LOG.info("FETCH TELEMETRY: %s", telemetry)
 
     def get_by_saved_query(
         self,
@@ -1582,6 +1792,135 @@ class AssetMixin(ModelMixins):
         """
         return self._destroy(destroy=destroy, history=history)
 
+    def lookup_many(
+        self,
+        values: t.Iterable[str],
+        field: str,
+        fields: t.Optional[t.Union[t.List[str], str]] = None,
+        chunk_size: int = LOOKUP_CHUNK_SIZE,
+        workers: int = LOOKUP_WORKERS,
+        cache: t.Union[bool, t.MutableMapping] = False,
+        field_manual: bool = False,
+        **kwargs,
+    ) -> t.Dict[str, t.List[dict]]:
+        """Get the assets where field equals each of many values, using a query per chunk.
+
+        Examples:
+            Look up the devices of every hostname in a CSV file at once, instead of
+            calling :meth:`get_by_value` for each row
+
+            >>> import axonius_api_client as axonapi
+            >>> connect_args: dict = axonapi.get_env_connect()
+            >>> client: axonapi.Connect = axonapi.Connect(**connect_args)
+            >>> apiobj: axonapi.api.assets.AssetMixin = client.devices
+            >>>       # or client.users or client.vulnerabilities
+            >>> hostnames = [row["hostname"] for row in csv.DictReader(open("rows.csv"))]
+            >>> found = apiobj.lookup_many(
+            ...     values=hostnames, field="hostname", fields=["os.type"], cache=True
+            ... )
+            >>> found["host1"]
+            [{'internal_axon_id': '...', 'specific_data.data.hostname': ['host1'], ...}]
+
+        Notes:
+            Values are split into chunks of at most ``chunk_size`` values, and a query like
+            ``(field in ["value1", "value2"])`` is sent for each chunk, ``workers`` at a time.
+            Each asset returned is mapped to the values in its chunk that equal the value of
+            field, or any of its values if field is a list.
+
+            If cache is True, a cache kept by this asset type object of the client is used.
+            If cache is a mapping, it is used as the cache. The assets of values in the
+            cache are not fetched from the API again. Entries are keyed by the URL of the
+            client, the asset type, field, fields and all other arguments passed to
+            :meth:`get`, and copies of the cached assets are returned.
+
+        Args:
+            values: values that must equal `field`, duplicates are only looked up once
+            field: name of field to query against
+            fields: fields to return for each asset, field is always returned
+            chunk_size: maximum number of values in each query
+            workers: number of queries to send concurrently
+            cache: cache the assets of each value to reuse them in later lookups
+            field_manual: consider supplied field as a fully qualified field name
+            **kwargs: passed to :meth:`get`
+
+        Returns:
+            mapping of each value to the assets where field equals value
+        """
+        field = self.fields.get_field_name(value=field, field_manual=field_manual)
+        if cache is True:
+            if self._lookup_cache is None:
+                self._lookup_cache = cachetools.TTLCache(
+                    maxsize=LOOKUP_CACHE_MAXSIZE, ttl=LOOKUP_CACHE_TTL
+                )
+            cache = self._lookup_cache
+        use_cache: bool = cache is not False and cache is not None
+
+        fields = listify(fields)
+        kwargs["fields_manual"] = [*listify(kwargs.get("fields_manual")), field]
+        get_args = {"fields": fields, **kwargs}
+        args_key: str = json_dump(obj=get_args, indent=None, sort_keys=True)
+
+        ret: t.Dict[str, t.List[dict]] = {}
+        missing: t.List[str] = []
+        for value in values:
+            value = str(value).strip()
+            if not value or value in ret:
+                continue
+
+            key = self._lookup_key(field=field, value=value, args_key=args_key)
+            if use_cache and key in cache:
+                ret[value] = copy.deepcopy(cache[key])
+            else:
+                ret[value] = []
+                missing.append(value)
+
+        cached: int = len(ret) - len(missing)
+        chunks: t.List[t.List[str]] = list(chunk_by_size(iterable=missing, max_items=chunk_size))
+        self.LOG.debug(
+            f"Looking up {len(missing)} values of {field!r} in {len(chunks)} chunks, "
+            f"{cached} values already cached"
+        )
+
+        def lookup(chunk: t.List[str]) -> t.List[dict]:
+            query = self._build_query(inner=f"{field} in [{self._lookup_csv(values=chunk)}]")
+            return self.get(query=query, **get_args)
+
+        for chunk, future in bounded_map(
+            func=lookup,
+            iterable=chunks,
+            workers=workers,
+            default=LOOKUP_WORKERS,
+            name="lookup_many",
+        ):
+            for asset in future.result():
+                matches = [str(x) for x in listify(asset.get(field))]
+                for value in [x for x in chunk if x in matches]:
+                    ids = [x.get("internal_axon_id") for x in ret[value]]
+                    if asset.get("internal_axon_id") not in ids:
+                        ret[value].append(asset)
+
+        if use_cache:
+            for value in missing:
+                key = self._lookup_key(field=field, value=value, args_key=args_key)
+                cache[key] = copy.deepcopy(ret[value])
+        return ret
+
+    def _lookup_key(self, field: str, value: str, args_key: str) -> tuple:
+        """Get the key of a value in the cache of :meth:`lookup_many`.
+
+        Args:
+            field: fully qualified name of field being looked up
+            value: value being looked up
+            args_key: arguments passed to :meth:`get` serialized as JSON with sorted keys
+        """
+        return (self.http.url, self.ASSET_TYPE, field, args_key, value)
+
+    @staticmethod
+    def _lookup_csv(values: t.List[str]) -> str:
+        """Format values into a CSV string usable in AQL."""
+        values = [x.replace("\\", "\\\\").replace('"', '\\"') for x in values]
+        return ", ".join([f'"{x}"' for x in values])
+
     def get_by_values(
         self,
         values: t.List[str],
@@ -1703,12 +2042,21 @@ class AssetMixin(ModelMixins):
     @cachetools.cached(cache=HISTORY_DATES_OBJ_CACHE)
     def history_dates_obj(self) -> AssetTypeHistoryDates:
         """Pass."""
-        return self._history_dates().parsed[self.ASSET_TYPE]
+        return self._history_dates_cached().parsed[self.ASSET_TYPE]
 
     @cachetools.cached(cache=HISTORY_DATES_CACHE)
     def history_dates(self) -> dict:
         """Get all known historical dates."""
-        return self._history_dates().value[self.ASSET_TYPE]
+        return self._history_dates_cached().value[self.ASSET_TYPE]
+
+    def _history_dates_cached(self) -> HistoryDates:
+        """Get all known historical dates using the disk cache of the client, if enabled."""
+        value = self._disk_cached(
+            name="history_dates",
+            func=lambda: self._history_dates().value,
+            ttl=DISK_CACHE_TTL_HISTORY_DATES,
+        )
+        return HistoryDates(value=value)
 
     def _build_query(
         self, inner: str, not_flag: bool = False, pre: str = "", post: str = ""
@@ -1859,6 +2207,7 @@ class AssetMixin(ModelMixins):
         offset: t.Optional[int] = 0,
         limit: t.Optional[int] = PAGE_SIZE,
         http_args: t.Optional[dict] = None,
+        stream: bool = False,
         **kwargs,
     ) -> AssetsPage:
         """Private API method to get a page of assets using a request object.
@@ -1868,15 +2217,29 @@ class AssetMixin(ModelMixins):
             offset: offset to start at
             limit: number of assets to return
             http_args: arguments to pass to :meth:`requests.Session.request`
+            stream: return a :obj:`AssetsPageStream` that deserializes the assets as they are
+                read from the response
             **kwargs: passed to :meth:`build_get_request`
         """
         request_obj: AssetRequest = self.build_get_request(
             request_obj=request_obj, offset=offset, limit=limit, **kwargs
         )
-        self.LOG.debug(f"Getting {self.ASSET_TYPE} assets with request {json_dump(request_obj)}")
+        self.LOG.debug("Getting %s assets with request %s", self.ASSET_TYPE, lazy_json(request_obj))
         self.LAST_GET_REQUEST_OBJ: AssetRequest = request_obj
         self.LAST_GET: dict = request_obj.to_dict()
         api_endpoint: ApiEndpoint = ApiEndpoints.assets.get
+
+        if stream:
+            response: requests.Response = api_endpoint.perform_request(
+                http=self.auth.http,
+                request_obj=request_obj,
+                asset_type=self.ASSET_TYPE,
+                http_args={**(http_args or {}), "stream": True},
+                raw=True,
+            )
+            api_endpoint.check_response_status(http=self.auth.http, response=response)
+            return AssetsPageStream.load_response_stream(response=response, http=self.auth.http)
+
         response: AssetsPage = api_endpoint.perform_request(
             http=self.auth.http,
             request_obj=request_obj,
@@ -1885,6 +2248,397 @@ class AssetMixin(ModelMixins):
         )
         return response
 
+    def _get_page(
+        self,
+        request_obj: AssetRequest,
+        http_args: t.Optional[dict] = None,
+        stream: bool = False,
+    ) -> AssetsPage:
+        """Get a page of assets for :meth:`get_generator`, retrying it if it fails.
+
+        Notes:
+            Getting a page of assets is a POST, so :obj:`axonius_api_client.http.Http` only
+            retries it if no connection could be made. Since it changes nothing on the
+            server, a page that gets a retryable status code or fails after connecting is
+            retried here using the :obj:`axonius_api_client.http.RetryPolicy` of :attr:`http`,
+            with the offset and cursor of the request reset to those of the page that failed.
+
+            Streamed pages are only retried if they fail before their rows start being read.
+
+        Args:
+            request_obj: request object to use
+            http_args: arguments to pass to :meth:`_get`
+            stream: fetch the page as a :obj:`AssetsPageStream`
+        """
+        policy: RetryPolicy = self.auth.http.RETRY_POLICY
+        page: PaginationRequest = dataclasses.replace(request_obj.page)
+        cursor_id: t.Optional[str] = request_obj.cursor_id
+        attempt: int = 0
+        waited: float = 0.0
+
+        while True:
+            attempt += 1
+            try:
+                return self._get(request_obj=request_obj, http_args=http_args, stream=stream)
+            except Exception as exc:
+                response: t.Optional[requests.Response] = getattr(exc, "response", None)
+                delay: t.Optional[float] = None
+                if not policy.is_connect_error(exc=exc):
+                    delay = policy.get_delay(
+                        attempt=attempt,
+                        waited=waited,
+                        response=response if isinstance(response, requests.Response) else None,
+                        exc=exc,
+                        idempotent=True,
+                    )
+                if delay is None:
+                    raise
+
+                self.LOG.warning(
+                    f"Retrying page at offset {page.offset} (cursor {cursor_id}) after "
+                    f"{delay:.2f} seconds, attempt {attempt} of {policy.max_attempts} failed: "
+                    f"{type(exc).__name__}"
+                )
+                time.sleep(delay)
+                waited += delay
+                request_obj.page = dataclasses.replace(page)
+                request_obj.cursor_id = cursor_id
+
+    def _get_pages_serial(
+        self,
+        request_obj: AssetRequest,
+        state: dict,
+        store: dict,
+        http_args: t.Optional[dict] = None,
+        stream: bool = False,
+    ) -> t.Generator[t.Tuple[AssetsPage, datetime.datetime], None, None]:
+        """Fetch pages of assets one at a time for :meth:`get_generator`.
+
+        Notes:
+            The next page is not requested until the previous page has been processed,
+            since the offset and cursor for the next page come from the paging state.
+
+        Args:
+            request_obj: request object to use for each page
+            state: paging state from :meth:`AssetsPage.create_state`
+            store: arguments store from :meth:`get_generator`
+            http_args: arguments to pass to :meth:`_get` for each page
+            stream: fetch each page as a :obj:`AssetsPageStream`
+        """
+        while not state["stop_fetch"]:
+            request_obj.filter = store["query"]
+            request_obj.fields = {self.ASSET_TYPE: store["fields_parsed"]}
+            request_obj.include_details = store["include_details"]
+            request_obj.include_notes = store["include_notes"]
+            request_obj.set_offset(state["rows_offset"])
+            request_obj.set_limit(state["page_size"])
+
+            start_dt: datetime.datetime = dt_now()
+            page: AssetsPage = self._get_page(
+                request_obj=request_obj, http_args=http_args, stream=stream
+            )
+            try:
+                yield page, start_dt
+            finally:
+                if stream:
+                    page.close()
+
+            if request_obj.use_cursor:
+                request_obj.cursor_id = page.cursor
+
+    def _get_pages_prefetch(
+        self,
+        request_obj: AssetRequest,
+        state: dict,
+        store: dict,
+        http_args: t.Optional[dict] = None,
+        prefetch: int = 2,
+    ) -> t.Generator[t.Tuple[AssetsPage, datetime.datetime], None, None]:
+        """Fetch pages of assets one at a time in a background thread for :meth:`get_generator`.
+
+        Notes:
+            Requests are still sent one after the other, since each page needs the cursor
+            and row count from the page before it. Up to ``prefetch`` pages are requested
+            ahead of the page being processed, so network I/O overlaps with row processing.
+
+            The time the fetch thread sat idle waiting for pages to be processed is tracked in
+            ``prefetch_seconds_fetch_stalled`` in the paging state, and the time processing
+            sat idle waiting for a page to be fetched in ``prefetch_seconds_process_stalled``.
+
+        Args:
+            request_obj: request object to use for each page
+            state: paging state from :meth:`AssetsPage.create_state`
+            store: arguments store from :meth:`get_generator`
+            http_args: arguments to pass to :meth:`_get` for each page
+            prefetch: number of pages to fetch ahead
+        """
+        request_obj.filter = store["query"]
+        request_obj.fields = {self.ASSET_TYPE: store["fields_parsed"]}
+        request_obj.include_details = store["include_details"]
+        request_obj.include_notes = store["include_notes"]
+        request_obj.set_limit(state["page_size"])
+
+        row_start: int = state["rows_offset"]
+        tracker: dict = {"offset": row_start, "pages": 0, "done": False, "fetched_dt": None}
+        self.LOG.debug(f"Fetching up to {prefetch} pages ahead")
+
+        def fetch() -> t.Optional[t.Tuple[AssetsPage, datetime.datetime]]:
+            if tracker["done"] or state["stop_fetch"]:
+                return None
+            if state["max_rows"] and tracker["offset"] - row_start >= state["max_rows"]:
+                return None
+            if state["max_pages"] and tracker["pages"] >= state["max_pages"]:
+                return None
+            if tracker["fetched_dt"]:
+                stalled: float = dt_sec_ago(obj=tracker["fetched_dt"], exact=True)
+                state["prefetch_seconds_fetch_stalled"] += stalled
+
+            request_obj.set_offset(tracker["offset"])
+            start_dt: datetime.datetime = dt_now()
+            page: AssetsPage = self._get_page(request_obj=request_obj, http_args=http_args)
+            tracker["fetched_dt"] = dt_now()
+
+            if request_obj.use_cursor:
+                request_obj.cursor_id = page.cursor
+            tracker["offset"] += page.asset_count_page
+            tracker["pages"] += 1
+            tracker["done"] = not page.assets
+            return page, start_dt
+
+        # one worker, so each fetch runs after the one before it and sees its cursor & offset
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=f"{self.ASSET_TYPE}_prefetch"
+        )
+        futures: t.Deque[concurrent.futures.Future] = collections.deque(
+            executor.submit(fetch) for _ in range(prefetch)
+        )
+        try:
+            while futures:
+                future: concurrent.futures.Future = futures.popleft()
+                wait_dt: datetime.datetime = dt_now()
+                result: t.Optional[t.Tuple[AssetsPage, datetime.datetime]] = future.result()
+                state["prefetch_seconds_process_stalled"] += dt_sec_ago(obj=wait_dt, exact=True)
+                if result is None:
+                    break
+                futures.append(executor.submit(fetch))
+                yield result
+        finally:
+            tracker["done"] = True
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    def _get_pages_parallel(
+        self,
+        request_obj: AssetRequest,
+        state: dict,
+        store: dict,
+        http_args: t.Optional[dict] = None,
+        workers: int = 2,
+        ordered: bool = True,
+    ) -> t.Generator[t.Tuple[AssetsPage, datetime.datetime], None, None]:
+        """Fetch pages of assets concurrently using offset paging for :meth:`get_generator`.
+
+        Notes:
+            The rows left to fetch are split into offsets of page_size, with at most ``workers``
+            pages requested or waiting to be processed at any time. Offsets are issued until
+            the larger of the initial count or the latest count returned in the page metadata
+            is reached, or until max_rows or max_pages would be exceeded.
+
+            If neither count is known yet, only the first page is requested until it has been
+            received, so the total count from its metadata can be used.
+
+            When not ordered, a page with no rows is held back until every page with a lower
+            offset has been yielded, since processing it stops the fetch.
+
+        Args:
+            request_obj: request object to copy for each page
+            state: paging state from :meth:`AssetsPage.create_state`
+            store: arguments store from :meth:`get_generator`
+            http_args: arguments to pass to :meth:`_get` for each page
+            workers: number of pages to fetch at a time
+            ordered: yield pages in order of offset, instead of as they are received
+        """
+        request_obj.filter = store["query"]
+        request_obj.fields = {self.ASSET_TYPE: store["fields_parsed"]}
+        request_obj.include_details = store["include_details"]
+        request_obj.include_notes = store["include_notes"]
+        request_obj.use_cursor = False
+        request_obj.cursor_id = None
+
+        page_size: int = state["page_size"]
+        offsets: t.Iterator[int] = self._iter_page_offsets(state=state)
+        self.LOG.debug(f"Fetching {workers} pages at a time, ordered={ordered}")
+
+        def fetch(offset: int) -> t.Tuple[AssetsPage, datetime.datetime]:
+            page_request: AssetRequest = dataclasses.replace(
+                request_obj, page=PaginationRequest(offset=offset, limit=page_size)
+            )
+            start_dt: datetime.datetime = dt_now()
+            return self._get_page(request_obj=page_request, http_args=http_args), start_dt
+
+        def submit() -> bool:
+            offset: t.Optional[int] = next(offsets, None)
+            if offset is None:
+                return False
+            futures.append((offset, executor.submit(fetch, offset)))
+            if not self._has_page_total(state=state):
+                page: AssetsPage = futures[0][1].result()[0]
+                state["rows_to_fetch_total"] = page.asset_count_total or 0
+            return True
+
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix=f"{self.ASSET_TYPE}_pages"
+        )
+        futures: t.Deque[t.Tuple[int, concurrent.futures.Future]] = collections.deque()
+        try:
+            while len(futures) < workers and submit():
+                pass
+
+            while futures:
+                if ordered:
+                    _, future = futures.popleft()
+                else:
+                    _, future = self._pop_page_unordered(futures=futures)
+
+                yield future.result()
+                submit()
+        finally:
+            for _, future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    @staticmethod
+    def _pop_page_unordered(
+        futures: t.Deque[t.Tuple[int, concurrent.futures.Future]]
+    ) -> t.Tuple[int, concurrent.futures.Future]:
+        """Pop the next page received for :meth:`_get_pages_parallel` when not ordered.
+
+        Notes:
+            A page with no rows is only popped once it has the lowest offset left, so the
+            fetch does not stop before the rows of pages with lower offsets are processed.
+
+        Args:
+            futures: offset and future of each page being fetched, in order of offset
+        """
+        while True:
+            lowest: int = futures[0][0]
+            for item in [x for x in futures if x[1].done()]:
+                offset, future = item
+                if (
+                    offset == lowest
+                    or future.exception() is not None
+                    or future.result()[0].asset_count_page
+                ):
+                    futures.remove(item)
+                    return item
+
+            waiting: t.List[concurrent.futures.Future] = [
+                x for _, x in futures if not x.done()
+            ]
+            concurrent.futures.wait(waiting, return_when=concurrent.futures.FIRST_COMPLETED)
+
+    def _save_checkpoint(
+        self,
+        path: PathLike,
+        request_obj: AssetRequest,
+        state: dict,
+        store: dict,
+        callbacks: BaseCallbacks,
+        getargs: t.Optional[dict] = None,
+    ) -> FetchCheckpoint:
+        """Save a checkpoint of a fetch after a page was processed for :meth:`get_generator`.
+
+        Args:
+            path: file to save checkpoint to
+            request_obj: request object used for each page
+            state: paging state from :meth:`AssetsPage.create_state`
+            store: arguments store from :meth:`get_generator`
+            callbacks: callbacks object to get the position of the export from
+            getargs: arguments supplied to the callbacks object
+        """
+        checkpoint: FetchCheckpoint = FetchCheckpoint.create(
+            asset_type=self.ASSET_TYPE,
+            request_obj=request_obj,
+            state=state,
+            store=store,
+            export=callbacks.get_checkpoint(),
+            getargs=getargs,
+        )
+        checkpoint.save(path=path)
+        self.LOG.debug(f"Saved checkpoint to {path}: {checkpoint}")
+        return checkpoint
+
+    def _set_initial_count(
+        self, state: dict, store: dict, future: t.Optional[concurrent.futures.Future] = None
+    ):
+        """Set the initial count of assets for :meth:`get_generator` if it is not known yet.
+
+        Notes:
+            With count_mode "concurrent", this is called with the finished count before the
+            next page is processed, unless the total count from the metadata of a page was
+            set first.
+
+        Args:
+            state: paging state from :meth:`AssetsPage.create_state`
+            store: arguments store from :meth:`get_generator`
+            future: finished count from the background thread, if not supplied the total count
+                from the metadata of the last processed page is used
+        """
+        if isinstance(state["rows_initial_count"], int) or (future and future.cancelled()):
+            return
+
+        if future is None:
+            count: t.Optional[int] = state["rows_to_fetch_total"] if state["page"] else None
+        else:
+            try:
+                count: t.Optional[int] = future.result()
+            except Exception as exc:
+                self.LOG.warning(f"Unable to get count of {self.ASSET_TYPE} assets: {exc}")
+                return
+
+        if isinstance(count, int):
+            self.LOG.debug(f"Initial count of {self.ASSET_TYPE} assets: {count}")
+            state["rows_initial_count"] = store["initial_count"] = count
+
+    @staticmethod
+    def _has_page_total(state: dict) -> bool:
+        """Check if the total count of assets is known for parallel paging.
+
+        Args:
+            state: paging state from :meth:`AssetsPage.create_state`
+        """
+        return isinstance(state["rows_initial_count"], int) or bool(state["rows_to_fetch_total"])
+
+    @classmethod
+    def _iter_page_offsets(cls, state: dict) -> t.Generator[int, None, None]:
+        """Generate the row offsets to request for parallel paging.
+
+        Notes:
+            If the total count of assets is not known, the first offset is always generated.
+
+        Args:
+            state: paging state from :meth:`AssetsPage.create_state`
+        """
+        page_size: int = state["page_size"]
+        row_start: int = state["rows_offset"]
+        offset: int = row_start
+        max_rows: int = state["max_rows"]
+        max_pages: int = state["max_pages"]
+        pages: int = 0
+
+        while not state["stop_fetch"]:
+            total: int = max(state["rows_initial_count"] or 0, state["rows_to_fetch_total"] or 0)
+            if offset >= total and (pages or cls._has_page_total(state=state)):
+                break
+            if max_rows and offset - row_start >= max_rows:
+                break
+            if max_pages and pages >= max_pages:
+                break
+            yield offset
+            offset += page_size
+            pages += 1
+
     def _count(
         self,
         request_obj: t.Optional[CountRequest] = None,
@@ -1900,7 +2654,7 @@ class AssetMixin(ModelMixins):
         """
         request_obj = self.build_count_request(request_obj=request_obj, **kwargs)
         self.LOG.debug(
-            f"Getting count of {self.ASSET_TYPE} assets with request {json_dump(request_obj)}"
+            "Getting count of %s assets with request %s", self.ASSET_TYPE, lazy_json(request_obj)
         )
         self.LAST_COUNT_REQUEST_OBJ: CountRequest = request_obj
         self.LAST_COUNT: dict = request_obj.to_dict()
@@ -1955,7 +2709,8 @@ class AssetMixin(ModelMixins):
         include: bool = True,
         fields: t.Optional[t.List[str]] = None,
         query: t.Optional[str] = "",
-    ) -> None:
+        chunk_size: t.Optional[int] = None,
+    ) -> t.Union[str, t.List[str]]:
         """Run an enforcement set manually against a list of assets internal_axon_ids.
 
         Args:
@@ -1964,14 +2719,35 @@ class AssetMixin(ModelMixins):
             include (bool, optional): select IDs in DB or IDs NOT in DB
             fields (t.Optional[t.List[str]], optional): list of fields used to select assets
             query (str, optional): filter used to select assets
+            chunk_size (t.Optional[int], optional): if more than this many ids are supplied,
+                send a request for each chunk of at most this many ids
 
         Returns:
-            TYPE: Empty response
+            t.Union[str, t.List[str]]: Empty response, or a list of empty responses if ids
+                were sent in chunks
         """
         fields = listify(fields)
         ids = listify(ids)
         query = query if isinstance(query, str) and query.strip() else ""
 
+        if chunk_size and len(ids) > chunk_size:
+            if not include:
+                raise ApiError("Can not run an enforcement set in chunks with include=False")
+
+            chunks = list(chunk_by_size(iterable=ids, max_items=chunk_size))
+            ret = []
+            for index, chunk in enumerate(chunks):
+                self.LOG.info(
+                    f"Running enforcement set {name!r} against chunk {index + 1} out of "
+                    f"{len(chunks)} with {len(chunk)} assets"
+                )
+                ret.append(
+                    self._run_enforcement(
+                        name=name, ids=chunk, include=include, fields=fields, query=query
+                    )
+                )
+            return ret
+
         asset_type = self.ASSET_TYPE
         selection = {"ids": ids, "include": include}
 
@@ -2033,3 +2809,6 @@ class AssetMixin(ModelMixins):
 
     wizard_csv = None
     """:obj:`axonius_api_client.api.wizards.wizard_csv.WizardCsv`: Query wizard for CSV files."""
+
+    _lookup_cache: t.Optional[cachetools.TTLCache] = None
+    """Cache used by :meth:`lookup_many` with cache=True."""
@@ -2,7 +2,7 @@
 """API for working with fields for assets."""
 import re
 import typing as t
-from typing import List, Optional, Tuple, Union
+from typing import Dict, List, Optional, Set, Tuple, Union
 
 from cachetools import TTLCache, cached
 
@@ -48,6 +48,95 @@ def fuzzyfinder(value: str, collection: t.Iterable, accessor: t.Callable = lambd
     return (z[-1] for z in sorted(suggestions))
 
 
+class SchemasIndex:
+    """Lookup tables for the field schemas of an adapter returned by :meth:`Fields.get`.
+
+    Notes:
+        The tables are built on first use and kept for as long as the result of
+        :meth:`Fields.get` is, so finding a field by name is a dict lookup instead of a scan
+        of every schema. Fuzzy searches only check the schemas that contain every trigram
+        (for substring matches) or every character (for :func:`fuzzyfinder` matches) of the
+        search, which are necessary for a schema to match, so the results are unchanged.
+    """
+
+    def __init__(self, schemas: List[dict]):
+        """Lookup tables for the field schemas of an adapter.
+
+        Args:
+            schemas: field schemas of an adapter
+        """
+        self.schemas: List[dict] = schemas
+        self._eq: Dict[Tuple[Tuple[str, ...], bool], Dict[str, dict]] = {}
+        self._grams: Dict[Tuple[Tuple[str, ...], bool], Dict[str, Set[int]]] = {}
+
+    @staticmethod
+    def get_grams(value: str, chars: bool = False) -> Set[str]:
+        """Get the trigrams or characters of a value.
+
+        Args:
+            value: value to get trigrams or characters of
+            chars: get characters instead of trigrams
+        """
+        if chars or len(value) < 3:
+            return set(value)
+        return {value[idx : idx + 3] for idx in range(len(value) - 2)}
+
+    def find(
+        self, value: str, keys: List[str] = GET_SCHEMA_KEYS, selectable_only: bool = True
+    ) -> Optional[dict]:
+        """Find the first schema with a key that equals a value, ignoring case.
+
+        Args:
+            value: name of field
+            keys: list of keys to check if value equals
+            selectable_only: only find schemas of selectable fields
+        """
+        table_key = (tuple(keys), selectable_only)
+        table = self._eq.get(table_key)
+        if table is None:
+            table = {}
+            for schema in self.schemas:
+                if selectable_only and not schema.get("selectable", True):
+                    continue
+                for key in keys:
+                    table.setdefault(schema[key].lower(), schema)
+            self._eq[table_key] = table
+        return table.get(value.lower().strip())
+
+    def get_candidates(self, search: str, keys: List[str], fuzzy: bool = False) -> List[dict]:
+        """Get the schemas that may match a substring or fuzzy search.
+
+        Args:
+            search: value to search for, already lower cased for substring searches
+            keys: list of keys of each schema to search
+            fuzzy: get candidates for :func:`fuzzyfinder` instead of substring matches
+        """
+        if not search.isascii():
+            return self.schemas
+
+        table_key = (tuple(keys), fuzzy)
+        table = self._grams.get(table_key)
+        if table is None:
+            table = {}
+            for idx, schema in enumerate(self.schemas):
+                for key in keys:
+                    value = schema[key]
+                    if fuzzy:
+                        grams = set(value.lower()) | set(value.casefold())
+                    else:
+                        grams = self.get_grams(value=value) | set(value)
+                    for gram in grams:
+                        table.setdefault(gram, set()).add(idx)
+            self._grams[table_key] = table
+
+        grams = self.get_grams(value=search.lower() if fuzzy else search, chars=fuzzy)
+        if not grams:
+            return self.schemas
+
+        found = sorted([table.get(x, set()) for x in grams], key=len)
+        return [self.schemas[idx] for idx in sorted(set.intersection(*found))]
+
+
 class Fields(ChildMixins):
     """API for working with fields for the parent asset type.
 
@@ -88,7 +177,34 @@ class Fields(ChildMixins):
             ...     print(f"title {title!r}, qualified name {name!r}, base name {name!r}")
 
         """
-        return parse_fields(raw=self._get().document_meta)
+        return self._disk_cached(
+            name=f"fields_{self.parent.ASSET_TYPE}",
+            func=lambda: parse_fields(raw=self._get().document_meta),
+        )
+
+    def get_index(self, adapter: str) -> SchemasIndex:
+        """Get the lookup tables for the field schemas of an adapter from :meth:`get`.
+
+        Args:
+            adapter: name of adapter returned by :meth:`get_adapter_name`
+
+        Notes:
+            The lookup tables are rebuilt when :meth:`get` returns a new result.
+        """
+        fields = self.get()
+        if self._indexes_fields is not fields:
+            self._indexes = {}
+            self._indexes_fields = fields
+
+        index = self._indexes.get(adapter)
+        if index is None:
+            index = self._indexes[adapter] = SchemasIndex(schemas=fields[adapter])
+        return index
+
+    def _init(self, parent):
+        """Post init method for subclasses to use for extra setup."""
+        self._indexes: Dict[str, SchemasIndex] = {}
+        self._indexes_fields: Optional[dict] = None
 
     def validate(
         self,
@@ -132,7 +248,8 @@ class Fields(ChildMixins):
 
         def add(items):
             for item in listify(items):
-                if item not in selected:
+                if item not in seen:
+                    seen.add(item)
                     selected.append(item)
 
         fields = listify(obj=fields)
@@ -140,6 +257,7 @@ class Fields(ChildMixins):
         fields_fuzzy = listify(obj=fields_fuzzy)
 
         selected: t.List[str] = []
+        seen: t.Set[str] = set()
 
         if fields_default and not fields_root:
             add(self.parent.fields_default)
@@ -212,10 +330,12 @@ class Fields(ChildMixins):
         fields = self.get()
         adapter = self.get_adapter_name(value=adapter)
         schemas = fields[adapter]
+        index = self.get_index(adapter=adapter)
         if fields_custom and adapter in fields_custom:
-            schemas += fields_custom[adapter]
+            schemas = schemas + fields_custom[adapter]
+            index = None
         schema = self.get_field_schema(
-            value=afield, schemas=schemas, selectable_only=selectable_only
+            value=afield, schemas=schemas, selectable_only=selectable_only, index=index
         )
         return schema[key] if key else schema
 
@@ -276,6 +396,7 @@ class Fields(ChildMixins):
         fields = self.get()
 
         matches = []
+        seen = set()
 
         for adapter_re, fields_re in splits:
             adapters = self.get_adapter_names(value=adapter_re)
@@ -289,8 +410,10 @@ class Fields(ChildMixins):
                     if root_only:
                         found_schemas = [x for x in found_schemas if x["is_root"]]
 
-                    names = [x[key] for x in found_schemas]
-                    matches += [x for x in names if x not in matches]
+                    for name in [x[key] for x in found_schemas]:
+                        if name not in seen:
+                            seen.add(name)
+                            matches.append(name)
         return matches
 
     def get_field_names_eq(
@@ -340,6 +463,7 @@ class Fields(ChildMixins):
                     schemas=schemas,
                     fields_error=fields_error,
                     selectable_only=selectable_only,
+                    index=self.get_index(adapter=adapter),
                 )
 
                 match = schema[key] if key else schema
@@ -376,7 +500,13 @@ class Fields(ChildMixins):
             adapter = self.get_adapter_name(value=adapter_name)
             for name in names:
                 schemas = fields[adapter]
-                amatches = self.fuzzy_filter(search=name, schemas=schemas, key=key, root_only=True)
+                amatches = self.fuzzy_filter(
+                    search=name,
+                    schemas=schemas,
+                    key=key,
+                    root_only=True,
+                    index=self.get_index(adapter=adapter),
+                )
                 matches += [x for x in amatches if x not in matches]
 
         return matches
@@ -425,6 +555,7 @@ class Fields(ChildMixins):
         root_only: bool = False,
         key: str = "name_qual",
         fuzzy_keys: List[str] = FUZZY_SCHEMAS_KEYS,
+        index: Optional[SchemasIndex] = None,
         **kwargs,
     ) -> List[dict]:
         """Perform a fuzzy search against a set of field schemas.
@@ -435,6 +566,8 @@ class Fields(ChildMixins):
             root_only: only search against schemas of root fields
             key: return the schema key value instead of the field schemas
             fuzzy_keys: list of keys to check search against in each field schema
+            index: lookup tables for schemas from :meth:`get_index` to only search the
+                schemas that can match
         """
 
         def do_skip(schema):
@@ -448,18 +581,24 @@ class Fields(ChildMixins):
 
             return False
 
+        def get_candidates(value, fuzzy):
+            if isinstance(index, SchemasIndex) and index.schemas is schemas:
+                return index.get_candidates(search=value, keys=fuzzy_keys, fuzzy=fuzzy)
+            return schemas
+
         matches = []
+        search_lower = search.strip().lower()
 
         # try to do string matches first
-        for schema in schemas:
+        for schema in get_candidates(value=search_lower, fuzzy=False):
             if not do_skip(schema) and any(
-                [search.strip().lower() in x for x in [schema[x] for x in fuzzy_keys]]
+                [search_lower in x for x in [schema[x] for x in fuzzy_keys]]
             ):
                 matches.append(schema)
 
         # if no string matches, try to find matches with fuzzyfinder
         if not matches:
-            for schema in schemas:
+            for schema in get_candidates(value=search, fuzzy=True):
                 if not do_skip(schema) and list(
                     fuzzyfinder(search, [schema[x] for x in fuzzy_keys])
                 ):
@@ -535,9 +674,8 @@ class Fields(ChildMixins):
             if not schema.get("selectable"):
                 continue
 
-            for key in keys:
-                if search.search(schema[key]) and schema not in matches:
-                    matches.append(schema)
+            if any(search.search(schema[key]) for key in keys) and schema not in matches:
+                matches.append(schema)
         return matches
 
     def get_field_schema(
@@ -547,6 +685,7 @@ class Fields(ChildMixins):
         keys: List[str] = GET_SCHEMA_KEYS,
         fields_error: bool = True,
         selectable_only: bool = True,
+        index: Optional[SchemasIndex] = None,
         **kwargs,
     ) -> dict:
         """Find a field name that equals a value.
@@ -555,6 +694,8 @@ class Fields(ChildMixins):
             value: name of field
             schemas: list of field schemas to search through
             keys: list of keys to check if value equals
+            index: lookup tables for schemas from :meth:`get_index` to find the field
+                without searching through schemas
             **kwargs: passed to :meth:`fuzzy_filter` to print fuzzy matches in error
                 if no matches found
 
@@ -563,13 +704,23 @@ class Fields(ChildMixins):
         """
         search = value.lower().strip()
 
+        if isinstance(index, SchemasIndex) and index.schemas is schemas:
+            schema = index.find(value=search, keys=keys, selectable_only=selectable_only)
+            if schema is not None:
+                return schema
+            kwargs["index"] = index
+            kwargs["schemas"] = schemas
+        else:
+            index = None
+
         if selectable_only:
             schemas = [x for x in schemas if x.get("selectable", True)]
 
-        for schema in schemas:
-            for key in keys:
-                if search.lower().strip() == schema[key].lower():
-                    return schema
+        if index is None:
+            for schema in schemas:
+                for key in keys:
+                    if search == schema[key].lower():
+                        return schema
 
         if not fields_error:
             self.LOG.debug(f"No schema found for field {search!r}, creating custom schema")
@@ -577,7 +728,7 @@ class Fields(ChildMixins):
             return schema
 
         kwargs["search"] = value
-        kwargs["schemas"] = schemas
+        kwargs.setdefault("schemas", schemas)
         kwargs["key"] = ""
         fuzzy = self.fuzzy_filter(**kwargs)
 
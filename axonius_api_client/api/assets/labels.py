@@ -1,14 +1,105 @@
 # -*- coding: utf-8 -*-
 """API for working with tags for assets."""
+import dataclasses
+import time
 from datetime import datetime, timedelta
-from typing import List, Optional, Union
+from typing import Callable, Iterable, Iterator, List, Optional, Union
 
-from ...tools import listify
+import requests
+
+from ...constants.api import (
+    LABELS_CHUNK_BYTES,
+    LABELS_CHUNK_SIZE,
+    LABELS_WORKERS,
+)
+from ...http import RetryPolicy
+from ...tools import bounded_map, chunk_by_size, listify
 from .. import json_api
 from ..api_endpoints import ApiEndpoints
 from ..mixins import ChildMixins
 
 
+@dataclasses.dataclass
+class LabelsChunk:
+    """Result of a single request of a bulk add or remove of tags."""
+
+    index: int
+    """Index of this chunk in the bulk operation."""
+
+    ids: List[str]
+    """internal_axon_id of assets in this chunk."""
+
+    value: int = 0
+    """Number of assets processed as reported by the API."""
+
+    attempts: int = 0
+    """Number of requests sent for this chunk."""
+
+    error: Optional[str] = None
+    """Error of the last request sent for this chunk, if it failed."""
+
+    @property
+    def failed(self) -> bool:
+        """Get if all attempts for this chunk failed."""
+        return self.error is not None
+
+
+@dataclasses.dataclass
+class LabelsBulkResult:
+    """Aggregate result of a bulk add or remove of tags."""
+
+    method: str
+    """Operation performed, either add or remove."""
+
+    labels: List[str]
+    """Tags that were added or removed."""
+
+    value: int = 0
+    """Number of assets processed as reported by the API across all chunks."""
+
+    ids: int = 0
+    """Number of asset IDs sent across all chunks."""
+
+    chunks: int = 0
+    """Number of chunks sent."""
+
+    failed: List[LabelsChunk] = dataclasses.field(default_factory=list)
+    """Chunks where every attempt failed."""
+
+    @property
+    def failed_ids(self) -> List[str]:
+        """Get the internal_axon_id of assets in failed chunks, to retry them."""
+        return [x for chunk in self.failed for x in chunk.ids]
+
+    def add_chunk(self, chunk: LabelsChunk):
+        """Add the result of a chunk to this aggregate result.
+
+        Args:
+            chunk: result of a chunk
+        """
+        self.chunks += 1
+        self.ids += len(chunk.ids)
+        self.value += chunk.value
+        if chunk.failed:
+            self.failed.append(chunk)
+
+    def __str__(self) -> str:
+        """Pass."""
+        items = [
+            f"method={self.method!r}",
+            f"labels={self.labels}",
+            f"value={self.value}",
+            f"ids={self.ids}",
+            f"chunks={self.chunks}",
+            f"failed={len(self.failed)}",
+        ]
+        return f"{self.__class__.__name__}({', '.join(items)})"
+
+    def __repr__(self) -> str:
+        """Pass."""
+        return self.__str__()
+
+
 class Labels(ChildMixins):
     """API for working with tags for the parent asset type.
 
@@ -16,6 +107,8 @@ class Labels(ChildMixins):
         * Get all known tags: :meth:`get`
         * Add tags to assets: :meth:`add`
         * Remove tags from assets: :meth:`remove`
+        * Add tags to a large number of assets: :meth:`add_bulk`
+        * Remove tags from a large number of assets: :meth:`remove_bulk`
 
     See Also:
         * Device assets :obj:`axonius_api_client.api.assets.devices.Devices`
@@ -133,8 +226,81 @@ class Labels(ChildMixins):
         expirable_tags: List[dict] = self._set_expirable_tags(expirations=expirable_tags)
         return self._add(labels=labels, ids=ids, include=not invert_selection, expirable_tags=expirable_tags).value
 
+    def add_bulk(
+        self,
+        rows: Iterable[Union[dict, str]],
+        labels: List[str],
+        expirable_tags: Optional[dict] = None,
+        chunk_size: int = LABELS_CHUNK_SIZE,
+        chunk_bytes: Optional[int] = LABELS_CHUNK_BYTES,
+        workers: int = LABELS_WORKERS,
+        retry_policy: Optional[RetryPolicy] = None,
+        progress: Optional[Callable[[LabelsBulkResult], None]] = None,
+    ) -> LabelsBulkResult:
+        """Add tags to a large number of assets in chunks.
+
+        Examples:
+            Tag every asset returned by a query without holding them all in memory
+
+            >>> import axonius_api_client as axonapi
+            >>> connect_args: dict = axonapi.get_env_connect()
+            >>> client: axonapi.Connect = axonapi.Connect(**connect_args)
+            >>> apiobj: axonapi.api.assets.AssetMixin = client.devices
+            >>>       # or client.users or client.vulnerabilities
+            >>> rows = apiobj.get_generator(query='(adapters == "aws_adapter")', fields=[])
+            >>> result = apiobj.labels.add_bulk(rows=rows, labels=['aws'], workers=4)
+            >>> result.value
+            500000
+
+            Retry the chunks that failed
+
+            >>> if result.failed:
+            ...     result = apiobj.labels.add_bulk(rows=result.failed_ids, labels=['aws'])
+
+        Args:
+            rows: internal_axon_id strs or assets returned from a get method, consumed lazily
+            labels: tags to add
+            expirable_tags: Dict with tag name and expiration_date (string or int) as keys
+            chunk_size: maximum number of assets to send in each request
+            chunk_bytes: maximum size in bytes of the asset IDs to send in each request
+            workers: number of requests to send concurrently
+            retry_policy: policy for retrying a chunk that failed, defaults to the retry policy
+                of the HTTP client
+            progress: called with the aggregate result after each chunk is done
+
+        Notes:
+            Each chunk is sent as its own request, so this is not atomic: if some chunks fail,
+            the tags are still added to the assets in the chunks that did not fail. Use
+            ``failed`` and ``failed_ids`` of the result to find and retry the failed chunks.
+
+        Returns:
+            aggregate result of all chunks, including the chunks that failed
+        """
+        expirable_tags: List[dict] = self._set_expirable_tags(expirations=expirable_tags)
+
+        def method(ids: List[str], http_args: Optional[dict] = None) -> json_api.generic.IntValue:
+            return self._add(
+                labels=labels, ids=ids, expirable_tags=expirable_tags, http_args=http_args
+            )
+
+        return self._bulk(
+            method=method,
+            result=LabelsBulkResult(method="add", labels=listify(labels)),
+            rows=rows,
+            chunk_size=chunk_size,
+            chunk_bytes=chunk_bytes,
+            workers=workers,
+            retry_policy=retry_policy,
+            progress=progress,
+        )
+
     def _add(
-        self, labels: List[str], ids: List[str], include: bool = True, expirable_tags: List[dict] = None,
+        self,
+        labels: List[str],
+        ids: List[str],
+        include: bool = True,
+        expirable_tags: List[dict] = None,
+        http_args: Optional[dict] = None,
     ) -> json_api.generic.IntValue:
         """Direct API method to add labels/tags to assets.
 
@@ -144,6 +310,7 @@ class Labels(ChildMixins):
             include: True=add tags to assets that ARE supplied in rows;
                 False=add tags to assets that ARE NOT supplied in rows
             expirable_tags: List of dicts, each dict with tag name and expiration_date
+            http_args: Arguments to pass to the HTTP request
         """
         api_endpoint = ApiEndpoints.assets.tags_add
 
@@ -152,7 +319,10 @@ class Labels(ChildMixins):
             entities=entities, labels=listify(labels), expirable_tags=expirable_tags,
         )
         return api_endpoint.perform_request(
-            http=self.auth.http, request_obj=request_obj, asset_type=self.asset_type
+            http=self.auth.http,
+            request_obj=request_obj,
+            asset_type=self.asset_type,
+            http_args=http_args,
         )
 
     def remove(self, rows: List[dict], labels: List[str], invert_selection: bool = False) -> int:
@@ -181,8 +351,177 @@ class Labels(ChildMixins):
         ids: List[str] = self._get_ids(rows=rows)
         return self._remove(labels=labels, ids=ids, include=not invert_selection).value
 
+    def remove_bulk(
+        self,
+        rows: Iterable[Union[dict, str]],
+        labels: List[str],
+        chunk_size: int = LABELS_CHUNK_SIZE,
+        chunk_bytes: Optional[int] = LABELS_CHUNK_BYTES,
+        workers: int = LABELS_WORKERS,
+        retry_policy: Optional[RetryPolicy] = None,
+        progress: Optional[Callable[[LabelsBulkResult], None]] = None,
+    ) -> LabelsBulkResult:
+        """Remove tags from a large number of assets in chunks.
+
+        Examples:
+            See :meth:`add_bulk`
+
+        Notes:
+            Each chunk is sent as its own request, so this is not atomic, see :meth:`add_bulk`.
+
+        Args:
+            rows: internal_axon_id strs or assets returned from a get method, consumed lazily
+            labels: tags to remove
+            chunk_size: maximum number of assets to send in each request
+            chunk_bytes: maximum size in bytes of the asset IDs to send in each request
+            workers: number of requests to send concurrently
+            retry_policy: policy for retrying a chunk that failed, defaults to the retry policy
+                of the HTTP client
+            progress: called with the aggregate result after each chunk is done
+
+        Returns:
+            aggregate result of all chunks, including the chunks that failed
+        """
+
+        def method(ids: List[str], http_args: Optional[dict] = None) -> json_api.generic.IntValue:
+            return self._remove(labels=labels, ids=ids, http_args=http_args)
+
+        return self._bulk(
+            method=method,
+            result=LabelsBulkResult(method="remove", labels=listify(labels)),
+            rows=rows,
+            chunk_size=chunk_size,
+            chunk_bytes=chunk_bytes,
+            workers=workers,
+            retry_policy=retry_policy,
+            progress=progress,
+        )
+
+    def _bulk(
+        self,
+        method: Callable[..., json_api.generic.IntValue],
+        result: LabelsBulkResult,
+        rows: Iterable[Union[dict, str]],
+        chunk_size: int = LABELS_CHUNK_SIZE,
+        chunk_bytes: Optional[int] = LABELS_CHUNK_BYTES,
+        workers: int = LABELS_WORKERS,
+        retry_policy: Optional[RetryPolicy] = None,
+        progress: Optional[Callable[[LabelsBulkResult], None]] = None,
+    ) -> LabelsBulkResult:
+        """Send chunks of asset IDs to a direct API method, several at a time.
+
+        Notes:
+            At most ``workers`` chunks are being sent or waiting to be added to the result
+            at any time, so rows can be a generator of any number of assets.
+
+        Args:
+            method: direct API method to call with each chunk of asset IDs and http_args
+            result: aggregate result to add the result of each chunk to
+            rows: internal_axon_id strs or assets returned from a get method, consumed lazily
+            chunk_size: maximum number of assets to send in each request
+            chunk_bytes: maximum size in bytes of the asset IDs to send in each request
+            workers: number of requests to send concurrently
+            retry_policy: policy for retrying a chunk that failed, defaults to the retry policy
+                of the HTTP client
+            progress: called with the aggregate result after each chunk is done
+        """
+        rows = [rows] if isinstance(rows, (str, dict)) else rows
+        ids: Iterator[str] = (x["internal_axon_id"] if isinstance(x, dict) else x for x in rows)
+        chunks: Iterator[LabelsChunk] = (
+            LabelsChunk(index=index, ids=chunk_ids)
+            for index, chunk_ids in enumerate(
+                chunk_by_size(iterable=ids, max_items=chunk_size, max_bytes=chunk_bytes)
+            )
+        )
+
+        for _, future in bounded_map(
+            func=lambda x: self._bulk_chunk(method=method, chunk=x, retry_policy=retry_policy),
+            iterable=chunks,
+            workers=workers,
+            default=LABELS_WORKERS,
+            name="labels_bulk",
+        ):
+            result.add_chunk(future.result())
+            if callable(progress):
+                progress(result)
+
+        self.LOG.info(f"Finished bulk {result.method} of tags: {result}")
+        return result
+
+    def _bulk_chunk(
+        self,
+        method: Callable[..., json_api.generic.IntValue],
+        chunk: LabelsChunk,
+        retry_policy: Optional[RetryPolicy] = None,
+    ) -> LabelsChunk:
+        """Send a chunk of asset IDs to a direct API method, retrying if it fails.
+
+        Notes:
+            Each request for a chunk is sent with the retries of
+            :obj:`axonius_api_client.http.Http` turned off, so retry_policy is only applied
+            once per chunk. Adding or removing the same tags again is harmless, so a chunk is
+            retried for any error that retry_policy would retry for an idempotent request.
+
+        Args:
+            method: direct API method to call with the asset IDs of chunk and http_args
+            chunk: chunk to send
+            retry_policy: policy for retrying a chunk that failed, defaults to the retry policy
+                of the HTTP client
+        """
+        policy: RetryPolicy = retry_policy or self.auth.http.RETRY_POLICY
+        http_args: dict = {"retry_policy": RetryPolicy(max_attempts=1)}
+        waited: float = 0.0
+        while True:
+            chunk.attempts += 1
+            try:
+                chunk.value = method(ids=chunk.ids, http_args=http_args).value
+                chunk.error = None
+                return chunk
+            except Exception as exc:
+                chunk.error = f"{type(exc).__name__}: {exc}"
+                delay: Optional[float] = self._get_retry_delay(
+                    policy=policy, attempt=chunk.attempts, waited=waited, exc=exc
+                )
+
+            if delay is None:
+                self.LOG.error(
+                    f"Chunk {chunk.index} with {len(chunk.ids)} assets failed after "
+                    f"{chunk.attempts} attempts: {chunk.error}"
+                )
+                return chunk
+
+            self.LOG.warning(
+                f"Chunk {chunk.index} with {len(chunk.ids)} assets failed on attempt "
+                f"{chunk.attempts}, retrying in {delay:.2f} seconds: {chunk.error}"
+            )
+            time.sleep(delay)
+            waited += delay
+
+    @staticmethod
+    def _get_retry_delay(
+        policy: RetryPolicy, attempt: int, waited: float, exc: Exception
+    ) -> Optional[float]:
+        """Get the seconds to wait before retrying a chunk, or None to not retry it.
+
+        Args:
+            policy: policy for retrying a chunk that failed
+            attempt: number of attempts sent so far for the chunk
+            waited: seconds waited between the attempts sent so far for the chunk
+            exc: error raised by the last attempt
+        """
+        response = getattr(exc, "response", None)
+        if isinstance(response, requests.Response):
+            return policy.get_delay(
+                attempt=attempt, waited=waited, response=response, idempotent=True
+            )
+        return policy.get_delay(attempt=attempt, waited=waited, exc=exc, idempotent=True)
+
     def _remove(
-        self, labels: List[str], ids: List[str], include: bool = True
+        self,
+        labels: List[str],
+        ids: List[str],
+        include: bool = True,
+        http_args: Optional[dict] = None,
     ) -> json_api.generic.IntValue:
         """Direct API method to remove labels/tags from assets.
 
@@ -191,13 +530,17 @@ class Labels(ChildMixins):
             ids: internal_axon_id of assets to remove tags from
             include: True=remove tags from assets that ARE supplied in rows;
                 False=remove tags from assets that ARE NOT supplied in rows
+            http_args: Arguments to pass to the HTTP request
         """
         api_endpoint = ApiEndpoints.assets.tags_remove
 
         entities = {"ids": listify(ids), "include": include}
         request_obj = api_endpoint.load_request(entities=entities, labels=listify(labels))
         return api_endpoint.perform_request(
-            http=self.auth.http, request_obj=request_obj, asset_type=self.asset_type
+            http=self.auth.http,
+            request_obj=request_obj,
+            asset_type=self.asset_type,
+            http_args=http_args,
         )
 
     @staticmethod
@@ -5,11 +5,20 @@ import logging
 import textwrap
 import typing as t
 
+from ...constants.api import RUNNER_CHUNK_SIZE, RUNNER_WORKERS
 from ...constants.fields import AXID
 from ...data import BaseData
 from ...exceptions import RunnerError, RunnerWarning
 from ...parsers.grabber import Grabber, Mixins
-from ...tools import confirm, csv_able, is_str, listify, style_switch
+from ...tools import (
+    bounded_map,
+    chunk_by_size,
+    confirm,
+    csv_able,
+    is_str,
+    listify,
+    style_switch,
+)
 
 # from .. import json_api
 from ..json_api.enforcements import (
@@ -32,7 +41,7 @@ NOTES: str = """# Run Enforcement via manual selection
 ## Required Arguments
 
 - $eset (str): name or uuid of enforcement set to run
-- $ids (list[str]): list of internal_axon_id's to run $eset against
+- $ids (list[str]): list of internal_axon_id's to run $eset against, duplicates removed
 
 ## Optional Arguments
 
@@ -41,12 +50,20 @@ NOTES: str = """# Run Enforcement via manual selection
 - $prompt (bool): default=True if running from axonshell else False
 - $do_echo (bool): default=False
 - $refetch (bool): default=False
+- $chunk_size (int): default=1000
+- $workers (int): default=4
+- $run_chunked (bool): default=False
 
 ## Calculations
 
 - $ids_csv (str): comma separated list of $ids
 - $query (str): build AQL like "internal_axon_id in [$ids_csv]"
-- $count_result (int): get the count of $query from the API
+- $chunks (list[list[str]]): $ids split into lists of at most $chunk_size
+- $count_results (list[int]): get the count of a $query for each of $chunks from the API,
+  $workers at a time
+- $count_result (int): sum of $count_results
+- $count_mismatches (list[dict]): $chunks where the count of Asset IDs does not equal the
+  count from the API
 - $count_ids (int): the count of supplied $ids
 - $count_warn (int): 100
 - $count_error (int): 100000
@@ -97,7 +114,10 @@ NOTES: str = """# Run Enforcement via manual selection
 - If $verified is False:
   - If $force=False: ERROR(verified is False, must supply force=True)
   - if $force=True: RUN(running with force=True)
-- Send API request to execute
+- If $run_chunked:
+  - Send API request to execute for each of $chunks
+- If not $run_chunked:
+  - Send API request to execute
 """
 NOTES_DOC: str = textwrap.indent(NOTES.lstrip(), prefix=" " * 8)
 
@@ -114,12 +134,15 @@ class Runner(BaseData, Mixins):
             for making calls
         eset (ENFORCEMENT): name, uuid, or Enforcement Set object to run
         ids (t.Union[str, t.List[str]]): Asset IDs to run Enforcement Set against,
-            csv-like string or list of csv-like strings
+            csv-like string or list of csv-like strings, duplicates are removed
         verified (bool): $ids already verified, just run $eset against $ids
         verify_count (bool): Verify that the count of $query equals the count of $ids
         prompt (bool): Prompt user for verification when applicable.
         do_echo (bool): Echo output to console as well as log
         refetch (bool): refetch $eset even if it is a model
+        chunk_size (int): maximum number of Asset IDs in each query used to verify $ids
+        workers (int): number of count queries to send concurrently to verify $ids
+        run_chunked (bool): run $eset against $chunks of $ids in separate requests
     """
 
     apiobj: object
@@ -158,9 +181,20 @@ class Runner(BaseData, Mixins):
     grabber: t.Optional[Grabber] = None
     """Grabber used to get IDs."""
 
+    chunk_size: int = RUNNER_CHUNK_SIZE
+    """maximum number of Asset IDs in each query used to verify $ids"""
+
+    workers: int = RUNNER_WORKERS
+    """number of count queries to send concurrently to verify $ids"""
+
+    run_chunked: bool = False
+    """run $eset against $chunks of $ids in separate requests"""
+
     log: t.ClassVar[logging.Logger] = None
     result: t.ClassVar[str] = None
     _count_result: t.ClassVar[int] = None
+    _count_results: t.ClassVar[t.Optional[t.List[int]]] = None
+    _chunks: t.ClassVar[t.Optional[t.List[t.List[str]]]] = None
     _initialized: t.ClassVar[bool] = False
     _executed: t.ClassVar[bool] = False
     _count_warn: t.ClassVar[int] = 100
@@ -248,6 +282,7 @@ class Runner(BaseData, Mixins):
         if not self._initialized or redo:
             self.log = self.apiobj.LOG.getChild(self.__class__.__name__)
             self._count_result = None
+            self._count_results = None
             self._result = None
             self._initialized = False
             self._executed = False
@@ -275,7 +310,7 @@ class Runner(BaseData, Mixins):
             self.spew(msgs=self.state, warn=True)
         else:
             self.state = self._tstate_count_mismatches
-            self.spew(msgs=[self.state, self._trerun], exc=True)
+            self.spew(msgs=[self.state, *self._tcount_mismatches, self._trerun], exc=True)
 
     def _check_count_prompt(self):
         self.verified = self.confirm(action=self._tcount_action, default=self.is_match)
@@ -311,9 +346,31 @@ class Runner(BaseData, Mixins):
         """Get $count_result from API using $query as a filter."""
         if refetch or not isinstance(self.count_result, int):
             self.state = self._tstate_get_count
-            self.count_result = self.apiobj.count(query=self.query)
+            self.count_results = self._get_counts()
+            self.count_result = sum(self.count_results)
             self.state = self._tstate_got_count
 
+    def _get_counts(self) -> t.List[int]:
+        """Get the count of assets matching the query of each of $chunks, $workers at a time."""
+        chunks: t.List[t.List[str]] = self.chunks
+        if len(chunks) <= 1:
+            return [self.apiobj.count(query=self.query)]
+
+        counts = bounded_map(
+            func=lambda x: self.apiobj.count(query=self.get_query(ids=x)),
+            iterable=chunks,
+            workers=self.workers,
+            default=RUNNER_WORKERS,
+            name="runner_count",
+        )
+        return [future.result() for _, future in counts]
+
+    @staticmethod
+    def get_query(ids: t.List[str]) -> str:
+        """Build AQL to use to get count of assets matching a list of Asset IDs."""
+        ids_csv: str = ", ".join([f'"{x}"' for x in ids])
+        return f'("{AXID.name}" in [{ids_csv}])'
+
     def infos(self, msgs: t.Optional[t.List[str]] = None, top: bool = True) -> t.List[str]:
         """Get info on runner."""
         ret = []
@@ -335,7 +392,14 @@ class Runner(BaseData, Mixins):
     @property
     def query(self) -> str:
         """AQL to use to get count of assets matching $ids."""
-        return f'("{AXID.name}" in [{self.ids_csv}])'
+        return self.get_query(ids=self.ids)
+
+    @property
+    def chunks(self) -> t.List[t.List[str]]:
+        """$ids split into lists of at most $chunk_size Asset IDs."""
+        if self._chunks is None:
+            self._chunks = list(chunk_by_size(iterable=self.ids, max_items=self.chunk_size))
+        return self._chunks
 
     @property
     def executed(self) -> bool:
@@ -370,6 +434,25 @@ class Runner(BaseData, Mixins):
     def count_result(self, value: int):
         self._count_result = value
 
+    @property
+    def count_results(self) -> t.Optional[t.List[int]]:
+        """The count of Asset IDs fetched from API for each of $chunks."""
+        return self._count_results
+
+    @count_results.setter
+    def count_results(self, value: t.List[int]):
+        self._count_results = value
+
+    @property
+    def count_mismatches(self) -> t.List[dict]:
+        """$chunks where the count of Asset IDs does not equal the count from the API."""
+        ret = []
+        if isinstance(self.count_results, list):
+            for index, (ids, count) in enumerate(zip(self.chunks, self.count_results)):
+                if len(ids) != count:
+                    ret.append({"chunk": index, "count_ids": len(ids), "count_result": count})
+        return ret
+
     @property
     def is_match(self) -> t.Optional[bool]:
         """$count_ids equals $count_result."""
@@ -451,6 +534,21 @@ class Runner(BaseData, Mixins):
             ]
         return ["Enforcement Set Details:", *[f"  {x}" for x in details]]
 
+    @property
+    def _tcount_mismatches(self) -> t.List[str]:
+        mismatches = self.count_mismatches
+        if len(self.chunks) <= 1 or not mismatches:
+            return []
+        chunks = len(self.chunks)
+        return [
+            f"$count_result mismatched in {len(mismatches)} out of {chunks} chunks:",
+            *[
+                f"  chunk {x['chunk'] + 1}: {x['count_result']} found for "
+                f"{x['count_ids']} Asset IDs"
+                for x in mismatches
+            ],
+        ]
+
     @property
     def _tmatch(self) -> str:
         return "match" if self.is_match else "MISMATCH"
@@ -517,7 +615,10 @@ class Runner(BaseData, Mixins):
 
     @property
     def _tget_count_post(self) -> str:
-        return f"using $query built from $count_ids={self.count_ids} Asset IDs"
+        return (
+            f"using $query built from $count_ids={self.count_ids} Asset IDs "
+            f"in {len(self.chunks)} chunks"
+        )
 
     @property
     def _tstate_get_count(self) -> str:
@@ -539,7 +640,11 @@ class Runner(BaseData, Mixins):
         """Actual workflow to run an Enforcement Set."""
         self.state = self._tstate_run
         ret = self.apiobj._run_enforcement(
-            name=self.eset.name, ids=self.ids, fields=self.src_fields, query=self.src_query
+            name=self.eset.name,
+            ids=self.ids,
+            fields=self.src_fields,
+            query=self.src_query,
+            chunk_size=self.chunk_size if self.run_chunked else None,
         )
         self.state = self._tstate_ran
         return ret
@@ -567,7 +672,14 @@ class Runner(BaseData, Mixins):
 
     @property
     def _info_calcs(self) -> t.List[str]:
-        return ["count_warn", "count_error", "count_ids", "count_result", "is_match"]
+        return [
+            "count_warn",
+            "count_error",
+            "count_ids",
+            "count_result",
+            "count_mismatches",
+            "is_match",
+        ]
 
     def _info_calcs_desc(self) -> dict:
         """Descriptions for calculations section."""
@@ -587,7 +699,7 @@ class Runner(BaseData, Mixins):
         if self.prompt:
             self.do_echo = True
 
-        ids = [x for x in csv_able(self.ids) if AXID.is_axid(x)]
+        ids = list(dict.fromkeys([x for x in csv_able(self.ids) if AXID.is_axid(x)]))
 
         if not ids:
             raise RunnerError(self.infos(msgs=[self._tno_ids, self._tids, "", *AXID.rules]))
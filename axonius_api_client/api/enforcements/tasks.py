@@ -9,7 +9,13 @@ from ..json_api.paging_state import Page, PagingState
 from ..json_api.tasks import GetTasks, Task, TaskBasic, TaskFilters, TaskFull, TaskTypes
 from ..json_api.tasks.get_tasks import TypeOperator
 from ..mixins import ModelMixins
-from ...constants.api import RE_PREFIX, TASK_SLOW_WARNING
+from ...constants.api import (
+    RE_PREFIX,
+    TASK_FULL_ERROR,
+    TASK_FULL_ERRORS,
+    TASK_FULL_WORKERS,
+    TASK_SLOW_WARNING,
+)
 from ...constants.ctypes import (
     PatternLike,
     TypeDelta,
@@ -20,7 +26,8 @@ from ...constants.ctypes import (
     TypeBool,
 )
 from ...constants.general import SPLITTER
-from ...tools import echo_debug, json_dump
+from ...exceptions import ApiError
+from ...tools import bounded_map, echo_debug, json_dump
 
 
 class Tasks(ModelMixins):
@@ -238,6 +245,9 @@ class Tasks(ModelMixins):
         log_level: t.Union[int, str] = PagingState.log_level,
         request_obj: t.Optional[GetTasks] = None,
         echo: bool = True,
+        workers: int = TASK_FULL_WORKERS,
+        errors: str = TASK_FULL_ERROR,
+        progress: t.Optional[t.Callable[[int, int], None]] = None,
         **kwargs,
     ) -> t.Generator[TaskTypes, None, None]:
         """Get all tasks for all enforcements in multiple model formats.
@@ -252,10 +262,13 @@ class Tasks(ModelMixins):
             log_level: log level to use
             request_obj: request object to use, will create using above args if not provided
             echo: echo debug output
+            workers: if not as_basic, see :meth:`get_full_generator`
+            errors: if not as_basic, see :meth:`get_full_generator`
+            progress: if not as_basic, see :meth:`get_full_generator`
             **kwargs: passed to :meth:`build_get_request`
         """
         request_obj: GetTasks = self.build_get_request(request_obj=request_obj, **kwargs)
-        for basic in self.direct_get_generator(
+        basics: t.Generator[TaskBasic, None, None] = self.direct_get_generator(
             page_sleep=page_sleep,
             page_size=page_size,
             row_start=row_start,
@@ -264,19 +277,72 @@ class Tasks(ModelMixins):
             echo=echo,
             request_obj=request_obj,
             slow_warning=not as_basic,
+        )
+        if as_basic:
+            yield from basics
+            return
+
+        # only get the full model if we need it
+        # this is because we can only get one full model per request
+        # which can take quite a long time if there are many tasks
+        for basic, full in self.get_full_generator(
+            basics=basics, workers=workers, errors=errors, progress=progress
         ):
-            if as_basic:
-                yield basic
+            if as_full:
+                yield full
             else:
-                # only get the full model if we need it
-                # this is because we can only get one full model at a time
-                # which can take quite a long time if there are many tasks
-                # this could be async but that's a problem for future me
-                full: TaskFull = basic.get_full()
-                if as_full:
-                    yield full
-                else:
-                    yield Task.load(basic=basic, full=full, http=self.auth.http)
+                yield Task.load(basic=basic, full=full, http=self.auth.http)
+
+    def get_full_generator(
+        self,
+        basics: t.Iterable[TaskBasic],
+        workers: int = TASK_FULL_WORKERS,
+        errors: str = TASK_FULL_ERROR,
+        progress: t.Optional[t.Callable[[int, int], None]] = None,
+    ) -> t.Generator[t.Tuple[TaskBasic, TaskFull], None, None]:
+        """Get the full model of tasks in basic model, fetching several at a time.
+
+        Notes:
+            At most ``workers`` full models are requested or waiting to be yielded at any
+            time, and they are yielded in the same order as ``basics``.
+
+        Args:
+            basics: tasks in basic model to get the full model of
+            workers: number of full models to fetch at a time
+            errors: how to handle an error getting the full model of a task,
+                one of :data:`axonius_api_client.constants.api.TASK_FULL_ERRORS`
+            progress: called with the number of tasks done and the number of tasks that
+                failed after each task is done
+
+        Yields:
+            tuple of (basic model, full model) for each task
+        """
+        if errors not in TASK_FULL_ERRORS:
+            raise ApiError(f"Invalid errors {errors!r}, valid: {TASK_FULL_ERRORS}")
+
+        done: int = 0
+        failed: int = 0
+        for basic, future in bounded_map(
+            func=lambda x: x.get_full(),
+            iterable=basics,
+            workers=workers,
+            default=TASK_FULL_WORKERS,
+            name="tasks_full",
+        ):
+            try:
+                full: t.Optional[TaskFull] = future.result()
+            except Exception as exc:
+                if errors == "raise":
+                    raise
+                full = None
+                failed += 1
+                self.LOG.warning(f"Skipping task {basic.uuid}, unable to get full model: {exc}")
+
+            done += 1
+            if callable(progress):
+                progress(done, failed)
+            if full is not None:
+                yield basic, full
 
     def direct_get_generator(
         self,
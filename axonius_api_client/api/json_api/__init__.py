@@ -1,40 +1,7 @@
 # -*- coding: utf-8 -*-
 """Models for API requests & responses."""
-
-from . import (
-    account,
-    adapters,
-    assets,
-    audit_logs,
-    base,
-    base2,
-    central_core,
-    count_operator,
-    custom_fields,
-    dashboard_spaces,
-    data_scopes,
-    duration_operator,
-    enforcements,
-    folders,
-    generic,
-    instances,
-    lifecycle,
-    nested_access,
-    paging_state,
-    password_reset,
-    remote_support,
-    resources,
-    saved_queries,
-    selection,
-    signup,
-    spaces_export,
-    system_meta,
-    system_roles,
-    system_settings,
-    system_users,
-    tasks,
-    time_range,
-)
+import importlib
+import typing as t
 
 __all__ = (
     "data_scopes",
@@ -70,3 +37,15 @@ __all__ = (
     "nested_access",
     "count_operator",
 )
+
+
+def __getattr__(name: str) -> t.Any:
+    """Import the model module for ``name`` on first access (PEP 562)."""
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return importlib.import_module(f".{name}", __name__)
+
+
+def __dir__() -> t.List[str]:
+    """Get the names of this module including the modules that are imported on first access."""
+    return sorted(set(globals()) | set(__all__))
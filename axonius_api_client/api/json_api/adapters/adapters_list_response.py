@@ -39,7 +39,7 @@ class AdaptersList(Metadata):
         items = self.document_meta["adapter_list"]
         self.adapters = {}
         for item in items:
-            name_raw = item["name"]
+            name_raw = item.get("name_raw", item["name"])
             name = self._get_aname(name_raw)
             item["name_raw"] = name_raw
             item["name"] = name
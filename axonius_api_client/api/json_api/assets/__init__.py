@@ -4,11 +4,13 @@
 from .asset_id_request import AssetByIdRequest, AssetByIdRequestSchema
 from .asset_id_response import AssetById, AssetByIdSchema
 from .asset_request import AssetRequest, AssetRequestSchema
-from .asset_response import AssetsPage
+from .asset_response import AssetsPage, AssetsPageStream
 from .count_request import CountRequest, CountRequestSchema
 from .count_response import Count, CountSchema
 from .destroy_request import DestroyRequest, DestroyRequestSchema
 from .destroy_response import Destroy, DestroySchema
+from .fetch_checkpoint import FetchCheckpoint
+from .fetch_telemetry import FetchTelemetry
 from .fields_response import Fields, FieldsSchema
 from .history_dates_human import AssetTypeHistoryDate, AssetTypeHistoryDates
 from .history_dates_response import HistoryDates, HistoryDatesSchema
@@ -26,6 +28,7 @@ __all__ = (
     "AssetTypeHistoryDate",
     "AssetTypeHistoryDates",
     "AssetsPage",
+    "AssetsPageStream",
     "Count",
     "CountRequest",
     "CountRequestSchema",
@@ -34,6 +37,8 @@ __all__ = (
     "DestroyRequest",
     "DestroyRequestSchema",
     "DestroySchema",
+    "FetchCheckpoint",
+    "FetchTelemetry",
     "Fields",
     "FieldsSchema",
     "HistoryDates",
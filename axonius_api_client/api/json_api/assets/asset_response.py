@@ -3,11 +3,15 @@
 import dataclasses
 import datetime
 import logging
+import time
 import typing as t
 
-from ....constants.api import MAX_PAGE_SIZE, PAGE_SIZE
+import requests
+
+from ....constants.api import MAX_PAGE_SIZE, PAGE_SIZE, STREAM_CHUNK_SIZE
 from ....exceptions import StopFetch
-from ....tools import dt_now, dt_sec_ago, json_dump, parse_int_min_max
+from ....logs import lazy_json
+from ....tools import dt_now, dt_sec_ago, json_stream_items, parse_int_min_max
 from ..base import BaseModel
 
 LOGGER = logging.getLogger(__name__)
@@ -166,6 +170,12 @@ class AssetsPage(BaseModel):
         """Count of assets returned on this page."""
         return len(self.assets)
 
+    @property
+    def response_bytes(self) -> int:
+        """Size of the body of the response for this page."""
+        response = getattr(self, "RESPONSE", None)
+        return len(response.content or b"") if response is not None else 0
+
     @classmethod
     def create_state(
         cls,
@@ -175,7 +185,7 @@ class AssetsPage(BaseModel):
         page_size: int = PAGE_SIZE,
         page_start: int = 0,
         row_start: int = 0,
-        initial_count: int = 0,
+        initial_count: t.Optional[int] = 0,
     ) -> dict:
         """Pass."""
         max_rows = parse_int_min_max(value=max_rows, default=0, min_value=0)
@@ -203,6 +213,8 @@ class AssetsPage(BaseModel):
             "page_size": page_size,
             "page_sleep": page_sleep,
             "page_start": page_start,
+            "prefetch_seconds_fetch_stalled": 0,
+            "prefetch_seconds_process_stalled": 0,
             "pages_to_fetch_left": 0,
             "pages_to_fetch_total": 0,
             "rows_fetched_this_page": 0,
@@ -219,7 +231,7 @@ class AssetsPage(BaseModel):
 
     def process_page(self, state: dict, start_dt: datetime.datetime, apiobj) -> dict:
         """Pass."""
-        apiobj.LOG.debug(f"FETCHED PAGE: {self}")
+        apiobj.LOG.debug("FETCHED PAGE: %s", self)
 
         this_page_took = dt_sec_ago(obj=start_dt, exact=True)
         init_count = state["rows_initial_count"]
@@ -246,10 +258,10 @@ class AssetsPage(BaseModel):
         state["page_cursor"] = self.cursor
         state["page_number"] = self.page_number
 
-        if not self.assets:
+        if not self.asset_count_page:
             state = self.process_stop(state=state, reason="no more rows returned", apiobj=apiobj)
 
-        apiobj.LOG.debug(f"CURRENT PAGING STATE: {json_dump(state)}")
+        apiobj.LOG.debug("CURRENT PAGING STATE: %s", lazy_json(state))
         return state
 
     def start_row(self, state: dict, apiobj, row: dict) -> dict:
@@ -274,7 +286,7 @@ class AssetsPage(BaseModel):
             )
         state["page_loop"] += 1
         process_page_took = dt_sec_ago(obj=self.page_start_dt, exact=True)
-        apiobj.LOG.debug(f"Processing page took {process_page_took} seconds")
+        apiobj.LOG.debug("Processing page took %s seconds", process_page_took)
         return state
 
     @staticmethod
@@ -290,3 +302,76 @@ class AssetsPage(BaseModel):
     def get_schema_cls() -> t.Any:
         """Pass."""
         return None
+
+
+# noinspection PyAttributeOutsideInit
+@dataclasses.dataclass
+class AssetsPageStream(AssetsPage):
+    """Model for a page of assets that is deserialized as the assets are iterated over.
+
+    Notes:
+        :attr:`assets` is a generator that can only be iterated over once. The page metadata in
+        :attr:`meta` is sent after the assets by the REST API, so it and everything derived
+        from it (i.e. :attr:`cursor` and :attr:`page`) is only populated once :attr:`assets`
+        has been exhausted.
+    """
+
+    @classmethod
+    def load_response_stream(
+        cls, response: requests.Response, chunk_size: int = STREAM_CHUNK_SIZE, **kwargs
+    ) -> "AssetsPageStream":
+        """Create a page that deserializes assets from the body of a streamed response.
+
+        Args:
+            response: response sent with stream=True that has not had its body read yet
+            chunk_size: number of bytes to read from the response at a time
+            **kwargs: passed to :meth:`_post_load_attrs`
+        """
+        obj = cls(assets=None)
+        obj.RESPONSE = response
+        obj.RESPONSE_LOAD_SECONDS = 0.0
+        obj._asset_count_page = 0
+        obj._response_bytes = 0
+        obj._others = {}
+        obj._items = json_stream_items(
+            chunks=obj._iter_chunks(chunk_size=chunk_size), key="data", others=obj._others
+        )
+        obj.assets = obj._iter_assets()
+        cls._post_load_attrs(data=obj, **kwargs)
+        return obj
+
+    def _iter_chunks(self, chunk_size: int) -> t.Generator[bytes, None, None]:
+        """Yield chunks of the body of the response and track the bytes received."""
+        for chunk in self.RESPONSE.iter_content(chunk_size=chunk_size):
+            self._response_bytes += len(chunk)
+            yield chunk
+
+    def _iter_assets(self) -> t.Generator[dict, None, None]:
+        """Yield the attributes of each asset as it is deserialized from the response."""
+        while True:
+            start = time.perf_counter()
+            item = next(self._items, StopIteration)
+            self.RESPONSE_LOAD_SECONDS += time.perf_counter() - start
+            if item is StopIteration:
+                break
+            if isinstance(item, dict) and isinstance(item.get("attributes"), dict):
+                self._asset_count_page += 1
+                yield item["attributes"]
+
+        self.meta = self._others.get("meta") or {}
+        self.empty_response = "data" in self._others and self._others["data"] is None
+        self.close()
+
+    def close(self):
+        """Release the connection of the response back to the pool."""
+        self.RESPONSE.close()
+
+    @property
+    def asset_count_page(self) -> int:
+        """Count of assets deserialized so far on this page."""
+        return self._asset_count_page
+
+    @property
+    def response_bytes(self) -> int:
+        """Size of the body of the response read so far for this page."""
+        return self._response_bytes
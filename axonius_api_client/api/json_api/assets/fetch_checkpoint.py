@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+"""Checkpoint of the paging state of a get of assets, used to resume the get."""
+import dataclasses
+import os
+import pathlib
+import tempfile
+import typing as t
+
+from ....constants.ctypes import PathLike
+from ....exceptions import ApiError
+from ....tools import dt_now, get_path, json_dump, json_load
+from .asset_request import AssetRequest
+
+
+@dataclasses.dataclass
+class FetchCheckpoint:
+    """Paging state of a get of assets, saved after each page so the get can be resumed.
+
+    Notes:
+        A checkpoint holds the request object, the parsed arguments, the arguments supplied to
+        the export, the cursor and offset of the next page, and the position of the export file
+        after the rows of the last page were written. Resuming a get from a checkpoint requests
+        the page after the last page that was completely processed, and exports that support
+        it truncate the export file back to the saved position and append to it, formatting
+        rows using the export arguments of the checkpoint so the output keeps the same shape.
+
+        Export arguments that can not be saved as JSON (i.e. export_fd or custom_cbs) are not
+        saved and are taken from the arguments supplied to the get that resumes.
+
+        The checkpoint file is removed once the get finishes.
+
+    Examples:
+        Export devices to a CSV file, saving a checkpoint after each page.
+
+        >>> assets = apiobj.get(
+        ...     export="csv", export_file="devices.csv", checkpoint="devices.checkpoint"
+        ... )
+
+        If the export dies, continue it from the last completed page.
+
+        >>> assets = apiobj.get(resume_from="devices.checkpoint")
+    """
+
+    asset_type: str
+    """Type of assets being fetched."""
+
+    request: dict
+    """Request object used for each page."""
+
+    store: dict = dataclasses.field(default_factory=dict)
+    """Parsed arguments of the get, see :attr:`STORE_KEYS`."""
+
+    state: dict = dataclasses.field(default_factory=dict)
+    """Paging state after the last completed page, see :attr:`STATE_KEYS`."""
+
+    export: dict = dataclasses.field(default_factory=dict)
+    """Position of the export after the last completed page, from the callbacks object."""
+
+    getargs: dict = dataclasses.field(default_factory=dict)
+    """Arguments supplied to the callbacks object, see :meth:`dump_getargs`."""
+
+    created: t.Optional[str] = None
+    """When this checkpoint was created."""
+
+    STORE_KEYS: t.ClassVar[t.List[str]] = [
+        "export",
+        "query",
+        "fields_parsed",
+        "sort_field_parsed",
+        "history_date_parsed",
+        "include_details",
+        "include_notes",
+        "max_rows",
+        "max_pages",
+        "page_size",
+        "page_sleep",
+        "initial_count",
+        "export_templates",
+    ]
+    """Keys of the arguments store of a get to save."""
+
+    STATE_KEYS: t.ClassVar[t.List[str]] = [
+        "page_cursor",
+        "page_loop",
+        "page_number",
+        "rows_fetched_total",
+        "rows_initial_count",
+        "rows_offset",
+        "rows_processed_total",
+    ]
+    """Keys of the paging state of a get to save."""
+
+    @classmethod
+    def create(
+        cls,
+        asset_type: str,
+        request_obj: AssetRequest,
+        state: dict,
+        store: dict,
+        export: t.Optional[dict] = None,
+        getargs: t.Optional[dict] = None,
+    ) -> "FetchCheckpoint":
+        """Create a checkpoint from the paging state of a get.
+
+        Args:
+            asset_type: type of assets being fetched
+            request_obj: request object used for each page
+            state: paging state from :meth:`AssetsPage.create_state`
+            store: arguments store of the get
+            export: position of the export from the callbacks object
+            getargs: arguments supplied to the callbacks object
+        """
+        return cls(
+            asset_type=asset_type,
+            request=request_obj.to_dict(),
+            store={k: store.get(k) for k in cls.STORE_KEYS},
+            state={k: state.get(k) for k in cls.STATE_KEYS},
+            export=export or {},
+            getargs=cls.dump_getargs(getargs=getargs),
+            created=dt_now().isoformat(),
+        )
+
+    @classmethod
+    def dump_getargs(cls, getargs: t.Optional[dict] = None) -> dict:
+        """Get the arguments supplied to a callbacks object that can be saved as JSON.
+
+        Args:
+            getargs: arguments supplied to the callbacks object
+        """
+
+        def is_simple(value: t.Any) -> bool:
+            if value is None or isinstance(value, (str, int, float, bool)):
+                return True
+            if isinstance(value, (list, tuple)):
+                return all(is_simple(x) for x in value)
+            if isinstance(value, dict):
+                return all(isinstance(k, str) and is_simple(v) for k, v in value.items())
+            return False
+
+        return {k: v for k, v in (getargs or {}).items() if is_simple(v)}
+
+    def get_getargs(self, getargs: t.Optional[dict] = None) -> t.Tuple[dict, t.List[str]]:
+        """Get the arguments for the callbacks object of a get that resumes this checkpoint.
+
+        Args:
+            getargs: arguments supplied to the get that resumes this checkpoint
+
+        Returns:
+            the supplied arguments updated with the saved arguments, and the names of the
+            supplied arguments that were replaced with a different saved value
+        """
+        getargs = dict(getargs or {})
+        replaced = [k for k, v in getargs.items() if k in self.getargs and self.getargs[k] != v]
+        getargs.update(self.getargs)
+        return getargs, replaced
+
+    @classmethod
+    def load(cls, path: PathLike) -> "FetchCheckpoint":
+        """Load a checkpoint from a file.
+
+        Args:
+            path: file to load checkpoint from
+        """
+        path = get_path(path)
+        if not path.is_file():
+            raise ApiError(f"Checkpoint file {str(path)!r} does not exist")
+
+        data = json_load(obj=path.read_text(encoding="utf-8"), error=False)
+        if not isinstance(data, dict) or not all(x in data for x in ["asset_type", "request"]):
+            raise ApiError(f"Checkpoint file {str(path)!r} is not a valid checkpoint")
+
+        fields = [x.name for x in dataclasses.fields(cls)]
+        return cls(**{k: v for k, v in data.items() if k in fields})
+
+    def save(self, path: PathLike) -> pathlib.Path:
+        """Save this checkpoint to a file.
+
+        Args:
+            path: file to save checkpoint to
+
+        Notes:
+            The checkpoint is written to a temporary file that is renamed over the file, so
+            a get that dies while saving never leaves a partially written checkpoint.
+        """
+        path = get_path(path)
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+
+        fd, tmp = tempfile.mkstemp(dir=str(path.parent), prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                fh.write(json_dump(obj=self.to_dict(), fast=True))
+            os.replace(tmp, str(path))
+        except Exception:
+            os.remove(tmp)
+            raise
+        return path
+
+    def get_request(self) -> AssetRequest:
+        """Get the request object for the page after the last completed page."""
+        request_obj = AssetRequest.load_request(**self.request)
+        request_obj.set_offset(self.state.get("rows_offset") or 0)
+        if request_obj.use_cursor:
+            request_obj.cursor_id = self.state.get("page_cursor") or request_obj.cursor_id
+        return request_obj
+
+    def check(self, asset_type: str):
+        """Check that this checkpoint can be resumed by a get.
+
+        Args:
+            asset_type: type of assets of the get
+        """
+        if self.asset_type != asset_type:
+            raise ApiError(
+                f"Checkpoint is for {self.asset_type!r} assets, can not resume it for "
+                f"{asset_type!r} assets"
+            )
+
+    def to_dict(self) -> dict:
+        """Get the attributes of this checkpoint."""
+        return dataclasses.asdict(self)
+
+    def __str__(self) -> str:
+        """Pass."""
+        items = [
+            f"asset_type={self.asset_type!r}",
+            f"created={self.created!r}",
+            f"page_number={self.state.get('page_number')}",
+            f"rows_offset={self.state.get('rows_offset')}",
+            f"rows_processed_total={self.state.get('rows_processed_total')}",
+        ]
+        return f"{self.__class__.__name__}({', '.join(items)})"
+
+    def __repr__(self) -> str:
+        """Pass."""
+        return self.__str__()
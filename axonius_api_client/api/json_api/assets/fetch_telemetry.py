@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+"""Telemetry collected for each page of assets fetched."""
+import contextlib
+import dataclasses
+import datetime
+import math
+import time
+import typing as t
+
+from ....tools import json_dump
+
+
+@dataclasses.dataclass
+class FetchTelemetry:
+    """Timings and sizes of each page of assets fetched by a get of assets.
+
+    Notes:
+        Each page records:
+
+        * fetch_seconds: from sending the request until the page was loaded
+        * http_seconds: from sending the request until the response headers were parsed
+        * wait_seconds: waiting on the rate limiter of :obj:`axonius_api_client.http.Http`
+        * decode_seconds: deserializing the response body and loading it into a page
+        * process_seconds: running the callbacks for each row, including write_seconds
+        * callback_seconds: process_seconds minus write_seconds
+        * write_seconds: writing rows to the export
+        * bytes: size of the response body
+        * rows: rows received
+
+        For pages from :obj:`AssetsPageStream`, reading the response body happens while
+        the rows are processed and is counted in decode_seconds.
+
+    Examples:
+        >>> assets = apiobj.get(export="csv", export_file="devices.csv")
+        >>> telemetry = apiobj.LAST_CALLBACKS.TELEMETRY
+        >>> telemetry.summary()["write_seconds"]["p95"]
+        >>> telemetry.to_json()
+    """
+
+    pages: t.List[dict] = dataclasses.field(default_factory=list)
+    """Telemetry records for each page."""
+
+    stop_seconds: float = 0.0
+    """Seconds spent stopping the callbacks, i.e. writing buffered exports."""
+
+    METRICS: t.ClassVar[t.List[str]] = [
+        "fetch_seconds",
+        "http_seconds",
+        "wait_seconds",
+        "decode_seconds",
+        "process_seconds",
+        "callback_seconds",
+        "write_seconds",
+        "bytes",
+        "rows",
+    ]
+    """Metrics that are summarized in :meth:`summary`."""
+
+    PERCENTILES: t.ClassVar[t.List[int]] = [50, 95]
+    """Percentiles of each metric to include in :meth:`summary`."""
+
+    def __post_init__(self):
+        """Dataclasses post init."""
+        self.started: float = time.perf_counter()
+        self.finished: t.Optional[float] = None
+        self.current: t.Optional[dict] = None
+        self._page: t.Any = None
+        self._start_dt: t.Optional[datetime.datetime] = None
+
+    def start_page(self, page: t.Any, start_dt: datetime.datetime) -> dict:
+        """Start a telemetry record for a page.
+
+        Args:
+            page: page of assets that was fetched
+            start_dt: when the request for the page was sent
+        """
+        self.finish_page()
+        self._page = page
+        self._start_dt = start_dt
+        self.current = {
+            "page": len(self.pages) + 1,
+            "process_seconds": 0.0,
+            "write_seconds": 0.0,
+        }
+        self.pages.append(self.current)
+        return self.current
+
+    def finish_page(self) -> t.Optional[dict]:
+        """Fill in the telemetry record for the current page from the page itself."""
+        record, page = self.current, self._page
+        if record is None:
+            return None
+
+        response = getattr(page, "RESPONSE", None)
+        elapsed = getattr(response, "elapsed", None)
+        loaded_dt = getattr(page, "page_start_dt", None)
+        fetch_seconds = (loaded_dt - self._start_dt).total_seconds() if loaded_dt else 0.0
+
+        record["fetch_seconds"] = max(fetch_seconds, 0.0)
+        record["http_seconds"] = elapsed.total_seconds() if elapsed else 0.0
+        record["wait_seconds"] = getattr(response, "RATE_LIMIT_SECONDS", 0.0)
+        record["decode_seconds"] = getattr(page, "RESPONSE_LOAD_SECONDS", 0.0)
+        record["callback_seconds"] = max(record["process_seconds"] - record["write_seconds"], 0)
+        record["bytes"] = getattr(page, "response_bytes", 0)
+        record["rows"] = getattr(page, "asset_count_page", 0)
+        self.current = self._page = self._start_dt = None
+        return record
+
+    def finish(self):
+        """Finish the current page and stop the clock for :meth:`summary`."""
+        self.finish_page()
+        self.finished = time.perf_counter()
+
+    def add(self, key: str, value: float):
+        """Add a value to a metric of the current page.
+
+        Args:
+            key: metric to add to
+            value: value to add
+        """
+        if self.current is not None:
+            self.current[key] = self.current.get(key, 0) + value
+
+    @contextlib.contextmanager
+    def timer(self, key: str):
+        """Add the seconds spent in the context to a metric of the current page.
+
+        Args:
+            key: metric to add the seconds to
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(key=key, value=time.perf_counter() - start)
+
+    @staticmethod
+    def percentile(values: t.List[float], percent: int) -> float:
+        """Get a percentile of values using the nearest rank method.
+
+        Args:
+            values: values to get percentile of
+            percent: percentile to get
+        """
+        if not values:
+            return 0
+        values = sorted(values)
+        rank = max(math.ceil(percent / 100 * len(values)), 1)
+        return values[rank - 1]
+
+    def summary(self) -> dict:
+        """Summarize the telemetry of all pages."""
+        seconds = (self.finished or time.perf_counter()) - self.started
+        ret = {"pages": len(self.pages), "seconds": seconds, "stop_seconds": self.stop_seconds}
+
+        for metric in self.METRICS:
+            values = [x[metric] for x in self.pages if metric in x]
+            stats = {"total": sum(values)}
+            stats.update({f"p{x}": self.percentile(values, x) for x in self.PERCENTILES})
+            stats["max"] = max(values) if values else 0
+            ret[metric] = stats
+
+        rows = ret["rows"]["total"]
+        mbs = ret["bytes"]["total"] / 1024 / 1024
+        fetch_seconds = ret["fetch_seconds"]["total"]
+        ret["rows_per_second"] = rows / seconds if seconds else 0
+        ret["mb_per_second"] = mbs / fetch_seconds if fetch_seconds else 0
+        return ret
+
+    def to_dict(self) -> dict:
+        """Get the summary and the telemetry records for each page."""
+        return {"summary": self.summary(), "pages": self.pages}
+
+    def to_json(self, **kwargs) -> str:
+        """Serialize :meth:`to_dict` into a JSON str.
+
+        Args:
+            **kwargs: passed to :func:`axonius_api_client.tools.json_dump`
+        """
+        return json_dump(obj=self.to_dict(), **kwargs)
+
+    def __str__(self) -> str:
+        """Pass."""
+        summary = self.summary()
+        items = [
+            f"pages={summary['pages']}",
+            f"rows={summary['rows']['total']}",
+            f"seconds={summary['seconds']:.2f}",
+            f"rows_per_second={summary['rows_per_second']:.2f}",
+            f"mb_per_second={summary['mb_per_second']:.2f}",
+        ]
+        items += [f"{x}={summary[x]['total']:.2f}" for x in self.METRICS if "seconds" in x]
+        return f"{self.__class__.__name__}({', '.join(items)})"
+
+    def __repr__(self) -> str:
+        """Pass."""
+        return self.__str__()
@@ -412,7 +412,7 @@ class BaseModel(dataclasses_json.DataClassJsonMixin, BaseCommon):
         Returns:
             dict: serialized URL parameters to send for a GET request
         """
-        dumped = json_load(obj=json_dump(obj=self.to_dict()))
+        dumped = json_load(obj=json_dump(obj=self.to_dict(), fast=True))
         ret = {}
         for k, v in dumped.items():
             if v is None:
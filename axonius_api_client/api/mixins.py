@@ -21,6 +21,19 @@ class Model:
     LOG: t.ClassVar[logging.Logger] = None
     """Logger for this object."""
 
+    def _disk_cached(self, name: str, func: t.Callable[[], t.Any], ttl: t.Optional[int] = None):
+        """Get a value from the disk cache of the client of this model, if it has one.
+
+        Args:
+            name: name of the cache entry
+            func: function to get the value with if it is not cached
+            ttl: seconds before the cache entry expires, defaults to the TTL of the cache
+        """
+        get_disk_cached = getattr(getattr(self.http, "CLIENT", None), "get_disk_cached", None)
+        if callable(get_disk_cached):
+            return get_disk_cached(name=name, func=func, ttl=ttl)
+        return func()
+
 
 # noinspection PyUnusedLocal
 class ModelMixins(Model):
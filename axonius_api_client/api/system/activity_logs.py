@@ -1,11 +1,15 @@
 # -*- coding: utf-8 -*-
 """API for working with product metadata."""
 import datetime
+import os
+import pathlib
+import tempfile
 from typing import Generator, List, Optional, Union
 
 from ...constants.api import MAX_PAGE_SIZE
-from ...exceptions import StopFetch
-from ...tools import json_dump
+from ...constants.ctypes import PathLike
+from ...exceptions import ApiError, StopFetch
+from ...tools import coerce_int_float, dt_now, dt_parse, get_path, json_dump, json_load
 from .. import json_api
 from ..api_endpoints import ApiEndpoints
 from ..mixins import ModelMixins
@@ -39,16 +43,45 @@ class ActivityLogs(ModelMixins):
         end_date: Optional[Union[str, datetime.datetime]] = None,
         within_last_hours: Optional[int] = None,
         max_rows: Optional[int] = None,
+        search: str = "",
+        stop_early: bool = True,
+        high_water_mark: Optional[PathLike] = None,
+        page_size: int = MAX_PAGE_SIZE,
         **kwargs,
     ) -> Generator[json_api.audit_logs.AuditLog, None, None]:
         """Get activity log entries.
 
+        Notes:
+            The date window from start_date, end_date, within_last_hours and high_water_mark
+            is sent to the REST API as date_from and date_to, and is also checked for each
+            record. Records are returned newest first, so with stop_early, fetching stops at
+            the first record older than the start of the window.
+
+            With high_water_mark, the date of the newest record returned is saved to a file
+            once all records in the window have been returned, and the next get that uses the
+            same file only returns records newer than that date. The file is not updated if
+            fetching was stopped by max_rows or the generator was not exhausted.
+
         Args:
             start_date: only return records with dates after this value
             end_date: only return records with dates before this value
             within_last_hours: only return records that happened N hours ago
+            max_rows: stop fetching after this many records have been received
+            search: only return records that match this text search, done by the REST API
+            stop_early: stop fetching at the first record older than the start of the window
+            high_water_mark: file to load and save the date of the newest record returned
+            page_size: number of records to fetch per page
             **kwargs: only return records that regex match properties as keys
         """
+        mark: dict = self._load_high_water_mark(path=high_water_mark)
+        date_from: Optional[datetime.datetime] = self._get_date_from(
+            start_date=start_date, within_last_hours=within_last_hours, mark=mark
+        )
+        date_to: Optional[datetime.datetime] = (
+            dt_parse(obj=end_date, default_tz_utc=True) if end_date else None
+        )
+        newest: dict = {}
+
         state = {}
         state["total_rows_fetched"] = 0
         state["page_row_start"] = 0
@@ -58,12 +91,22 @@ class ActivityLogs(ModelMixins):
         state["start_date"] = start_date
         state["end_date"] = end_date
         state["within_last_hours"] = within_last_hours
+        state["date_from"] = date_from
+        state["date_to"] = date_to
+        state["search"] = search
         state["property_searches"] = kwargs
+        state["stop_reason"] = None
 
         while True:
             self.LOG.debug(f"Fetching page state={json_dump(state)}")
             try:
-                rows = self._get(offset=state["page_row_start"])
+                rows = self._get(
+                    offset=state["page_row_start"],
+                    limit=page_size,
+                    search=search,
+                    date_from=date_from,
+                    date_to=date_to,
+                )
                 state["page_rows_fetched"] = len(rows)
                 state["page_row_start"] += len(rows)
                 state["page_number"] += 1
@@ -80,18 +123,122 @@ class ActivityLogs(ModelMixins):
 
                     state["total_rows_fetched"] += 1
 
+                    if stop_early and date_from and row.date < date_from:
+                        raise StopFetch(reason="reached start of date window", state=state)
+
                     if (
-                        not row.within_dates(start=start_date, end=end_date)
-                        or not row.within_last_hours(hours=within_last_hours)
+                        not row.within_dates(start=date_from, end=date_to)
                         or not row.property_searches(**kwargs)
                     ):
                         continue
 
+                    key = self._get_row_key(row=row)
+                    if row.date == mark.get("date") and key in mark["keys"]:
+                        continue
+
+                    if not newest or row.date > newest["date"]:
+                        newest = {"date": row.date, "keys": [key]}
+                    elif row.date == newest["date"]:
+                        newest["keys"].append(key)
+
                     yield row
             except StopFetch as exc:
+                state["stop_reason"] = exc.reason
                 self.LOG.info(f"{type(exc)}(reason={exc}) -- state:\n{json_dump(exc.state)}")
                 break
 
+        if high_water_mark and newest and state["stop_reason"] != "reached max_rows":
+            if newest["date"] == mark.get("date"):
+                newest["keys"] += mark["keys"]
+            self._save_high_water_mark(path=high_water_mark, mark=newest)
+
+    @staticmethod
+    def _get_date_from(
+        start_date: Optional[Union[str, datetime.datetime]] = None,
+        within_last_hours: Optional[int] = None,
+        mark: Optional[dict] = None,
+    ) -> Optional[datetime.datetime]:
+        """Get the start of the date window for :meth:`get_generator`.
+
+        Args:
+            start_date: only return records with dates after this value
+            within_last_hours: only return records that happened N hours ago
+            mark: high water mark from :meth:`_load_high_water_mark`
+        """
+        dates: List[datetime.datetime] = []
+        if start_date:
+            dates.append(dt_parse(obj=start_date, default_tz_utc=True))
+        if within_last_hours:
+            hours = coerce_int_float(value=within_last_hours)
+            dates.append(dt_parse(obj=datetime.timedelta(hours=hours)))
+        if mark and mark.get("date"):
+            dates.append(mark["date"])
+        return max(dates) if dates else None
+
+    @staticmethod
+    def _get_row_key(row: json_api.audit_logs.AuditLog) -> str:
+        """Get a key that identifies a record for :meth:`get_generator`.
+
+        Args:
+            row: record to get key of
+        """
+        values = [row.date.isoformat()] + [getattr(row, x) for x in row._search_properties()]
+        return "|".join(str(x) for x in values)
+
+    def _load_high_water_mark(self, path: Optional[PathLike] = None) -> dict:
+        """Load the high water mark saved by :meth:`get_generator`.
+
+        Args:
+            path: file to load high water mark from
+
+        Returns:
+            dict with the date of the newest record returned and the keys of the records
+            with that date, empty if path is not supplied or does not exist yet
+        """
+        if not path:
+            return {}
+
+        path = get_path(path)
+        if not path.is_file():
+            self.LOG.info(f"No high water mark found in {path}, fetching all records")
+            return {}
+
+        data = json_load(obj=path.read_text(encoding="utf-8"), error=False)
+        if not isinstance(data, dict) or not data.get("date"):
+            raise ApiError(f"High water mark file {str(path)!r} is not valid")
+
+        mark = {"date": dt_parse(obj=data["date"], default_tz_utc=True), "keys": data["keys"]}
+        self.LOG.info(f"Loaded high water mark {mark['date']} from {path}")
+        return mark
+
+    def _save_high_water_mark(self, path: PathLike, mark: dict) -> pathlib.Path:
+        """Save the high water mark of :meth:`get_generator`.
+
+        Args:
+            path: file to save high water mark to
+            mark: dict with the date of the newest record returned and the keys of the records
+                with that date
+
+        Notes:
+            The high water mark is written to a temporary file that is renamed over the file,
+            so a poll that dies while saving never leaves a partially written file.
+        """
+        path = get_path(path)
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        data = {"date": mark["date"].isoformat(), "keys": mark["keys"], "saved": dt_now()}
+
+        fd, tmp = tempfile.mkstemp(dir=str(path.parent), prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                fh.write(json_dump(obj=data))
+            os.replace(tmp, str(path))
+        except Exception:
+            os.remove(tmp)
+            raise
+
+        self.LOG.info(f"Saved high water mark {mark['date']} to {path}")
+        return path
+
     def _get(
         self,
         offset: int = 0,
@@ -100,7 +247,15 @@ class ActivityLogs(ModelMixins):
         date_from: Optional[Union[str, datetime.datetime]] = None,
         date_to: Optional[Union[str, datetime.datetime]] = None,
     ) -> json_api.audit_logs.AuditLog:
-        """Direct API method to get the activity logs."""
+        """Direct API method to get the activity logs.
+
+        Args:
+            offset: row to start at
+            limit: number of rows to return
+            search: text search to filter rows by
+            date_from: only return rows with dates after this value
+            date_to: only return rows with dates before this value
+        """
         api_endpoint = ApiEndpoints.audit_logs.get
         request_obj = api_endpoint.load_request(
             page={"limit": limit, "offset": offset},
@@ -0,0 +1,293 @@
+"""Asyncio counterpart of the all-in-one connection handler."""
+import asyncio
+import concurrent.futures
+import functools
+import inspect
+import itertools
+import typing as t
+
+import requests
+
+from .api.api_endpoint import ApiEndpoint
+from .api.mixins import ChildMixins, ModelMixins
+from .connect import Connect
+from .constants.api import ASYNC_CHUNK_SIZE, ASYNC_MAX_WORKERS
+from .exceptions import ConnectError
+from .http import Http
+
+
+class AsyncHttp:
+    """Asyncio wrapper for sending requests concurrently with an :obj:`Http` object.
+
+    Notes:
+        Requests are sent by the blocking :obj:`Http` object in a pool of threads, so the
+        auth, certificate, proxy, logging, and retry handling of :obj:`Http` and the
+        request and response models of each :obj:`ApiEndpoint` are used as is. The number
+        of requests in flight at once is bounded by ``max_workers``.
+
+    Examples:
+        >>> import asyncio
+        >>> from axonius_api_client.api.api_endpoints import ApiEndpoints
+        >>> ahttp = AsyncHttp(http=client.http)
+        >>> endpoint = ApiEndpoints.system_settings.meta_about
+        >>> about = asyncio.run(ahttp.perform_request(endpoint=endpoint))
+    """
+
+    def __init__(
+        self,
+        http: Http,
+        max_workers: int = ASYNC_MAX_WORKERS,
+        executor: t.Optional[concurrent.futures.Executor] = None,
+    ):
+        """Asyncio wrapper for sending requests concurrently with an :obj:`Http` object.
+
+        Args:
+            http: HTTP object to use to send requests
+            max_workers: number of threads to send requests with if executor not supplied
+            executor: executor to run requests in, i.e. to share between instances
+        """
+        self.http: Http = http
+        self.max_workers: int = max_workers
+        self._executor_owned: bool = executor is None
+        self.executor: concurrent.futures.Executor = executor or (
+            concurrent.futures.ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix=self.__class__.__name__
+            )
+        )
+
+    async def run(self, func: t.Callable, *args, **kwargs) -> t.Any:
+        """Run a blocking function in :attr:`executor` and await the result.
+
+        Args:
+            func: function to run
+            *args: passed to func
+            **kwargs: passed to func
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, functools.partial(func, *args, **kwargs))
+
+    async def iterate(
+        self, func: t.Callable, *args, chunk_size: int = ASYNC_CHUNK_SIZE, **kwargs
+    ) -> t.AsyncGenerator[t.Any, None]:
+        """Run a blocking generator function in :attr:`executor` and yield its items.
+
+        Args:
+            func: generator function to run
+            *args: passed to func
+            chunk_size: number of items to get from the generator in each thread hop
+            **kwargs: passed to func
+
+        Notes:
+            The generator is closed in :attr:`executor` when the async generator is closed,
+            so the clean up done by the generator (i.e. stopping callbacks) still happens
+            if iteration is stopped early.
+        """
+        generator = await self.run(func, *args, **kwargs)
+        try:
+            while True:
+                items = await self.run(lambda: list(itertools.islice(generator, chunk_size)))
+                for item in items:
+                    yield item
+                if len(items) < chunk_size:
+                    break
+        finally:
+            await self.run(generator.close)
+
+    async def __call__(self, **kwargs) -> requests.Response:
+        """Send a request using :meth:`Http.__call__`.
+
+        Args:
+            **kwargs: passed to :meth:`Http.__call__`
+        """
+        return await self.run(self.http, **kwargs)
+
+    async def perform_request(
+        self, endpoint: ApiEndpoint, request_obj: t.Optional[t.Any] = None, **kwargs
+    ) -> t.Any:
+        """Perform a request to an endpoint using :meth:`ApiEndpoint.perform_request`.
+
+        Args:
+            endpoint: endpoint to send request to
+            request_obj: dataclass containing object to serialize for the request
+            **kwargs: passed to :meth:`ApiEndpoint.perform_request`
+        """
+        return await self.run(
+            endpoint.perform_request, http=self.http, request_obj=request_obj, **kwargs
+        )
+
+    def close(self):
+        """Shutdown :attr:`executor` if it was created by this object."""
+        if self._executor_owned:
+            self.executor.shutdown(wait=False)
+
+    def __str__(self) -> str:
+        """Pass."""
+        return f"{self.__class__.__name__}(http={self.http}, max_workers={self.max_workers})"
+
+    def __repr__(self) -> str:
+        """Pass."""
+        return self.__str__()
+
+
+class AsyncModel:
+    """Asyncio wrapper for an API model of :obj:`Connect`.
+
+    Notes:
+        Methods of the model are returned as coroutine functions, generator methods
+        (i.e. ``get_generator``) are returned as async generator functions, and child
+        models (i.e. ``fields``, ``labels``, ``saved_queries``, ``cnx``) are wrapped as well.
+        All other attributes are returned as is.
+    """
+
+    def __init__(self, model: t.Union[ModelMixins, ChildMixins], http: AsyncHttp):
+        """Asyncio wrapper for an API model of :obj:`Connect`.
+
+        Args:
+            model: API model to wrap
+            http: asyncio HTTP wrapper to run the methods of the model with
+        """
+        self.model: t.Union[ModelMixins, ChildMixins] = model
+        self.async_http: AsyncHttp = http
+
+    def __getattr__(self, name: str) -> t.Any:
+        """Get an async wrapped attribute of :attr:`model`."""
+        value = getattr(self.model, name)
+
+        if isinstance(value, (ModelMixins, ChildMixins)):
+            return AsyncModel(model=value, http=self.async_http)
+
+        if inspect.isgeneratorfunction(value):
+
+            @functools.wraps(value)
+            def agen(*args, chunk_size: int = ASYNC_CHUNK_SIZE, **kwargs):
+                return self.async_http.iterate(value, *args, chunk_size=chunk_size, **kwargs)
+
+            return agen
+
+        if inspect.ismethod(value) or inspect.isfunction(value):
+
+            @functools.wraps(value)
+            async def coro(*args, **kwargs):
+                return await self.async_http.run(value, *args, **kwargs)
+
+            return coro
+
+        return value
+
+    def __str__(self) -> str:
+        """Pass."""
+        return f"{self.__class__.__name__}({self.model})"
+
+    def __repr__(self) -> str:
+        """Pass."""
+        return self.__str__()
+
+
+class AsyncConnect:
+    """Asyncio connection handler for using the API client from an event loop.
+
+    Notes:
+        Wraps a :obj:`Connect` object, so it takes the same arguments. The API models of
+        :obj:`Connect` are available as attributes once :meth:`start` has been awaited,
+        with their methods returned as coroutine functions and generator methods as async
+        generator functions by :obj:`AsyncModel`.
+
+    Examples:
+        Count devices and users on many instances at once, while streaming devices from
+        each of them.
+
+        >>> import asyncio
+        >>> import axonius_api_client as axonapi
+        >>>
+        >>> async def work(client_args: dict) -> dict:
+        ...     async with axonapi.AsyncConnect(**client_args) as client:
+        ...         devices, users = await asyncio.gather(
+        ...             client.devices.count(), client.users.count()
+        ...         )
+        ...         adapters = await client.adapters.get()
+        ...         hostnames = [
+        ...             row.get("specific_data.data.hostname")
+        ...             async for row in client.devices.get_generator(
+        ...                 fields=["hostname"]
+        ...             )
+        ...         ]
+        ...         return {"devices": devices, "users": users, "hostnames": hostnames}
+        >>>
+        >>> async def main(instances: list) -> list:
+        ...     return await asyncio.gather(*[work(x) for x in instances])
+        >>>
+        >>> results = asyncio.run(main(instances=[client_args1, client_args2]))
+
+        Run enforcements.
+
+        >>> ran = await client.enforcements.run(values=["enforcement name"])
+    """
+
+    def __init__(
+        self,
+        url: t.Optional[str] = None,
+        key: t.Optional[str] = None,
+        secret: t.Optional[str] = None,
+        client: t.Optional[Connect] = None,
+        max_workers: int = ASYNC_MAX_WORKERS,
+        executor: t.Optional[concurrent.futures.Executor] = None,
+        **kwargs,
+    ):
+        """Asyncio connection handler for using the API client from an event loop.
+
+        Args:
+            url: URL, hostname, or IP address of Axonius instance
+            key: API Key from account page in Axonius instance
+            secret: API Secret from account page in Axonius instance
+            client: existing client to wrap instead of creating one
+            max_workers: number of threads to send requests with if executor not supplied
+            executor: executor to run requests in, i.e. to share between instances
+            **kwargs: passed to :obj:`Connect`
+        """
+        if not isinstance(client, Connect):
+            client = Connect(url=url, key=key, secret=secret, **kwargs)
+        self.client: Connect = client
+        self.http: AsyncHttp = AsyncHttp(
+            http=client.http, max_workers=max_workers, executor=executor
+        )
+
+    async def start(self) -> None:
+        """Connect to and authenticate with Axonius."""
+        await self.http.run(self.client.start)
+
+    def close(self):
+        """Shutdown the executor of :attr:`http`."""
+        self.http.close()
+
+    async def __aenter__(self) -> "AsyncConnect":
+        """Start the client when entering a context."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        """Close the client when exiting a context."""
+        self.close()
+
+    def __getattr__(self, name: str) -> t.Any:
+        """Get an API model of :attr:`client` wrapped in :obj:`AsyncModel`."""
+        if name.startswith("_") or name in ["client", "http"]:
+            raise AttributeError(name)
+
+        if not isinstance(getattr(type(self.client), name, None), property):
+            return getattr(self.client, name)
+
+        if not self.client.STARTED:
+            raise ConnectError(f"Must await start() before using {name!r} of {self}")
+
+        value = getattr(self.client, name)
+        if isinstance(value, (ModelMixins, ChildMixins)):
+            return AsyncModel(model=value, http=self.http)
+        return value
+
+    def __str__(self) -> str:
+        """Show object info."""
+        return f"{self.__class__.__name__}({self.client.str_state})"
+
+    def __repr__(self) -> str:
+        """Show object info."""
+        return self.__str__()
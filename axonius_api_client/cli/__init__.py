@@ -562,6 +562,86 @@ CF = cf_constants.CLIENT_DESC
     type=click.INT,
     show_default=True,
 )
+@click.option(
+    "--rate-limit",
+    "-rl",
+    "rate_limit",
+    default=None,
+    help="Maximum requests per second to send to the API (lowered on 429 responses).",
+    type=click.FLOAT,
+    show_envvar=True,
+    show_default=True,
+)
+@click.option(
+    "--max-in-flight",
+    "-mif",
+    "max_in_flight",
+    default=None,
+    help="Maximum requests to have waiting on a response from the API at once.",
+    type=click.INT,
+    show_envvar=True,
+    show_default=True,
+)
+@click.option(
+    "--pool-maxsize",
+    "-pm",
+    "pool_maxsize",
+    default=connect.Http.POOL_MAXSIZE,
+    help="Maximum number of connections to keep open to the API.",
+    type=click.INT,
+    show_envvar=True,
+    show_default=True,
+)
+@click.option(
+    "--pool-block/--no-pool-block",
+    "-pb/-npb",
+    "pool_block",
+    default=connect.Http.POOL_BLOCK,
+    help="Wait for a connection to be free instead of opening an extra one when all are in use.",
+    is_flag=True,
+    show_envvar=True,
+    show_default=True,
+)
+@click.option(
+    "--keep-alive/--no-keep-alive",
+    "-ka/-nka",
+    "keep_alive",
+    default=connect.Http.KEEP_ALIVE,
+    help="Keep connections to the API open to be reused by later requests.",
+    is_flag=True,
+    show_envvar=True,
+    show_default=True,
+)
+@click.option(
+    "--http2/--no-http2",
+    "-h2/-nh2",
+    "http2",
+    default=connect.Http.HTTP2,
+    help="Send requests using HTTP/2 (requires httpx[http2]).",
+    is_flag=True,
+    show_envvar=True,
+    show_default=True,
+)
+@click.option(
+    "--disk-cache/--no-disk-cache",
+    "-dc/-ndc",
+    "disk_cache",
+    default=connect.DISK_CACHE_ENABLED,
+    help="Cache field schemas, adapters, and history dates on disk to reuse them between runs.",
+    is_flag=True,
+    show_envvar=True,
+    show_default=True,
+)
+@click.option(
+    "--disk-cache-ttl",
+    "-dct",
+    "disk_cache_ttl",
+    default=connect.DISK_CACHE_TTL,
+    help="Seconds before an entry in the disk cache expires.",
+    type=click.INT,
+    show_envvar=True,
+    show_default=True,
+)
 @click.option(
     "--credentials/--keys",
     "-creds/-keys",
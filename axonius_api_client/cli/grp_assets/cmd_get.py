@@ -37,6 +37,30 @@ OPTIONS = [
         show_envvar=True,
         show_default=True,
     ),
+    click.option(
+        "--checkpoint",
+        "-xcp",
+        "checkpoint",
+        default=None,
+        help="Save the paging state to this file after each page, removed once finished",
+        type=click.Path(exists=False, resolve_path=True),
+        show_envvar=True,
+        show_default=True,
+    ),
+    click.option(
+        "--resume-from",
+        "-xrf",
+        "resume_from",
+        default=None,
+        help=(
+            "Resume from the paging state saved to this file by --checkpoint, appending to "
+            "the export file (query, fields, and export options from the file are used "
+            "instead of the supplied ones)"
+        ),
+        type=click.Path(exists=True, resolve_path=True, dir_okay=False),
+        show_envvar=True,
+        show_default=True,
+    ),
 ]
 
 
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 """Command line interface for Axonius API Client."""
+from ...constants.api import MAP_WORKERS_MAX, RUNNER_CHUNK_SIZE, RUNNER_WORKERS
 from ...constants.fields import AXID
 from ..context import CONTEXT_SETTINGS, click
 from ..options import AUTH, add_options
@@ -104,6 +105,35 @@ OPTS_RUNNER = [
         show_envvar=True,
         show_default=True,
     ),
+    click.option(
+        "--chunk-size",
+        "-cz",
+        "chunk_size",
+        default=RUNNER_CHUNK_SIZE,
+        help="Maximum number of Asset IDs in each query used to verify the count",
+        type=click.IntRange(min=1),
+        show_envvar=True,
+        show_default=True,
+    ),
+    click.option(
+        "--workers",
+        "-w",
+        "workers",
+        default=RUNNER_WORKERS,
+        help="Number of count queries to send concurrently when verifying the count",
+        type=click.IntRange(min=1, max=MAP_WORKERS_MAX),
+        show_envvar=True,
+        show_default=True,
+    ),
+    click.option(
+        "--run-chunked/--no-run-chunked",
+        "-rc/-nrc",
+        "run_chunked",
+        default=False,
+        help="Run $eset against chunks of --chunk-size Asset IDs in separate requests",
+        show_envvar=True,
+        show_default=True,
+    ),
 ]
 
 OPTIONS = [
@@ -334,6 +334,17 @@ GET_EXPORT = [
         show_default=True,
         hidden=False,
     ),
+    click.option(
+        "--json-fast/--no-json-fast",
+        "json_fast",
+        default=asset_callbacks.Json.args_map()["json_fast"],
+        help="Serialize JSON output using orjson or ujson if installed (not byte for byte "
+        "identical to the default output)",
+        is_flag=True,
+        show_envvar=True,
+        show_default=True,
+        hidden=False,
+    ),
     click.option(
         "--titles/--no-titles",
         "field_titles",
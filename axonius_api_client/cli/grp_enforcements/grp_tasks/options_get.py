@@ -4,7 +4,13 @@ import click
 
 from ....api.json_api.count_operator import OperatorTypes
 from ....api.json_api.paging_state import PagingState
-from ....constants.api import RE_PREFIX
+from ....constants.api import (
+    MAP_WORKERS_MAX,
+    RE_PREFIX,
+    TASK_FULL_ERROR,
+    TASK_FULL_ERRORS,
+    TASK_FULL_WORKERS,
+)
 from ....constants.general import SPLITTER
 from .export_get import DEFAULT_EXPORT_FORMAT, EXPORT_FORMATS
 
@@ -285,6 +291,26 @@ OPT_ROW_STOP = click.option(
     show_envvar=True,
     show_default=True,
 )
+OPT_WORKERS = click.option(
+    "--workers",
+    "-w",
+    "workers",
+    help="Number of tasks to fetch the full model of at a time",
+    type=click.IntRange(min=1, max=MAP_WORKERS_MAX),
+    default=TASK_FULL_WORKERS,
+    show_envvar=True,
+    show_default=True,
+)
+OPT_ERRORS = click.option(
+    "--errors",
+    "-er",
+    "errors",
+    help="How to handle an error fetching the full model of a task",
+    type=click.Choice(TASK_FULL_ERRORS),
+    default=TASK_FULL_ERROR,
+    show_envvar=True,
+    show_default=True,
+)
 OPT_PAGE_SIZE = click.option(
     "--page-size",
     "-ps",
@@ -403,6 +429,8 @@ OPTS_EXPORT = [
     OPT_PAGE_SIZE,
     OPT_ROW_START,
     OPT_ROW_STOP,
+    OPT_WORKERS,
+    OPT_ERRORS,
     OPT_EXPLODE,
     OPT_SCHEMAS,
     OPT_EXPORT_FORMAT,
@@ -108,6 +108,42 @@ OPTIONS = [
         required=False,
         multiple=False,
     ),
+    click.option(
+        "--search",
+        "-sr",
+        "search",
+        help="Only return records that match this text search (done by the REST API)",
+        default="",
+        type=str,
+        show_envvar=True,
+        show_default=True,
+        required=False,
+        multiple=False,
+    ),
+    click.option(
+        "--stop-early/--no-stop-early",
+        "-se/-nse",
+        "stop_early",
+        help="Stop fetching at the first record older than the start of the date window",
+        default=True,
+        is_flag=True,
+        show_envvar=True,
+        show_default=True,
+    ),
+    click.option(
+        "--high-water-mark",
+        "-hwm",
+        "high_water_mark",
+        help=(
+            "File to save the date of the newest record to, only records newer than the date "
+            "in this file will be returned"
+        ),
+        default=None,
+        type=click.Path(exists=False, resolve_path=True, dir_okay=False),
+        show_envvar=True,
+        show_default=True,
+        required=False,
+    ),
     *SEARCH_OPTS,
 ]
 
@@ -10,6 +10,13 @@ import requests
 
 from . import api, logs, tools, version
 from .auth import AuthApiKey, AuthCredentials, AuthModel, AuthNull
+from .constants.api import (
+    DISK_CACHE_ENABLED,
+    DISK_CACHE_TTL,
+    HISTORY_MAX_BYTES,
+    HISTORY_MAX_ITEMS,
+    HISTORY_SAMPLE_RATE,
+)
 from .constants.ctypes import PathLike
 from .constants.logs import (
     LOG_FILE_MAX_FILES,
@@ -25,8 +32,9 @@ from .constants.logs import (
     LOG_LEVEL_FILE,
     LOG_LEVEL_PACKAGE,
 )
+from .disk_cache import DiskCache
 from .exceptions import ConnectError, InvalidCredentials
-from .http import Http, T_Cookies, T_Headers
+from .http import Http, RateLimiter, ResponseHistory, RetryPolicy, T_Cookies, T_Headers
 from .projects import cert_human
 from .projects.cf_token import constants as cf_constants
 from .setup_env import get_env_ax
@@ -188,6 +196,9 @@ class Connect:
     ABOUT_CACHE: t.Optional[dict] = None
     """Cached data from the /about endpoint."""
 
+    DISK_CACHE: t.Optional[DiskCache] = None
+    """Persistent cache for field schemas, adapters, and history dates."""
+
     HTTP_MAX: str = """log_request_body = True
 log_response_body = True
 log_level_http = "debug"
@@ -266,6 +277,25 @@ log_body_lines = 10000
         auth_null: t.Optional[AuthModel] = None,
         max_retries: t.Optional[int] = Http.MAX_RETRIES,
         retry_backoff: t.Optional[int] = Http.RETRY_BACKOFF,
+        pool_connections: int = Http.POOL_CONNECTIONS,
+        pool_maxsize: int = Http.POOL_MAXSIZE,
+        pool_block: bool = Http.POOL_BLOCK,
+        keep_alive: bool = Http.KEEP_ALIVE,
+        http2: bool = Http.HTTP2,
+        retry_policy: t.Optional[RetryPolicy] = None,
+        rate_limit: t.Optional[float] = None,
+        rate_burst: t.Optional[int] = None,
+        max_in_flight: t.Optional[int] = None,
+        rate_limiter: t.Optional[RateLimiter] = None,
+        history_max_items: t.Optional[int] = HISTORY_MAX_ITEMS,
+        history_max_bytes: t.Optional[int] = HISTORY_MAX_BYTES,
+        history_sample_rate: float = HISTORY_SAMPLE_RATE,
+        history_metadata_only: bool = False,
+        history_spill_path: t.Optional[PathLike] = None,
+        history: t.Optional[ResponseHistory] = None,
+        disk_cache: bool = DISK_CACHE_ENABLED,
+        disk_cache_path: t.Optional[PathLike] = None,
+        disk_cache_ttl: t.Optional[int] = DISK_CACHE_TTL,
         **kwargs: t.Dict[str, t.Any],
     ) -> None:
         """Easy all-in-one connection handler.
@@ -336,6 +366,32 @@ log_body_lines = 10000
             auth_null: null auth model to use for this connection
             max_retries: number of times to retry a failed connection
             retry_backoff: number of seconds to wait between retries, will be multiplied against the current retry attempt
+            pool_connections: number of connection pools (one per host) to keep open
+            pool_maxsize: maximum number of connections to keep open to each host
+            pool_block: wait for a connection to be free instead of opening an extra one
+                when a pool is full
+            keep_alive: keep connections open to be reused by later requests
+            http2: send requests using HTTP/2, requires the httpx package with the http2 extra
+            retry_policy: policy for retrying requests, if not supplied one is created using
+                max_retries as the maximum attempts and retry_backoff as the first delay
+            rate_limit: maximum requests per second to send, None for no limit
+            rate_burst: requests that can be sent at once before the rate limit applies
+            max_in_flight: maximum requests to have waiting on a response at once
+            rate_limiter: rate limiter to use, i.e. to share limits with other clients,
+                if not supplied one is created using rate_limit, rate_burst and max_in_flight,
+                which only lowers the rate on 429 responses if any of those are supplied
+            history_max_items: maximum responses to keep in Http.HISTORY
+            history_max_bytes: maximum bytes of bodies to keep in Http.HISTORY
+            history_sample_rate: fraction of responses to add to Http.HISTORY
+            history_metadata_only: keep only the metadata of responses in Http.HISTORY
+            history_spill_path: gzip compressed JSONL file to write the metadata of the
+                responses added to Http.HISTORY to
+            history: history object to use, if not supplied one is created using the
+                history_* arguments
+            disk_cache: cache field schemas, adapters, and history dates on disk to reuse
+                them between runs
+            disk_cache_path: directory to store the disk cache in
+            disk_cache_ttl: seconds before an entry in the disk cache expires
             **kwargs: unused
         """
         self._url: str = url
@@ -414,6 +470,22 @@ log_body_lines = 10000
             "cf_echo_verbose": cf_echo_verbose,
             "max_retries": max_retries,
             "retry_backoff": retry_backoff,
+            "pool_connections": pool_connections,
+            "pool_maxsize": pool_maxsize,
+            "pool_block": pool_block,
+            "keep_alive": keep_alive,
+            "http2": http2,
+            "retry_policy": retry_policy,
+            "rate_limit": rate_limit,
+            "rate_burst": rate_burst,
+            "max_in_flight": max_in_flight,
+            "rate_limiter": rate_limiter,
+            "history_max_items": history_max_items,
+            "history_max_bytes": history_max_bytes,
+            "history_sample_rate": history_sample_rate,
+            "history_metadata_only": history_metadata_only,
+            "history_spill_path": history_spill_path,
+            "history": history,
         }
 
         self.set_wraperror(wraperror)
@@ -423,6 +495,9 @@ log_body_lines = 10000
         self.set_log_level_endpoints(value=log_level_endpoints)
         self.control_log_file(enable=log_file, rotate=log_file_rotate)
         self.control_log_console(enable=log_console)
+        self.DISK_CACHE: DiskCache = DiskCache(
+            path=disk_cache_path, ttl=disk_cache_ttl, enabled=disk_cache
+        )
         self.HTTP = self.http = self._init_http(http=http)
         self.AUTH = self.auth = self._init_auth(auth=auth, log_level=log_level_auth)
         self.AUTH_NULL: AuthModel = self._init_auth_null(
@@ -728,6 +803,32 @@ log_body_lines = 10000
             data = self.about.get("Build Date", "UNKNOWN")
         return data
 
+    def get_disk_cached(
+        self, name: str, func: t.Callable[[], t.Any], ttl: t.Optional[int] = None
+    ) -> t.Any:
+        """Get a value from :attr:`DISK_CACHE` or from func if it is not cached or is stale.
+
+        Args:
+            name: name of the cache entry
+            func: function to get the value with if it is not cached
+            ttl: seconds before the cache entry expires, defaults to the TTL of the cache
+
+        Notes:
+            Entries are keyed by the URL and user of this client and are stamped with the
+            version and build date of the instance from :attr:`about`, which is only fetched
+            once per client. If the about data can not be fetched, the cache is bypassed.
+        """
+        if not (self.DISK_CACHE.enabled and self.STARTED and self.about):
+            return func()
+
+        key = [self.url, self.__key]
+        stamp = {
+            "version": self.version,
+            "build_date": self.build_date,
+            "package": self.PKG_VERSION,
+        }
+        return self.DISK_CACHE.get(name=name, func=func, key=key, stamp=stamp, ttl=ttl)
+
     @property
     def str_ax_version(self) -> str:
         """Get the Axonius instance version & build date for use in str."""
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 """Constants for API models."""
-from typing import List
+from typing import List, Optional, Tuple
 
 from .general import ECHO
 
@@ -26,6 +26,24 @@ TABLE_FORMAT: str = "fancy_grid"
 TABLE_MAX_ROWS: int = 5
 """Default row limit for tablize export"""
 
+TABLE_STREAM_SAMPLE: int = 100
+"""Default number of rows to sample to fix the column widths of streamed tablize export"""
+
+TABLE_STREAM_WIDTH: int = 50
+"""Default maximum column width of streamed tablize export, longer values are wrapped"""
+
+TABLE_STREAM_HEADER_EVERY: int = 100
+"""Default number of rows to repeat the header after in streamed tablize export"""
+
+ASYNC_MAX_WORKERS: int = 32
+"""Default number of threads used by AsyncHttp to send requests concurrently"""
+
+ASYNC_CHUNK_SIZE: int = 1000
+"""Default number of items async generators of AsyncConnect models fetch per thread hop"""
+
+MAP_WORKERS_MAX: int = 16
+"""Maximum number of threads bounded_map in tools calls a function in concurrently"""
+
 MAX_PAGE_SIZE: int = 2000
 """maximum page size that REST API allows"""
 
@@ -35,6 +53,38 @@ PAGE_SIZE: int = MAX_PAGE_SIZE
 PAGE_SLEEP: int = 0
 """API wide default number of seconds to sleep between in page."""
 
+PARALLEL_PAGES: int = 0
+"""Default number of pages of assets to fetch concurrently (0 or 1 = fetch serially)."""
+
+PARALLEL_PAGES_MAX: int = 16
+"""Maximum number of pages of assets that can be fetched concurrently."""
+
+PREFETCH_PAGES: int = 0
+"""Default number of pages of assets to fetch ahead while processing the current page."""
+
+PREFETCH_PAGES_MAX: int = 16
+"""Maximum number of pages of assets that can be fetched ahead."""
+
+STREAM_PAGES: bool = False
+"""Default for deserializing pages of assets incrementally as they are read from the response."""
+
+STREAM_CHUNK_SIZE: int = 1024 * 64
+"""Number of bytes to read from the response at a time when streaming pages of assets."""
+
+STREAM_BUFFER_MAX: int = 1024 * 1024 * 64
+"""Maximum number of characters of a single asset to hold when streaming pages of assets."""
+
+COUNT_MODES: List[str] = ["before", "concurrent", "page"]
+"""Valid ways of getting the total count of assets when fetching pages of assets.
+
+- before: get the count before fetching the first page
+- concurrent: get the count in a background thread while the first page is fetched
+- page: use the total count from the metadata of each page, without getting the count
+"""
+
+COUNT_MODE: str = "before"
+"""Default way of getting the total count of assets when fetching pages of assets."""
+
 GUI_PAGE_SIZES: List[int] = [20, 50, 100]
 """valid page sizes for GUI page sizes for saved queries"""
 
@@ -44,6 +94,81 @@ TIMEOUT_CONNECT: int = 5
 TIMEOUT_RESPONSE: int = 900
 """seconds to wait for response from API."""
 
+RETRY_STATUS_CODES: Tuple[int, ...] = (429, 502, 503, 504)
+"""response status codes that are retried."""
+
+RETRY_METHODS: Tuple[str, ...] = ("DELETE", "GET", "HEAD", "OPTIONS", "PUT", "TRACE")
+"""idempotent HTTP methods that are retried for retryable status codes and read errors."""
+
+RETRY_BACKOFF_FACTOR: float = 2.0
+"""multiplier of the delay between each retry attempt."""
+
+RETRY_BACKOFF_MAX: float = 60.0
+"""maximum seconds to wait between retry attempts, unless a Retry-After header says more."""
+
+RETRY_JITTER: float = 0.5
+"""fraction of the delay between retry attempts to randomly subtract from it."""
+
+RETRY_BUDGET: float = 300.0
+"""maximum total seconds to wait between retry attempts of a single request."""
+
+RATE_LIMIT: Optional[float] = None
+"""maximum requests per second to send, None for no limit."""
+
+RATE_BURST: Optional[int] = None
+"""requests that can be sent at once before the rate limit applies, None for 1 second worth."""
+
+MAX_IN_FLIGHT: Optional[int] = None
+"""maximum requests to have waiting on a response at once, None for no limit."""
+
+RATE_ADAPT: bool = True
+"""lower the rate limit when a 429 response is received, and slowly raise it back after."""
+
+RATE_ADAPT_FACTOR: float = 0.5
+"""multiplier of the rate limit for each 429 response received."""
+
+RATE_ADAPT_MIN: float = 0.1
+"""lowest requests per second that the rate limit will be lowered to."""
+
+RATE_ADAPT_RECOVER: int = 50
+"""responses that are not 429 to receive before raising the rate limit back by a step."""
+
+HISTORY_MAX_ITEMS: int = 1000
+"""maximum responses to keep in the history of Http, the oldest are dropped first."""
+
+HISTORY_MAX_BYTES: int = 100 * 1024 * 1024
+"""maximum bytes of request and response bodies to keep in the history of Http."""
+
+HISTORY_SAMPLE_RATE: float = 1.0
+"""fraction of responses to add to the history of Http."""
+
+POOL_CONNECTIONS: int = 10
+"""number of connection pools (one per host) to keep open."""
+
+POOL_MAXSIZE: int = 32
+"""maximum number of connections to keep open to each host."""
+
+POOL_BLOCK: bool = False
+"""wait for a connection to be free instead of opening an extra one when a pool is full."""
+
+KEEP_ALIVE: bool = True
+"""keep connections open to be reused by later requests."""
+
+HTTP2: bool = False
+"""send requests using HTTP/2, requires the httpx package with the http2 extra."""
+
+DISK_CACHE_ENABLED: bool = False
+"""cache field schemas, adapters, and history dates on disk to reuse them between runs."""
+
+DISK_CACHE_DIR: str = "axonius_api_client"
+"""name of directory under the cache directory of the user to store the disk cache in."""
+
+DISK_CACHE_TTL: int = 3600
+"""seconds before an entry in the disk cache expires."""
+
+DISK_CACHE_TTL_HISTORY_DATES: int = 600
+"""seconds before the history dates in the disk cache expire."""
+
 DEFAULT_CALLBACKS_CLS: str = "base"
 """Default callback object to use"""
 
@@ -67,10 +192,52 @@ TASK_SLOW_WARNING = """
 Notice:
   Fetching a page of tasks as "basic models" is fast, but fetching each task
   individually to get the "full models" is quite slow.
-  Use as many filters as possible to minimize the number of "full models" that must be fetched.
+  Use as many filters as possible to minimize the number of "full models" that must be fetched,
+  and use workers to fetch more than one "full model" at a time.
 
 """
 
+TASK_FULL_WORKERS: int = 1
+"""Default number of tasks to fetch the full model of concurrently."""
+
+TASK_FULL_ERRORS: List[str] = ["raise", "skip"]
+"""Valid ways of handling an error fetching the full model of a task.
+
+- raise: raise the error, stopping the fetch of tasks
+- skip: log the error and skip the task
+"""
+
+TASK_FULL_ERROR: str = "raise"
+"""Default way of handling an error fetching the full model of a task."""
+
+LABELS_CHUNK_SIZE: int = 5000
+"""Maximum number of asset IDs to send in each request of a bulk add or remove of tags."""
+
+LABELS_CHUNK_BYTES: int = 1024 * 1024
+"""Maximum size in bytes of the asset IDs to send in each request of a bulk add or remove of
+tags."""
+
+LABELS_WORKERS: int = 1
+"""Default number of requests of a bulk add or remove of tags to send concurrently."""
+
+RUNNER_CHUNK_SIZE: int = 1000
+"""Maximum number of Asset IDs in each query used by Runner to verify or run against them."""
+
+RUNNER_WORKERS: int = 4
+"""Default number of count queries Runner sends concurrently to verify Asset IDs."""
+
+LOOKUP_CHUNK_SIZE: int = 100
+"""Maximum number of values in each query of a lookup of assets by many values."""
+
+LOOKUP_WORKERS: int = 4
+"""Default number of queries of a lookup of assets by many values to send concurrently."""
+
+LOOKUP_CACHE_MAXSIZE: int = 100000
+"""Maximum number of values to keep the assets of in the cache of lookups of assets."""
+
+LOOKUP_CACHE_TTL: int = 600
+"""Seconds before the assets of a value in the cache of lookups of assets expire."""
+
 
 class FolderDefaults:
     """Pass."""
@@ -0,0 +1,279 @@
+# -*- coding: utf-8 -*-
+"""Persistent cache for API data that is slow to get and parse."""
+import hashlib
+import logging
+import os
+import pathlib
+import pickle
+import tempfile
+import threading
+import time
+import typing as t
+
+from .constants.api import DISK_CACHE_DIR, DISK_CACHE_TTL
+from .constants.ctypes import PathLike
+from .logs import get_obj_log
+from .tools import coerce_bool, get_path
+
+
+class DiskCache:
+    """Persistent cache of API data stored as pickle files.
+
+    Notes:
+        Entries are stored in a directory for each instance URL and user, and each entry
+        is stamped with the version and build date of the instance and the version of this
+        package. An entry is only used if its stamp matches and it is younger than its TTL,
+        so an upgrade of either side invalidates the cache.
+
+        Entries are written with pickle, so by default the cache is stored in the cache
+        directory of the user running the client, and every directory is created with mode
+        0o700. On systems with file ownership, an entry is only loaded if it, its directory
+        and the cache directory are owned by the user running the client and are not
+        writable by group or others.
+
+    Examples:
+        Enable the disk cache for a client, so the schemas of fields are only fetched and
+        parsed once an hour across runs.
+
+        >>> client = axonapi.Connect(**client_args, disk_cache=True)
+        >>> client.start()
+        >>> fields = client.devices.fields.get()
+        >>> client.DISK_CACHE
+        DiskCache(path=PosixPath('/home/user/.cache/axonius_api_client'), ttl=3600, hits=1, misses=0)
+    """
+
+    def __init__(
+        self,
+        path: t.Optional[PathLike] = None,
+        ttl: t.Optional[int] = DISK_CACHE_TTL,
+        enabled: bool = True,
+    ):
+        """Persistent cache of API data stored as pickle files.
+
+        Args:
+            path: directory to store entries in, defaults to :meth:`get_default_path`
+            ttl: seconds before an entry expires, None for never
+            enabled: if False, values are never loaded from or saved to disk
+        """
+        self.path: pathlib.Path = get_path(path or self.get_default_path())
+        self.ttl: t.Optional[int] = ttl
+        self.enabled: bool = coerce_bool(enabled)
+        self.hits: int = 0
+        self.misses: int = 0
+        self.LOG: logging.Logger = get_obj_log(obj=self)
+        self._lock: threading.Lock = threading.Lock()
+
+    @staticmethod
+    def get_default_path() -> pathlib.Path:
+        """Get the default directory to store entries in.
+
+        Notes:
+            This is DISK_CACHE_DIR under $XDG_CACHE_HOME, %LOCALAPPDATA% on Windows, or
+            ~/.cache.
+        """
+        base = os.environ.get("XDG_CACHE_HOME") or os.environ.get("LOCALAPPDATA")
+        base = pathlib.Path(base) if base else pathlib.Path.home() / ".cache"
+        return base / DISK_CACHE_DIR
+
+    @staticmethod
+    def check_secure(
+        path: pathlib.Path, stat: t.Optional[os.stat_result] = None
+    ) -> t.Optional[str]:
+        """Check that a file or directory of the cache is safe to load entries from.
+
+        Args:
+            path: file or directory to check
+            stat: stat of path, fetched if not supplied
+
+        Returns:
+            why path is not safe, or None if it is safe or the system has no file ownership
+        """
+        if not hasattr(os, "getuid"):
+            return None
+
+        stat = stat or path.stat()
+        uid = os.getuid()
+        if stat.st_uid != uid:
+            return f"{path} is owned by uid {stat.st_uid} instead of uid {uid}"
+        if stat.st_mode & 0o022:
+            return f"{path} is writable by group or others (mode {oct(stat.st_mode & 0o777)})"
+        return None
+
+    @staticmethod
+    def get_digest(*values: t.Any) -> str:
+        """Get a digest of values to use as a directory name.
+
+        Args:
+            *values: values to get digest of, i.e. URL and user
+        """
+        return hashlib.sha256("\0".join(str(x) for x in values).encode()).hexdigest()[:32]
+
+    def get_file(self, name: str, key: t.Iterable[t.Any]) -> pathlib.Path:
+        """Get the path to the file of an entry.
+
+        Args:
+            name: name of entry
+            key: values that identify the instance and user of the entry
+        """
+        return self.path / self.get_digest(*key) / f"{name}.pickle"
+
+    def load(
+        self,
+        name: str,
+        key: t.Iterable[t.Any],
+        stamp: dict,
+        ttl: t.Optional[int] = None,
+    ) -> t.Tuple[bool, t.Any]:
+        """Load the value of an entry.
+
+        Args:
+            name: name of entry
+            key: values that identify the instance and user of the entry
+            stamp: values that must match the stamp of the entry, i.e. versions
+            ttl: seconds before the entry expires, defaults to :attr:`ttl`
+
+        Returns:
+            tuple of (True, value) if the entry is valid, otherwise (False, None)
+        """
+        if not self.enabled:
+            return False, None
+
+        file = self.get_file(name=name, key=key)
+        ttl = self.ttl if ttl is None else ttl
+        reason = None
+        insecure = None
+        try:
+            with file.open("rb") as fh:
+                insecure = (
+                    self.check_secure(path=file, stat=os.fstat(fh.fileno()))
+                    or self.check_secure(path=file.parent)
+                    or self.check_secure(path=self.path)
+                )
+                entry = None if insecure else pickle.load(fh)
+        except FileNotFoundError:
+            reason = "no entry"
+        except Exception as exc:
+            reason = f"unable to load entry: {exc}"
+        else:
+            age = time.time() - entry.get("created", 0) if entry else 0
+            if insecure:
+                reason = f"refusing to load entry: {insecure}"
+                self.LOG.warning(f"Disk cache entry {name!r} in {file} ignored: {insecure}")
+            elif entry.get("stamp") != stamp:
+                reason = f"stamp {entry.get('stamp')} does not match {stamp}"
+            elif ttl is not None and age > ttl:
+                reason = f"entry expired {age - ttl:.1f} seconds ago"
+
+        with self._lock:
+            if reason:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        if reason:
+            self.LOG.debug(f"Disk cache miss for {name!r} in {file}: {reason}")
+            return False, None
+
+        self.LOG.debug(f"Disk cache hit for {name!r} in {file}")
+        return True, entry["value"]
+
+    def save(
+        self, name: str, key: t.Iterable[t.Any], stamp: dict, value: t.Any
+    ) -> t.Optional[pathlib.Path]:
+        """Save the value of an entry.
+
+        Args:
+            name: name of entry
+            key: values that identify the instance and user of the entry
+            stamp: values to stamp the entry with, i.e. versions
+            value: value to save
+
+        Notes:
+            The entry is written to a temporary file that is renamed over the entry, so
+            concurrent runs never load a partially written entry.
+        """
+        if not self.enabled:
+            return None
+
+        file = self.get_file(name=name, key=key)
+        self.path.mkdir(mode=0o700, parents=True, exist_ok=True)
+        file.parent.mkdir(mode=0o700, exist_ok=True)
+        entry = {"created": time.time(), "stamp": stamp, "value": value}
+
+        fd, tmp = tempfile.mkstemp(dir=str(file.parent), prefix=f".{name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                pickle.dump(entry, fh, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, str(file))
+        except Exception:
+            os.remove(tmp)
+            raise
+
+        self.LOG.debug(f"Saved {name!r} to disk cache in {file}")
+        return file
+
+    def get(
+        self,
+        name: str,
+        func: t.Callable[[], t.Any],
+        key: t.Iterable[t.Any],
+        stamp: dict,
+        ttl: t.Optional[int] = None,
+    ) -> t.Any:
+        """Get the value of an entry, or get it from func and save it if it is not valid.
+
+        Args:
+            name: name of entry
+            func: function to get the value with if the entry is not valid
+            key: values that identify the instance and user of the entry
+            stamp: values that must match the stamp of the entry, i.e. versions
+            ttl: seconds before the entry expires, defaults to :attr:`ttl`
+        """
+        key = list(key)
+        found, value = self.load(name=name, key=key, stamp=stamp, ttl=ttl)
+        if found:
+            return value
+
+        value = func()
+        try:
+            self.save(name=name, key=key, stamp=stamp, value=value)
+        except Exception as exc:
+            self.LOG.warning(f"Unable to save {name!r} to disk cache in {self.path}: {exc}")
+        return value
+
+    def clear(self) -> int:
+        """Remove all entries.
+
+        Returns:
+            number of entries removed
+        """
+        count = 0
+        for file in self.path.glob("*/*.pickle"):
+            try:
+                file.unlink()
+            except FileNotFoundError:
+                continue
+            count += 1
+        self.LOG.debug(f"Removed {count} entries from disk cache in {self.path}")
+        return count
+
+    def to_dict(self) -> dict:
+        """Get the settings and counters of this object."""
+        return {
+            "path": str(self.path),
+            "ttl": self.ttl,
+            "enabled": self.enabled,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def __str__(self) -> str:
+        """Pass."""
+        return (
+            f"{self.__class__.__name__}(path={self.path!r}, ttl={self.ttl}, "
+            f"hits={self.hits}, misses={self.misses})"
+        )
+
+    def __repr__(self) -> str:
+        """Pass."""
+        return self.__str__()
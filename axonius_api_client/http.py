@@ -1,19 +1,56 @@
 """HTTP client."""
+import collections
+import dataclasses
+import datetime
+import email.utils
+import gzip
+import io
+import json
 import logging
+import math
 import pathlib
+import random
+import threading
 import typing as t
 import warnings
 import time
+import zlib
 
 import OpenSSL  # noqa: TCH002
 import requests
+import requests.adapters
 import requests.cookies
 import requests.structures
+import requests.utils
 import urllib3
 import urllib3.exceptions
 
 from . import version
-from .constants.api import TIMEOUT_CONNECT, TIMEOUT_RESPONSE
+from .constants.api import (
+    HISTORY_MAX_BYTES,
+    HISTORY_MAX_ITEMS,
+    HISTORY_SAMPLE_RATE,
+    HTTP2,
+    KEEP_ALIVE,
+    MAX_IN_FLIGHT,
+    POOL_BLOCK,
+    POOL_CONNECTIONS,
+    POOL_MAXSIZE,
+    RATE_ADAPT,
+    RATE_ADAPT_FACTOR,
+    RATE_ADAPT_MIN,
+    RATE_ADAPT_RECOVER,
+    RATE_BURST,
+    RATE_LIMIT,
+    RETRY_BACKOFF_FACTOR,
+    RETRY_BACKOFF_MAX,
+    RETRY_BUDGET,
+    RETRY_JITTER,
+    RETRY_METHODS,
+    RETRY_STATUS_CODES,
+    TIMEOUT_CONNECT,
+    TIMEOUT_RESPONSE,
+)
 from .constants.ctypes import PathLike, PatternLikeListy
 from .constants.logs import (
     LOG_LEVEL_HTTP,
@@ -22,7 +59,7 @@ from .constants.logs import (
     RESPONSE_ATTR_MAP,
 )
 from .exceptions import HttpError
-from .logs import get_obj_log, set_log_level
+from .logs import LazyStr, get_obj_log, set_log_level
 from .projects import cert_human
 from .projects.cf_token import constants as cf_constants
 from .projects.cf_token.flows import flow_get_token
@@ -31,9 +68,11 @@ from .projects.url_parser import UrlParser
 from .setup_env import get_env_user_agent
 from .tools import (
     coerce_bool,
+    coerce_int,
     coerce_int_float,
     coerce_str,
     join_url,
+    json_dump,
     json_log,
     listify,
     path_read,
@@ -69,6 +108,936 @@ def is_cookies(value: t.Any) -> bool:
     return isinstance(value, (dict, requests.cookies.RequestsCookieJar))
 
 
+@dataclasses.dataclass
+class RetryPolicy:
+    """Policy for retrying requests sent by :obj:`Http`.
+
+    Notes:
+        Requests that fail to connect are retried for any method, since they never reached
+        the server. Responses with a status code in ``status_codes`` and errors after
+        connecting (i.e. read timeouts or dropped connections) are only retried for the
+        idempotent methods in ``methods``.
+
+        The delay before each retry is ``backoff * backoff_factor ** (attempt - 1)``, capped at
+        ``backoff_max``, with up to ``jitter`` (a fraction of the delay) randomly subtracted.
+        If ``retry_after`` is True and the response has a Retry-After header, the delay it
+        asks for is used instead.
+
+        Nothing is retried once ``max_attempts`` requests have been sent, or if the delay
+        would bring the total seconds waited between attempts of a request above ``budget``.
+
+    Examples:
+        >>> policy = RetryPolicy(max_attempts=5, backoff=1, budget=120)
+        >>> client = axonapi.Connect(**client_args, retry_policy=policy)
+    """
+
+    max_attempts: int = 3
+    """Maximum number of times to send a request."""
+
+    backoff: float = 5
+    """Seconds to wait before the first retry."""
+
+    backoff_factor: float = RETRY_BACKOFF_FACTOR
+    """Multiplier of the delay between each retry."""
+
+    backoff_max: float = RETRY_BACKOFF_MAX
+    """Maximum seconds to wait between retries, unless a Retry-After header says more."""
+
+    jitter: float = RETRY_JITTER
+    """Fraction of the delay between retries to randomly subtract from it."""
+
+    status_codes: t.Tuple[int, ...] = RETRY_STATUS_CODES
+    """Response status codes to retry."""
+
+    methods: t.Tuple[str, ...] = RETRY_METHODS
+    """Idempotent methods to retry for retryable status codes and errors after connecting."""
+
+    retry_after: bool = True
+    """Use the delay from the Retry-After header of a response if it has one."""
+
+    budget: t.Optional[float] = RETRY_BUDGET
+    """Maximum total seconds to wait between retries of a request, None for no limit."""
+
+    CONNECT_ERRORS: t.ClassVar[t.Tuple[t.Type[Exception], ...]] = (
+        urllib3.exceptions.NewConnectionError,
+        urllib3.exceptions.ConnectTimeoutError,
+    )
+    """Errors wrapped by :obj:`requests.ConnectionError` that mean no connection was made."""
+
+    READ_ERRORS: t.ClassVar[t.Tuple[t.Type[Exception], ...]] = (
+        requests.ConnectionError,
+        requests.Timeout,
+        requests.exceptions.ChunkedEncodingError,
+    )
+    """Errors after connecting that are retried for idempotent methods."""
+
+    def __post_init__(self):
+        """Dataclasses post init."""
+        self.max_attempts = max(coerce_int(self.max_attempts), 1)
+        self.methods = tuple(x.upper() for x in listify(self.methods))
+        self.status_codes = tuple(coerce_int(x) for x in listify(self.status_codes))
+
+    def is_connect_error(self, exc: Exception) -> bool:
+        """Check if an error means the request never reached the server.
+
+        Args:
+            exc: error raised while sending a request
+        """
+        if isinstance(exc, requests.ConnectTimeout):
+            return True
+        reason = exc.args[0] if isinstance(exc, requests.ConnectionError) and exc.args else None
+        reason = getattr(reason, "reason", reason)
+        return isinstance(reason, self.CONNECT_ERRORS)
+
+    def is_retryable(
+        self,
+        method: t.Optional[str] = None,
+        response: t.Optional[requests.Response] = None,
+        exc: t.Optional[Exception] = None,
+        idempotent: t.Optional[bool] = None,
+    ) -> bool:
+        """Check if a request can be retried.
+
+        Args:
+            method: HTTP method of the request
+            response: response received, if any
+            exc: error raised while sending the request, if any
+            idempotent: override the check of method against :attr:`methods`
+        """
+        if idempotent is None:
+            idempotent = str(method or "").upper() in self.methods
+
+        if exc is not None and self.is_connect_error(exc=exc):
+            return True
+
+        if not idempotent:
+            return False
+
+        if response is not None:
+            return response.status_code in self.status_codes
+        return isinstance(exc, self.READ_ERRORS)
+
+    def get_retry_after(self, response: t.Optional[requests.Response]) -> t.Optional[float]:
+        """Get the seconds to wait from the Retry-After header of a response.
+
+        Args:
+            response: response to get the header from
+        """
+        value = getattr(response, "headers", {}).get("Retry-After")
+        if not (self.retry_after and value):
+            return None
+
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            pass
+
+        try:
+            retry_dt = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        now_dt = datetime.datetime.now(tz=retry_dt.tzinfo or datetime.timezone.utc)
+        return max((retry_dt - now_dt).total_seconds(), 0.0)
+
+    def get_backoff(self, attempt: int) -> float:
+        """Get the jittered exponential delay before a retry.
+
+        Args:
+            attempt: number of attempts sent so far
+        """
+        delay = min(self.backoff * self.backoff_factor ** (attempt - 1), self.backoff_max)
+        return delay * (1 - self.jitter * random.random())
+
+    def get_delay(
+        self,
+        attempt: int,
+        waited: float = 0.0,
+        method: t.Optional[str] = None,
+        response: t.Optional[requests.Response] = None,
+        exc: t.Optional[Exception] = None,
+        idempotent: t.Optional[bool] = None,
+    ) -> t.Optional[float]:
+        """Get the seconds to wait before retrying a request, or None to not retry it.
+
+        Args:
+            attempt: number of attempts sent so far
+            waited: seconds waited between the attempts sent so far
+            method: HTTP method of the request
+            response: response received, if any
+            exc: error raised while sending the request, if any
+            idempotent: override the check of method against :attr:`methods`
+        """
+        if attempt >= self.max_attempts:
+            return None
+
+        if not self.is_retryable(method=method, response=response, exc=exc, idempotent=idempotent):
+            return None
+
+        delay = self.get_retry_after(response=response)
+        if delay is None:
+            delay = self.get_backoff(attempt=attempt)
+
+        if self.budget is not None and waited + delay > self.budget:
+            return None
+        return delay
+
+
+class RateLimiter:
+    """Token bucket rate limit and in-flight request limit for :obj:`Http` objects.
+
+    Notes:
+        Every request sent by :meth:`Http.__call__`, including retries, takes a token from a
+        bucket that refills at ``rate`` tokens per second and holds at most ``burst`` tokens,
+        and holds one of ``max_in_flight`` slots until its response headers are received.
+
+        If ``adapt`` is True, each 429 response multiplies the rate by ``adapt_factor``, down to
+        ``adapt_min``. If no rate was set, the first 429 response sets it from the rate that
+        requests were being sent at. After ``adapt_recover`` responses in a row that are not
+        429, the rate is raised back by one step, until it is back to the rate supplied.
+
+        One object can be supplied to many :obj:`Http` objects (or
+        :obj:`axonius_api_client.connect.Connect` objects) so they share the limits, i.e. for
+        scripts that share an API key.
+
+    Examples:
+        >>> limiter = RateLimiter(rate=5, max_in_flight=4)
+        >>> client1 = axonapi.Connect(**client_args, rate_limiter=limiter)
+        >>> client2 = axonapi.Connect(**client_args, rate_limiter=limiter)
+        >>> limiter.to_dict()
+    """
+
+    def __init__(
+        self,
+        rate: t.Optional[float] = RATE_LIMIT,
+        burst: t.Optional[int] = RATE_BURST,
+        max_in_flight: t.Optional[int] = MAX_IN_FLIGHT,
+        adapt: bool = RATE_ADAPT,
+        adapt_factor: float = RATE_ADAPT_FACTOR,
+        adapt_min: float = RATE_ADAPT_MIN,
+        adapt_recover: int = RATE_ADAPT_RECOVER,
+    ):
+        """Token bucket rate limit and in-flight request limit for :obj:`Http` objects.
+
+        Args:
+            rate: maximum requests per second to send, None for no limit
+            burst: requests that can be sent at once before the rate limit applies,
+                None for 1 second worth of requests
+            max_in_flight: maximum requests to have waiting on a response at once,
+                None for no limit
+            adapt: lower the rate when a 429 response is received
+            adapt_factor: multiplier of the rate for each 429 response received
+            adapt_min: lowest requests per second that the rate will be lowered to
+            adapt_recover: responses that are not 429 to receive before raising the rate
+        """
+        self.rate_supplied: t.Optional[float] = coerce_int_float(rate) if rate else None
+        self.rate: t.Optional[float] = self.rate_supplied
+        self.burst_supplied: t.Optional[int] = coerce_int(burst, min_value=1) if burst else None
+        self.max_in_flight: t.Optional[int] = (
+            coerce_int(max_in_flight, min_value=1) if max_in_flight else None
+        )
+        self.adapt: bool = coerce_bool(adapt)
+        self.adapt_factor: float = adapt_factor
+        self.adapt_min: float = adapt_min
+        self.adapt_recover: int = adapt_recover
+
+        self.lock: threading.Lock = threading.Lock()
+        self.semaphore: t.Optional[threading.BoundedSemaphore] = (
+            threading.BoundedSemaphore(self.max_in_flight) if self.max_in_flight else None
+        )
+        self.tokens: float = self.burst
+        self.updated: float = time.monotonic()
+        self.ceiling: t.Optional[float] = self.rate
+        self.sent: t.Deque[float] = collections.deque(maxlen=20)
+        self.recovering: int = 0
+
+        self.requests: int = 0
+        self.throttled: int = 0
+        self.wait_seconds: float = 0.0
+        self.wait_seconds_max: float = 0.0
+
+    @property
+    def burst(self) -> int:
+        """Maximum tokens the bucket holds."""
+        return self.burst_supplied or max(int(math.ceil(self.rate or 1)), 1)
+
+    def acquire(self) -> float:
+        """Wait for an in-flight slot and a token, then return the seconds waited.
+
+        Notes:
+            :meth:`release` must be called once the response has been received.
+
+        Returns:
+            the seconds waited, 0.0 if a slot and a token were free without waiting
+        """
+        start: float = time.perf_counter()
+        blocked: bool = False
+        if self.semaphore is not None and not self.semaphore.acquire(blocking=False):
+            blocked = True
+            self.semaphore.acquire()
+
+        try:
+            while self.rate is not None:
+                with self.lock:
+                    if self.rate is None:
+                        break
+                    now: float = time.monotonic()
+                    self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                    self.updated = now
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        break
+                    delay: float = (1 - self.tokens) / self.rate
+                blocked = True
+                time.sleep(delay)
+        except BaseException:
+            self.release()
+            raise
+
+        waited: float = time.perf_counter() - start if blocked else 0.0
+        with self.lock:
+            self.sent.append(time.monotonic())
+            self.requests += 1
+            self.wait_seconds += waited
+            self.wait_seconds_max = max(self.wait_seconds_max, waited)
+        return waited
+
+    def release(self):
+        """Release the in-flight slot taken by :meth:`acquire`."""
+        if self.semaphore is not None:
+            self.semaphore.release()
+
+    def get_sent_rate(self) -> t.Optional[float]:
+        """Get the requests per second that the most recent requests were sent at."""
+        if len(self.sent) < 2:
+            return None
+        seconds: float = self.sent[-1] - self.sent[0]
+        return (len(self.sent) - 1) / seconds if seconds > 0 else None
+
+    def check_response(self, response: requests.Response) -> t.Optional[float]:
+        """Adapt the rate to the status code of a response.
+
+        Args:
+            response: response received
+
+        Returns:
+            the rate in use after adapting
+        """
+        if not self.adapt:
+            return self.rate
+
+        with self.lock:
+            if response.status_code == 429:
+                self.throttled += 1
+                self.recovering = 0
+                rate: t.Optional[float] = self.rate or self.get_sent_rate() or self.burst
+                if self.ceiling is None:
+                    self.ceiling = rate
+                self.rate = max(rate * self.adapt_factor, self.adapt_min)
+                self.tokens = min(self.tokens, 0)
+            elif self.rate is not None and self.rate < (self.ceiling or 0):
+                self.recovering += 1
+                if self.recovering >= self.adapt_recover:
+                    self.recovering = 0
+                    self.rate = min(self.rate / self.adapt_factor, self.ceiling)
+                    if self.rate >= self.ceiling:
+                        self.rate = self.rate_supplied
+                        self.ceiling = self.rate_supplied
+            return self.rate
+
+    def to_dict(self) -> dict:
+        """Get the state of the limits and the waits they caused."""
+        return {
+            "rate": self.rate,
+            "rate_supplied": self.rate_supplied,
+            "burst": self.burst,
+            "max_in_flight": self.max_in_flight,
+            "requests": self.requests,
+            "throttled": self.throttled,
+            "wait_seconds": self.wait_seconds,
+            "wait_seconds_max": self.wait_seconds_max,
+        }
+
+    def __str__(self) -> str:
+        """Pass."""
+        items = [f"{k}={v}" for k, v in self.to_dict().items()]
+        return f"{self.__class__.__name__}({', '.join(items)})"
+
+    def __repr__(self) -> str:
+        """Pass."""
+        return self.__str__()
+
+
+class ConnectionCounters:
+    """Counters of connections opened and reused by the transport adapters of :obj:`Http`."""
+
+    def __init__(self):
+        self.lock: threading.Lock = threading.Lock()
+        self.opened: int = 0
+        self.requests: int = 0
+
+    def add(self, opened: int = 0, requests: int = 0):
+        """Add to the counters.
+
+        Args:
+            opened: number of connections opened
+            requests: number of requests sent
+        """
+        with self.lock:
+            self.opened += opened
+            self.requests += requests
+
+    @property
+    def reused(self) -> int:
+        """Number of requests sent over a connection that was already open."""
+        return max(self.requests - self.opened, 0)
+
+    def to_dict(self) -> dict:
+        """Get the counters as a dict."""
+        return {"opened": self.opened, "reused": self.reused, "requests": self.requests}
+
+    def __str__(self) -> str:
+        """Pass."""
+        items = [f"{k}={v}" for k, v in self.to_dict().items()]
+        return f"{self.__class__.__name__}({', '.join(items)})"
+
+    def __repr__(self) -> str:
+        """Pass."""
+        return self.__str__()
+
+
+class ResponseHistory:
+    """Bounded and sampled history of the responses received by :obj:`Http`.
+
+    Notes:
+        Responses are kept in a ring buffer: once more than ``max_items`` responses are kept,
+        or the request and response bodies of the kept responses add up to more than
+        ``max_bytes``, the oldest are dropped. Only ``sample_rate`` (a fraction) of the
+        responses received are added.
+
+        If ``metadata_only`` is True, a dict from :meth:`get_metadata` (method, URL, status,
+        timings and sizes) is kept instead of each response, so no bodies are kept in memory.
+
+        If ``spill_path`` is supplied, the metadata of each response added is also written
+        as a line of JSON to a gzip compressed file, along with the request and response
+        bodies if ``spill_bodies`` is True, and only the metadata is kept in memory.
+        Bodies may contain credentials and tokens. Each line is written as a complete gzip
+        member, so the file can be read while the client is running or after it crashed.
+
+    Examples:
+        >>> history = ResponseHistory(max_items=100, sample_rate=0.1, metadata_only=True)
+        >>> client = axonapi.Connect(**client_args, save_history=True, history=history)
+        >>> client.http.HISTORY.to_list()
+
+        Spill the history of a long export to disk for post-mortem analysis.
+
+        >>> history = ResponseHistory(spill_path="history.jsonl.gz")
+        >>> client = axonapi.Connect(**client_args, save_history=True, history=history)
+        >>> list(ResponseHistory.read_spill(path="history.jsonl.gz"))
+    """
+
+    def __init__(
+        self,
+        max_items: t.Optional[int] = HISTORY_MAX_ITEMS,
+        max_bytes: t.Optional[int] = HISTORY_MAX_BYTES,
+        sample_rate: float = HISTORY_SAMPLE_RATE,
+        metadata_only: bool = False,
+        spill_path: t.Optional[PathLike] = None,
+        spill_bodies: bool = False,
+    ):
+        """Bounded and sampled history of the responses received by :obj:`Http`.
+
+        Args:
+            max_items: maximum responses to keep, None for no limit
+            max_bytes: maximum bytes of request and response bodies to keep, None for no limit
+            sample_rate: fraction of responses to add, between 0 and 1
+            metadata_only: keep the metadata of each response instead of the response
+            spill_path: path to a gzip compressed JSONL file to append the metadata of each
+                response to
+            spill_bodies: include the request and response bodies in the lines written to
+                spill_path
+        """
+        self.max_items: t.Optional[int] = max_items
+        self.max_bytes: t.Optional[int] = max_bytes
+        self.sample_rate: float = min(max(float(sample_rate), 0.0), 1.0)
+        self.metadata_only: bool = coerce_bool(metadata_only)
+        self.spill_path: t.Optional[pathlib.Path] = (
+            pathlib.Path(spill_path).expanduser().resolve() if spill_path else None
+        )
+        self.spill_bodies: bool = coerce_bool(spill_bodies)
+
+        self.lock: threading.Lock = threading.Lock()
+        self.items: t.Deque[t.Tuple[t.Union[requests.Response, dict], int]] = collections.deque()
+        self.bytes: int = 0
+        self.received: int = 0
+        self.added: int = 0
+        self.dropped: int = 0
+
+    @staticmethod
+    def get_metadata(response: requests.Response) -> dict:
+        """Get the method, URL, status, timings and sizes of a response.
+
+        Args:
+            response: response to get the metadata of
+
+        Notes:
+            The body of a response sent with stream=True is not read, its size is taken
+            from the Content-Length header.
+        """
+        request = response.request
+        body = getattr(request, "body", None)
+        content = getattr(response, "_content", False)
+        if isinstance(content, bytes):
+            response_bytes = len(content)
+        else:
+            response_bytes = coerce_int(response.headers.get("Content-Length") or 0)
+
+        return {
+            "dt": datetime.datetime.now(datetime.timezone.utc),
+            "method": getattr(request, "method", None),
+            "url": response.url,
+            "status_code": response.status_code,
+            "reason": response.reason,
+            "elapsed_seconds": response.elapsed.total_seconds() if response.elapsed else 0.0,
+            "rate_limit_seconds": getattr(response, "RATE_LIMIT_SECONDS", 0.0),
+            "request_bytes": len(body) if body else 0,
+            "response_bytes": response_bytes,
+        }
+
+    def add(self, response: requests.Response) -> bool:
+        """Add a response to the history if it is sampled.
+
+        Args:
+            response: response to add
+
+        Returns:
+            True if the response was added
+        """
+        with self.lock:
+            self.received += 1
+            if self.sample_rate < 1 and random.random() >= self.sample_rate:
+                return False
+
+            metadata: dict = self.get_metadata(response=response)
+            if self.spill_path:
+                self.spill(response=response, metadata=metadata)
+
+            if self.metadata_only or self.spill_path:
+                item, size = metadata, 0
+            else:
+                item = response
+                size = metadata["request_bytes"]
+                size += metadata["response_bytes"] if response._content_consumed else 0
+
+            self.items.append((item, size))
+            self.bytes += size
+            self.added += 1
+            while self.items and (
+                (self.max_items is not None and len(self.items) > self.max_items)
+                or (self.max_bytes is not None and self.bytes > self.max_bytes)
+            ):
+                _, dropped_size = self.items.popleft()
+                self.bytes -= dropped_size
+                self.dropped += 1
+            return True
+
+    append = add
+
+    def spill(self, response: requests.Response, metadata: dict):
+        """Write the metadata of a response as a line to :attr:`spill_path`.
+
+        Args:
+            response: response to write
+            metadata: metadata of the response from :meth:`get_metadata`
+        """
+        line: dict = dict(metadata)
+        if self.spill_bodies:
+            line["request_body"] = coerce_str(value=getattr(response.request, "body", None))
+            line["response_body"] = response.text if response._content_consumed else None
+
+        self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+        with gzip.open(self.spill_path, "ab") as fh:
+            fh.write((json_dump(obj=line, indent=None, fast=True) + "\n").encode("utf-8"))
+
+    @staticmethod
+    def read_spill(path: PathLike) -> t.Generator[dict, None, None]:
+        """Read the lines written to a spill file.
+
+        Args:
+            path: path of the spill file
+
+        Notes:
+            A line that was being written when the client died is truncated and is skipped.
+        """
+        with gzip.open(pathlib.Path(path).expanduser(), "rt", encoding="utf-8") as fh:
+            while True:
+                try:
+                    line = fh.readline()
+                except (EOFError, OSError, zlib.error):
+                    return
+                if not line:
+                    return
+                if not line.endswith("\n"):
+                    return
+                if line.strip():
+                    yield json.loads(line)
+
+    def to_list(self) -> t.List[dict]:
+        """Get the metadata of each response kept."""
+        return [x if isinstance(x, dict) else self.get_metadata(response=x) for x in self]
+
+    def clear(self):
+        """Remove all responses kept."""
+        with self.lock:
+            self.items.clear()
+            self.bytes = 0
+
+    def close(self):
+        """Close the history.
+
+        Notes:
+            The spill file is opened and closed for each line written, so there is nothing
+            left to flush; this is kept so callers can close a history they own.
+        """
+
+    def __iter__(self) -> t.Iterator[t.Union[requests.Response, dict]]:
+        """Iterate over the responses kept, oldest first."""
+        return iter([x for x, _ in list(self.items)])
+
+    def __len__(self) -> int:
+        """Get the number of responses kept."""
+        return len(self.items)
+
+    def __getitem__(
+        self, index: t.Union[int, slice]
+    ) -> t.Union[requests.Response, dict, t.List[t.Union[requests.Response, dict]]]:
+        """Get a response kept by index, or a list of responses kept by slice."""
+        if isinstance(index, slice):
+            return [x for x, _ in list(self.items)][index]
+        return self.items[index][0]
+
+    def __contains__(self, value: t.Any) -> bool:
+        """Check if a response is kept."""
+        return any(x is value for x, _ in list(self.items))
+
+    def __str__(self) -> str:
+        """Pass."""
+        items = [
+            f"items={len(self)}",
+            f"bytes={self.bytes}",
+            f"received={self.received}",
+            f"added={self.added}",
+            f"dropped={self.dropped}",
+            f"spill_path={str(self.spill_path) if self.spill_path else None!r}",
+        ]
+        return f"{self.__class__.__name__}({', '.join(items)})"
+
+    def __repr__(self) -> str:
+        """Pass."""
+        return self.__str__()
+
+
+class PoolAdapter(requests.adapters.HTTPAdapter):
+    """HTTP/1.1 transport adapter that counts the connections its pools open and reuse."""
+
+    def __init__(self, counters: ConnectionCounters, **kwargs):
+        """HTTP/1.1 transport adapter that counts the connections its pools open and reuse.
+
+        Args:
+            counters: counters to add connections opened and requests sent to
+            **kwargs: passed to :obj:`requests.adapters.HTTPAdapter`
+        """
+        self.counters: ConnectionCounters = counters
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        """Create the pool manager with counting pool classes."""
+        super().init_poolmanager(*args, **kwargs)
+        self.set_pool_classes(manager=self.poolmanager)
+
+    def proxy_manager_for(self, proxy: str, **proxy_kwargs):
+        """Create or get the proxy manager for a proxy with counting pool classes."""
+        is_new = proxy not in self.proxy_manager
+        manager = super().proxy_manager_for(proxy, **proxy_kwargs)
+        if is_new:
+            self.set_pool_classes(manager=manager)
+        return manager
+
+    def set_pool_classes(self, manager: urllib3.PoolManager):
+        """Replace the pool classes of a pool manager with subclasses that count connections.
+
+        Args:
+            manager: pool manager to replace the pool classes of
+
+        Notes:
+            The pool classes in use by the manager are subclassed instead of the urllib3
+            defaults, so patches like the cert capturing pool of cert_human are kept.
+        """
+        counters = self.counters
+
+        def get_counting_cls(base: t.Type) -> t.Type:
+            class CountingConnection(base.ConnectionCls):
+                def connect(self):
+                    counters.add(opened=1)
+                    return super().connect()
+
+            class CountingPool(base):
+                ConnectionCls = CountingConnection
+
+                def urlopen(self, *args, **kwargs):
+                    counters.add(requests=1)
+                    return super().urlopen(*args, **kwargs)
+
+            CountingPool.__name__ = CountingPool.__qualname__ = f"Counting{base.__name__}"
+            CountingConnection.__name__ = f"Counting{base.ConnectionCls.__name__}"
+            CountingConnection.__qualname__ = CountingConnection.__name__
+            return CountingPool
+
+        manager.pool_classes_by_scheme = {
+            k: get_counting_cls(v) for k, v in manager.pool_classes_by_scheme.items()
+        }
+
+
+class Http2Stream(io.RawIOBase):
+    """File-like object that reads the body of a streamed response from httpx.
+
+    Notes:
+        Used as :attr:`requests.Response.raw` by :obj:`Http2Adapter` when a request is sent
+        with stream=True, so :meth:`requests.Response.iter_content` reads the body as it
+        arrives. The bytes read are already decoded from any Content-Encoding.
+    """
+
+    def __init__(self, response):
+        """Pass.
+
+        Args:
+            response (:obj:`httpx.Response`): response sent with stream=True
+        """
+        super().__init__()
+        self.response = response
+        self.chunks: t.Iterator[bytes] = response.iter_bytes()
+        self.buffer: bytes = b""
+
+    def readable(self) -> bool:
+        """Pass."""
+        return True
+
+    def readinto(self, buffer) -> int:
+        """Read the next bytes of the body into buffer.
+
+        Args:
+            buffer: writable buffer to read into
+        """
+        import httpx
+
+        try:
+            while not self.buffer:
+                self.buffer = next(self.chunks)
+        except StopIteration:
+            return 0
+        except httpx.TimeoutException as exc:
+            raise requests.ReadTimeout(exc) from exc
+        except httpx.TransportError as exc:
+            raise requests.ConnectionError(exc) from exc
+
+        size = min(len(buffer), len(self.buffer))
+        buffer[:size] = self.buffer[:size]
+        self.buffer = self.buffer[size:]
+        return size
+
+    def close(self):
+        """Close the httpx response, releasing its connection."""
+        if not self.closed:
+            self.response.close()
+        super().close()
+
+
+class Http2Adapter(requests.adapters.BaseAdapter):
+    """HTTP/2 transport adapter that sends requests using :obj:`httpx.Client`.
+
+    Notes:
+        Requires the ``httpx`` package with the ``http2`` extra. Responses from httpx are
+        converted into :obj:`requests.Response` objects, so the rest of the client is unaware
+        of the transport in use. Certificates offered by the server are not captured, so
+        :meth:`Http.get_cert` and :meth:`Http.get_cert_chain` return nothing.
+    """
+
+    HOP_HEADERS: t.Tuple[str, ...] = (
+        "connection",
+        "keep-alive",
+        "proxy-connection",
+        "transfer-encoding",
+        "upgrade",
+    )
+    """Connection specific headers that are not allowed in HTTP/2."""
+
+    def __init__(
+        self,
+        counters: ConnectionCounters,
+        pool_connections: int = POOL_CONNECTIONS,
+        pool_maxsize: int = POOL_MAXSIZE,
+        keep_alive: bool = KEEP_ALIVE,
+    ):
+        """HTTP/2 transport adapter that sends requests using :obj:`httpx.Client`.
+
+        Args:
+            counters: counters to add connections opened and requests sent to
+            pool_connections: number of hosts to keep connections open to
+            pool_maxsize: maximum number of connections to keep open to each host
+            keep_alive: keep connections open to be reused by later requests
+        """
+        super().__init__()
+        try:
+            import httpx
+        except ImportError as exc:
+            msg = "Must install 'httpx[http2]' to send requests using HTTP/2"
+            raise HttpError(msg) from exc
+
+        self.counters: ConnectionCounters = counters
+        self.limits = httpx.Limits(
+            max_connections=pool_connections * pool_maxsize,
+            max_keepalive_connections=pool_maxsize if keep_alive else 0,
+        )
+        self.clients: dict = {}
+        self.lock: threading.Lock = threading.Lock()
+
+    def get_client(
+        self,
+        verify: t.Union[bool, str] = True,
+        cert: t.Optional[t.Union[str, t.Tuple[str, str]]] = None,
+        proxy: t.Optional[str] = None,
+    ):
+        """Create or get the httpx client for a combination of cert and proxy settings.
+
+        Args:
+            verify: verify server cert, or path to CA bundle to verify server cert with
+            cert: path to client cert and key file, or tuple of paths to client cert and key
+            proxy: proxy to send requests through
+        """
+        import ssl
+
+        import httpx
+
+        key = (verify, cert, proxy)
+        with self.lock:
+            if key not in self.clients:
+                if isinstance(verify, str):
+                    path = pathlib.Path(verify)
+                    context = ssl.create_default_context(
+                        cafile=None if path.is_dir() else verify,
+                        capath=verify if path.is_dir() else None,
+                    )
+                else:
+                    context = ssl.create_default_context()
+                    if not verify:
+                        context.check_hostname = False
+                        context.verify_mode = ssl.CERT_NONE
+                if cert:
+                    context.load_cert_chain(*listify(cert))
+
+                self.clients[key] = httpx.Client(
+                    http2=True, verify=context, proxy=proxy, limits=self.limits, trust_env=False
+                )
+            return self.clients[key]
+
+    def send(
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout: t.Optional[t.Union[float, t.Tuple[float, float]]] = None,
+        verify: t.Union[bool, str] = True,
+        cert: t.Optional[t.Union[str, t.Tuple[str, str]]] = None,
+        proxies: t.Optional[dict] = None,
+    ) -> requests.Response:
+        """Send a prepared request using httpx.
+
+        Args:
+            request: request to send
+            stream: do not read the body of the response before returning, see
+                :obj:`Http2Stream`
+            timeout: seconds to wait for the connection to open and the response to arrive
+            verify: verify server cert, or path to CA bundle to verify server cert with
+            cert: path to client cert and key file, or tuple of paths to client cert and key
+            proxies: proxies to select a proxy for the URL of the request from
+        """
+        import httpx
+
+        proxy = requests.utils.select_proxy(request.url, proxies or {})
+        client = self.get_client(verify=verify, cert=cert, proxy=proxy)
+        connect, read = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+        headers = {k: v for k, v in request.headers.items() if k.lower() not in self.HOP_HEADERS}
+        opened = []
+        started = time.perf_counter()
+
+        def trace(event: str, info: dict):
+            if event == "connection.connect_tcp.complete":
+                opened.append(event)
+
+        try:
+            response = client.send(
+                client.build_request(
+                    method=request.method,
+                    url=request.url,
+                    headers=headers,
+                    content=request.body,
+                    timeout=httpx.Timeout(read, connect=connect),
+                    extensions={"trace": trace},
+                ),
+                stream=stream,
+            )
+        except httpx.ConnectTimeout as exc:
+            raise requests.ConnectTimeout(exc, request=request) from exc
+        except httpx.TimeoutException as exc:
+            raise requests.ReadTimeout(exc, request=request) from exc
+        except httpx.ProxyError as exc:
+            raise requests.exceptions.ProxyError(exc, request=request) from exc
+        except httpx.ConnectError as exc:
+            reason = urllib3.exceptions.NewConnectionError(None, f"{exc}")
+            raise requests.ConnectionError(reason, request=request) from exc
+        except httpx.TransportError as exc:
+            raise requests.ConnectionError(exc, request=request) from exc
+        finally:
+            self.counters.add(opened=len(opened), requests=1)
+
+        if stream:
+            # httpx only sets elapsed once the body is read, requests sets it once headers arrive
+            response.elapsed = datetime.timedelta(seconds=time.perf_counter() - started)
+        return self.build_response(request=request, response=response, stream=stream)
+
+    def build_response(
+        self, request: requests.PreparedRequest, response, stream: bool = False
+    ) -> requests.Response:
+        """Convert a response from httpx into a response from requests.
+
+        Args:
+            request: request that was sent
+            response (:obj:`httpx.Response`): response that was received
+            stream: response was sent with stream=True and its body has not been read
+        """
+        ret = requests.Response()
+        ret.status_code = response.status_code
+        ret.headers = requests.structures.CaseInsensitiveDict(response.headers)
+        ret.encoding = requests.utils.get_encoding_from_headers(ret.headers)
+        ret.reason = response.reason_phrase
+        ret.url = request.url
+        ret.request = request
+        ret.elapsed = response.elapsed
+        ret.connection = self
+        if stream:
+            ret.raw = Http2Stream(response=response)
+        else:
+            ret._content = response.content
+            ret._content_consumed = True
+            ret.raw = io.BytesIO(ret._content)
+        return ret
+
+    def close(self):
+        """Close all httpx clients."""
+        with self.lock:
+            for client in self.clients.values():
+                client.close()
+            self.clients = {}
+
+
 class Http:
     """HTTP client that wraps around :obj:`requests.Session`."""
 
@@ -78,8 +1047,8 @@ class Http:
     LOG: logging.Logger = None
     """Logger for this object."""
 
-    HISTORY: t.List[requests.Response] = None
-    """History of all requests made."""
+    HISTORY: ResponseHistory = None
+    """History of the responses received, if :attr:`SAVE_HISTORY` is True."""
 
     LAST_REQUEST: t.Optional[requests.PreparedRequest] = None
     """Last request made."""
@@ -178,6 +1147,30 @@ class Http:
     RETRY_BACKOFF: t.Optional[int] = 5
     """Number of seconds to wait between retries, will be multiplied against the current retry attempt."""
 
+    RETRY_POLICY: RetryPolicy = None
+    """Policy for retrying requests."""
+
+    RATE_LIMITER: RateLimiter = None
+    """Rate limit and in-flight request limit for requests."""
+
+    POOL_CONNECTIONS: int = POOL_CONNECTIONS
+    """Number of connection pools (one per host) to keep open."""
+
+    POOL_MAXSIZE: int = POOL_MAXSIZE
+    """Maximum number of connections to keep open to each host."""
+
+    POOL_BLOCK: bool = POOL_BLOCK
+    """Wait for a connection to be free instead of opening an extra one when a pool is full."""
+
+    KEEP_ALIVE: bool = KEEP_ALIVE
+    """Keep connections open to be reused by later requests."""
+
+    HTTP2: bool = HTTP2
+    """Send requests using HTTP/2 with :obj:`Http2Adapter`."""
+
+    CONNECTIONS: ConnectionCounters = None
+    """Counters of connections opened and reused."""
+
     def __init__(  # noqa: PLR0913
         self,
         url: t.Union[UrlParser, str],
@@ -220,6 +1213,22 @@ class Http:
         cf_timeout_login: t.Optional[int] = cf_constants.TIMEOUT_LOGIN,
         max_retries: t.Optional[int] = MAX_RETRIES,
         retry_backoff: t.Optional[int] = RETRY_BACKOFF,
+        pool_connections: int = POOL_CONNECTIONS,
+        pool_maxsize: int = POOL_MAXSIZE,
+        pool_block: bool = POOL_BLOCK,
+        keep_alive: bool = KEEP_ALIVE,
+        http2: bool = HTTP2,
+        retry_policy: t.Optional[RetryPolicy] = None,
+        rate_limit: t.Optional[float] = RATE_LIMIT,
+        rate_burst: t.Optional[int] = RATE_BURST,
+        max_in_flight: t.Optional[int] = MAX_IN_FLIGHT,
+        rate_limiter: t.Optional[RateLimiter] = None,
+        history_max_items: t.Optional[int] = HISTORY_MAX_ITEMS,
+        history_max_bytes: t.Optional[int] = HISTORY_MAX_BYTES,
+        history_sample_rate: float = HISTORY_SAMPLE_RATE,
+        history_metadata_only: bool = False,
+        history_spill_path: t.Optional[PathLike] = None,
+        history: t.Optional[ResponseHistory] = None,
         **kwargs,
     ) -> None:
         """HTTP client that wraps around :obj:`requests.Session`.
@@ -244,7 +1253,7 @@ class Http:
             log_response_attrs: attributes of response to log
             save_last: save last request and response to :attr:`last_request` and
                 :attr:`last_response`
-            save_history: save all requests and responses to :attr:`history`
+            save_history: save responses to :attr:`HISTORY`
             connect_timeout: seconds to wait for connections to open to :attr:`url`
             response_timeout: seconds to wait for responses from :attr:`url`
             log_request_body: log the request body
@@ -274,6 +1283,28 @@ class Http:
             cf_echo_verbose: echo checks to stdout
             max_retries: number of times to retry a failed connection
             retry_backoff: number of seconds to wait between retries, will be multiplied against the current retry attempt
+            pool_connections: number of connection pools (one per host) to keep open
+            pool_maxsize: maximum number of connections to keep open to each host
+            pool_block: wait for a connection to be free instead of opening an extra one
+                when a pool is full
+            keep_alive: keep connections open to be reused by later requests
+            http2: send requests using HTTP/2, requires the httpx package with the http2 extra
+            retry_policy: policy for retrying requests, if not supplied one is created using
+                max_retries as the maximum attempts and retry_backoff as the first delay
+            rate_limit: maximum requests per second to send, None for no limit
+            rate_burst: requests that can be sent at once before the rate limit applies
+            max_in_flight: maximum requests to have waiting on a response at once
+            rate_limiter: rate limiter to use, i.e. to share limits with other Http objects,
+                if not supplied one is created using rate_limit, rate_burst and max_in_flight,
+                which only lowers the rate on 429 responses if any of those are supplied
+            history_max_items: maximum responses to keep in :attr:`HISTORY`
+            history_max_bytes: maximum bytes of bodies to keep in :attr:`HISTORY`
+            history_sample_rate: fraction of responses to add to :attr:`HISTORY`
+            history_metadata_only: keep only the metadata of responses in :attr:`HISTORY`
+            history_spill_path: gzip compressed JSONL file to write the metadata of the
+                responses added to :attr:`HISTORY` to
+            history: history object to use, if not supplied one is created using the
+                history_* arguments
             **kwargs: no longer used, will throw a deprecation warning
 
         Raises:
@@ -288,7 +1319,15 @@ class Http:
         self.LOG_LEVEL: t.Union[int, str] = log_level
         self.LOG: logging.Logger = get_obj_log(obj=self, level=self.LOG_LEVEL)
 
-        self.HISTORY: t.List[requests.Response] = []
+        if not isinstance(history, ResponseHistory):
+            history = ResponseHistory(
+                max_items=history_max_items,
+                max_bytes=history_max_bytes,
+                sample_rate=history_sample_rate,
+                metadata_only=history_metadata_only,
+                spill_path=history_spill_path,
+            )
+        self.HISTORY: ResponseHistory = history
         self.LAST_REQUEST: t.Optional[requests.PreparedRequest] = None
         self.LAST_RESPONSE: t.Optional[requests.Response] = None
 
@@ -360,6 +1399,27 @@ class Http:
             retry_backoff,
             error=False,
         )
+        if not isinstance(retry_policy, RetryPolicy):
+            retry_policy = RetryPolicy(
+                max_attempts=self.MAX_RETRIES or 1, backoff=self.RETRY_BACKOFF or 0
+            )
+        self.RETRY_POLICY: RetryPolicy = retry_policy
+
+        if not isinstance(rate_limiter, RateLimiter):
+            rate_limiter = RateLimiter(
+                rate=rate_limit,
+                burst=rate_burst,
+                max_in_flight=max_in_flight,
+                adapt=RATE_ADAPT and any([rate_limit, rate_burst, max_in_flight]),
+            )
+        self.RATE_LIMITER: RateLimiter = rate_limiter
+
+        self.POOL_CONNECTIONS: int = coerce_int(pool_connections, min_value=1)
+        self.POOL_MAXSIZE: int = coerce_int(pool_maxsize, min_value=1)
+        self.POOL_BLOCK: bool = coerce_bool(pool_block)
+        self.KEEP_ALIVE: bool = coerce_bool(keep_alive)
+        self.HTTP2: bool = coerce_bool(http2)
+        self.CONNECTIONS: ConnectionCounters = ConnectionCounters()
 
         self.set_urllib_warnings()
         self.set_urllib_log()
@@ -479,7 +1539,7 @@ class Http:
             value = []
             if response:
                 chain: t.List[OpenSSL.crypto.X509] = listify(
-                    response.raw.captured_chain,
+                    getattr(response.raw, "captured_chain", None),
                 )
                 source: dict = {
                     "url": self.url,
@@ -502,12 +1562,48 @@ class Http:
     def new_session(self):
         """Create a new session object."""
         self.session: requests.Session = requests.Session()
+        self.set_session_adapters()
         self.set_session_headers()
         self.set_session_cookies()
         self.set_session_proxies()
         self.set_session_verify()
         self.set_session_cert()
 
+    def close(self):
+        """Close the session and its transport adapters, and the history of responses."""
+        if isinstance(self.session, requests.Session):
+            self.session.close()
+        if isinstance(self.HISTORY, ResponseHistory):
+            self.HISTORY.close()
+
+    def set_session_adapters(self):
+        """Configure :attr:`session` with the transport adapter for the pool options.
+
+        Notes:
+            if self.HTTP2 is True, :obj:`Http2Adapter` is used, otherwise :obj:`PoolAdapter`
+            if self.KEEP_ALIVE is False, connections are closed after each response
+        """
+        if self.HTTP2:
+            adapter = Http2Adapter(
+                counters=self.CONNECTIONS,
+                pool_connections=self.POOL_CONNECTIONS,
+                pool_maxsize=self.POOL_MAXSIZE,
+                keep_alive=self.KEEP_ALIVE,
+            )
+        else:
+            adapter = PoolAdapter(
+                counters=self.CONNECTIONS,
+                pool_connections=self.POOL_CONNECTIONS,
+                pool_maxsize=self.POOL_MAXSIZE,
+                pool_block=self.POOL_BLOCK,
+            )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        if not self.KEEP_ALIVE:
+            self.session.headers["Connection"] = "close"
+        self.LOG.debug(f"Mounted {adapter} with keep_alive={self.KEEP_ALIVE}")
+
     def set_session_headers(self):
         """Configure :attr:`session` headers with :attr:`HTTP_HEADERS`."""
         self.session.headers.update(self.HTTP_HEADERS)
@@ -613,15 +1709,16 @@ class Http:
                 * proxies: proxies for this request
                 * verify: verification of cert for this request
                 * cert: client cert to offer for this request
+                * retry_policy: :obj:`RetryPolicy` to use for this request
 
         Returns:
             :obj:`requests.Response`
         """
 
-        def log_if_headers(msg: str):  # pragma: no cover
+        def log_if_headers(msg: str, *args):  # pragma: no cover
             """Pass."""
             if "headers" in self.log_request_attrs:
-                self.LOG.debug(msg)
+                self.LOG.debug(msg, *args)
 
         session_reset = kwargs.get("session_reset", False)
         if not hasattr(self, "session") or session_reset is True:  # pragma: no cover
@@ -657,50 +1754,71 @@ class Http:
         if self.SAVE_LAST:
             self.LAST_REQUEST = prepped_request
 
-
         pre_send_args = {
             "proxies": kwargs.get("proxies", self.session.proxies),
             "stream": kwargs.get("stream", self.session.stream),
             "verify": kwargs.get("verify", self.session.verify),
             "cert": kwargs.get("cert", self.session.cert),
         }
-        log_if_headers(f"Request arguments before environment merge: {pre_send_args}")
+        log_if_headers("Request arguments before environment merge: %s", pre_send_args)
 
         send_args = self.session.merge_environment_settings(
             url=prepped_request.url,
             **pre_send_args,
         )
-        log_if_headers(f"Request arguments after environment merge: {send_args}")
-
-        if self.MAX_RETRIES < 1:
-            self.MAX_RETRIES = 1
-
-        response = None
-        for attempt in range(self.MAX_RETRIES):
-            attempt_count = attempt + 1
-            attempt_backoff = attempt_count * self.RETRY_BACKOFF
+        log_if_headers("Request arguments after environment merge: %s", send_args)
+
+        policy: RetryPolicy = kwargs.get("retry_policy", self.RETRY_POLICY)
+        limiter: RateLimiter = self.RATE_LIMITER
+        attempt: int = 0
+        waited: float = 0.0
+        rate_waited: float = 0.0
+        while True:
+            attempt += 1
+            self.LOG.debug(f"Attempt {attempt} of {policy.max_attempts}.")
+            rate_wait: float = limiter.acquire()
+            rate_waited += rate_wait
+            if rate_wait:
+                self.LOG.debug(f"Waited {rate_wait:.3f} seconds for {limiter}")
             try:
-                self.LOG.debug(f"Attempt {attempt_count} of {self.MAX_RETRIES}.")
                 response = self.session.send(
                     request=prepped_request,
                     timeout=timeout,
                     **send_args,
                 )
-                break
             except Exception as exc:
                 self.LOG.error(f"Connect Error: {exc}")
-                if attempt == self.MAX_RETRIES - 1:
-                    self.LOG.error(f"Max attempts ({self.MAX_RETRIES}) reached.")
-                    raise exc
-                self.LOG.warning(f"Retrying after {attempt_backoff} seconds...")
-                time.sleep(attempt_backoff)
-                continue
-
+                delay = policy.get_delay(
+                    attempt=attempt, waited=waited, method=prepped_request.method, exc=exc
+                )
+                if delay is None:
+                    self.LOG.error(f"Not retrying after {attempt} attempts.")
+                    raise
+            else:
+                limiter.check_response(response=response)
+                delay = policy.get_delay(
+                    attempt=attempt,
+                    waited=waited,
+                    method=prepped_request.method,
+                    response=response,
+                )
+                if delay is None:
+                    break
+                self.LOG.error(f"Retryable response status code: {response.status_code}")
+                response.close()
+            finally:
+                limiter.release()
+
+            self.LOG.warning(f"Retrying after {delay:.2f} seconds...")
+            time.sleep(delay)
+            waited += delay
+
+        response.RATE_LIMIT_SECONDS = rate_waited
         if self.SAVE_LAST:
             self.LAST_RESPONSE = response
 
         if self.SAVE_HISTORY:
-            self.HISTORY.append(response)
+            self.HISTORY.add(response=response)
 
         self._do_log_response(response=response)
 
@@ -730,22 +1848,29 @@ class Http:
             request (:obj:`requests.PreparedRequest`): prepared request to log attrs/body of
         """
         if self.log_request_attrs:
-            cookies = getattr(request, "_cookies", {})
-            headers = getattr(request, "headers", {})
-            lattrs = ", ".join(self.log_request_attrs).format(
-                url=request.url,
-                body_size=len(request.body or ""),
-                method=request.method,
-                headers=self._clean_headers(headers=headers),
-                cookies=self._clean_headers(headers=cookies),
-            )
-            self.LOG.debug(f"REQUEST ATTRS: {lattrs}")
+            self.LOG.debug("REQUEST ATTRS: %s", LazyStr(self._get_request_attrs, request=request))
 
         if self.LOG_REQUEST_BODY:
             self.LOG.debug(
-                self.log_body(body=request.body, body_type="REQUEST", src=request),
+                "%s", LazyStr(self.log_body, body=request.body, body_type="REQUEST", src=request)
             )
 
+    def _get_request_attrs(self, request) -> str:
+        """Get a string for logging the attributes of a request.
+
+        Args:
+            request (:obj:`requests.PreparedRequest`): prepared request to get attrs of
+        """
+        cookies = getattr(request, "_cookies", {})
+        headers = getattr(request, "headers", {})
+        return ", ".join(self.log_request_attrs).format(
+            url=request.url,
+            body_size=len(request.body or ""),
+            method=request.method,
+            headers=self._clean_headers(headers=headers),
+            cookies=self._clean_headers(headers=cookies),
+        )
+
     def _clean_headers(self, headers: dict) -> dict:
         """Clean headers with sensitive information.
 
@@ -777,22 +1902,37 @@ class Http:
             response (:obj:`requests.Response`): response to log attrs/body of
         """
         if self.log_response_attrs:
-            lattrs = ", ".join(self.log_response_attrs).format(
-                url=response.url,
-                body_size=len(response.text or ""),
-                method=response.request.method,
-                status_code=response.status_code,
-                reason=response.reason,
-                elapsed=response.elapsed,
-                headers=self._clean_headers(headers=response.headers),
-                cookies=self._clean_headers(headers=response.cookies),
+            self.LOG.debug(
+                "RESPONSE ATTRS: %s", LazyStr(self._get_response_attrs, response=response)
             )
-            self.LOG.debug(f"RESPONSE ATTRS: {lattrs}")
 
         if self.LOG_RESPONSE_BODY:
-            self.LOG.debug(
-                self.log_body(body=response.text, body_type="RESPONSE", src=response),
-            )
+            self.LOG.debug("%s", LazyStr(self._get_response_body, response=response))
+
+    def _get_response_body(self, response) -> str:
+        """Get a string for logging the body of a response.
+
+        Args:
+            response (:obj:`requests.Response`): response to get body of
+        """
+        return self.log_body(body=response.text, body_type="RESPONSE", src=response)
+
+    def _get_response_attrs(self, response) -> str:
+        """Get a string for logging the attributes of a response.
+
+        Args:
+            response (:obj:`requests.Response`): response to get attrs of
+        """
+        return ", ".join(self.log_response_attrs).format(
+            url=response.url,
+            body_size=len(response.text or ""),
+            method=response.request.method,
+            status_code=response.status_code,
+            reason=response.reason,
+            elapsed=response.elapsed,
+            headers=self._clean_headers(headers=response.headers),
+            cookies=self._clean_headers(headers=response.cookies),
+        )
 
     @property
     def log_request_attrs(self) -> t.List[str]:
@@ -0,0 +1,252 @@
+# -*- coding: utf-8 -*-
+"""Pluggable backends for serializing and deserializing JSON.
+
+Notes:
+    The fastest installed backend in :data:`BACKENDS_PREFERRED` is used unless one is
+    chosen using :func:`set_backend` or the OS env var
+    :data:`axonius_api_client.setup_env.KEY_JSON_BACKEND`.
+
+    The output of the non standard library backends is equivalent JSON but not always
+    byte for byte identical to :func:`json.dumps`: when ``indent`` is None, no spaces are
+    added after separators, and non ASCII characters are not escaped.
+
+    If a non standard library backend does not support an ``indent`` value, or can not
+    serialize an object (i.e. integers larger than 64 bits), :func:`json.dumps` is used instead.
+"""
+import dataclasses
+import functools
+import json
+import logging
+import typing as t
+
+from .setup_env import get_env_json_backend
+
+LOG: logging.Logger = logging.getLogger("axonius_api_client.json_backend")
+
+BACKEND_AUTO: str = "auto"
+"""Backend name that selects the first importable backend in :data:`BACKENDS_PREFERRED`."""
+
+BACKEND_STDLIB: str = "json"
+"""Name of the standard library backend, which is always available."""
+
+BACKENDS_PREFERRED: t.List[str] = ["orjson", "ujson", BACKEND_STDLIB]
+"""Order of preference for backends when :data:`BACKEND_AUTO` is used."""
+
+
+@dataclasses.dataclass(frozen=True)
+class JsonBackend:
+    """A library that can serialize and deserialize JSON."""
+
+    name: str
+    """Name of the module for this backend."""
+
+    dumps: t.Callable[..., str]
+    """Function that takes obj, indent, sort_keys, and default and returns a str."""
+
+    loads: t.Callable[[t.Union[str, bytes]], t.Any]
+    """Function that takes a str or bytes and returns the deserialized object."""
+
+    indents: t.Optional[t.Tuple[t.Optional[int], ...]] = None
+    """Indent values that dumps supports, None if it supports any."""
+
+    def supports(self, indent: t.Optional[int]) -> bool:
+        """Check if dumps supports an indent value."""
+        return self.indents is None or indent in self.indents
+
+
+def load_stdlib() -> JsonBackend:
+    """Load the standard library backend."""
+
+    def dumps(
+        obj: t.Any,
+        indent: t.Optional[int] = None,
+        sort_keys: bool = False,
+        default: t.Optional[t.Callable] = None,
+    ) -> str:
+        return json.dumps(obj, indent=indent, sort_keys=sort_keys, default=default)
+
+    return JsonBackend(name=BACKEND_STDLIB, dumps=dumps, loads=json.loads)
+
+
+def load_orjson() -> JsonBackend:
+    """Load the orjson backend.
+
+    Raises:
+        :exc:`ImportError`: if orjson is not installed
+    """
+    import orjson
+
+    base_option: int = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS
+
+    def dumps(
+        obj: t.Any,
+        indent: t.Optional[int] = None,
+        sort_keys: bool = False,
+        default: t.Optional[t.Callable] = None,
+    ) -> str:
+        option: int = base_option
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=default, option=option).decode()
+
+    return JsonBackend(name="orjson", dumps=dumps, loads=orjson.loads, indents=(None, 0, 2))
+
+
+def load_ujson() -> JsonBackend:
+    """Load the ujson backend.
+
+    Raises:
+        :exc:`ImportError`: if ujson is not installed
+    """
+    import ujson
+
+    def dumps(
+        obj: t.Any,
+        indent: t.Optional[int] = None,
+        sort_keys: bool = False,
+        default: t.Optional[t.Callable] = None,
+    ) -> str:
+        return ujson.dumps(
+            obj,
+            indent=indent or 0,
+            sort_keys=sort_keys,
+            default=default,
+            escape_forward_slashes=False,
+        )
+
+    return JsonBackend(name="ujson", dumps=dumps, loads=ujson.loads)
+
+
+BACKENDS: t.Dict[str, t.Callable[[], JsonBackend]] = {
+    "orjson": load_orjson,
+    "ujson": load_ujson,
+    BACKEND_STDLIB: load_stdlib,
+}
+"""Map of backend names to the functions that load them."""
+
+BACKEND: t.Optional[JsonBackend] = None
+"""Backend currently in use, set by :func:`set_backend`."""
+
+
+def get_backends() -> t.Dict[str, JsonBackend]:
+    """Get all of the backends that are installed."""
+    backends = {}
+    for name, loader in BACKENDS.items():
+        try:
+            backends[name] = loader()
+        except ImportError:
+            continue
+    return backends
+
+
+def set_backend(name: t.Optional[str] = None) -> JsonBackend:
+    """Set the backend to use for :func:`dumps` and :func:`loads`.
+
+    Args:
+        name: name of backend from :data:`BACKENDS` or :data:`BACKEND_AUTO`, if None use the OS
+            env var :data:`axonius_api_client.setup_env.KEY_JSON_BACKEND`
+
+    Raises:
+        :exc:`ValueError`: if name is not a known backend
+        :exc:`ImportError`: if name is not installed
+    """
+    global BACKEND
+
+    name = name or get_env_json_backend()
+    name = str(name).strip().lower()
+    if name == BACKEND_AUTO:
+        for preferred in BACKENDS_PREFERRED:
+            try:
+                BACKEND = BACKENDS[preferred]()
+                break
+            except ImportError:
+                continue
+    elif name in BACKENDS:
+        BACKEND = BACKENDS[name]()
+    else:
+        valid = [BACKEND_AUTO, *BACKENDS]
+        raise ValueError(f"Invalid JSON backend {name!r}, valid backends: {valid}")
+
+    LOG.debug(f"Using JSON backend {BACKEND.name!r}")
+    return BACKEND
+
+
+def get_backend() -> JsonBackend:
+    """Get the backend to use for :func:`dumps` and :func:`loads`, setting it if not set."""
+    return BACKEND if BACKEND else set_backend()
+
+
+def get_dumps(
+    indent: t.Optional[int] = None,
+    sort_keys: bool = False,
+    default: t.Optional[t.Callable] = None,
+) -> t.Callable[[t.Any], str]:
+    """Get a function that serializes an object into a JSON str using the current backend.
+
+    Args:
+        indent: indent level, None for no newlines
+        sort_keys: sort dict keys
+        default: function to serialize objects that are not natively supported
+
+    Notes:
+        The backend and whether it supports ``indent`` are checked once, so the function
+        returned can be used to serialize many objects, i.e. each row of an export.
+    """
+    stdlib = functools.partial(json.dumps, indent=indent, sort_keys=sort_keys, default=default)
+    backend = get_backend()
+    if backend.name == BACKEND_STDLIB:
+        return stdlib
+
+    if not backend.supports(indent):
+        LOG.debug(f"JSON backend {backend.name!r} does not support indent={indent!r}")
+        return stdlib
+
+    def dumps(obj: t.Any) -> str:
+        try:
+            return backend.dumps(obj, indent=indent, sort_keys=sort_keys, default=default)
+        except Exception as exc:
+            LOG.debug(f"JSON backend {backend.name!r} failed, using {BACKEND_STDLIB!r}: {exc}")
+        return stdlib(obj)
+
+    return dumps
+
+
+def dumps(
+    obj: t.Any,
+    indent: t.Optional[int] = None,
+    sort_keys: bool = False,
+    default: t.Optional[t.Callable] = None,
+    **kwargs,
+) -> str:
+    """Serialize an object into a JSON str using the current backend.
+
+    Args:
+        obj: object to serialize
+        indent: indent level, None for no newlines
+        sort_keys: sort dict keys
+        default: function to serialize objects that are not natively supported
+        **kwargs: passed to :func:`json.dumps`, if any are supplied the standard library
+            backend is always used
+    """
+    if kwargs:
+        return json.dumps(obj, indent=indent, sort_keys=sort_keys, default=default, **kwargs)
+    return get_dumps(indent=indent, sort_keys=sort_keys, default=default)(obj)
+
+
+def loads(obj: t.Union[str, bytes], **kwargs) -> t.Any:
+    """Deserialize a JSON str or bytes into an object using the current backend.
+
+    Args:
+        obj: str or bytes to deserialize
+        **kwargs: passed to :func:`json.loads`, if any are supplied the standard library
+            backend is always used
+    """
+    backend = get_backend()
+    if backend.name != BACKEND_STDLIB and not kwargs:
+        try:
+            return backend.loads(obj)
+        except Exception as exc:
+            LOG.debug(f"JSON backend {backend.name!r} failed, using {BACKEND_STDLIB!r}: {exc}")
+    return json.loads(obj, **kwargs)
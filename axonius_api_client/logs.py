@@ -30,7 +30,7 @@ from .constants.logs import (
     LOG_NAME_STDOUT,
 )
 from .exceptions import ToolsError
-from .tools import echo_debug, echo_error, echo_ok, echo_warn, get_path, is_int
+from .tools import echo_debug, echo_error, echo_ok, echo_warn, get_path, is_int, json_dump
 
 ECHOERS: Tuple[Tuple[int, Callable]] = (
     (logging.DEBUG, echo_debug),
@@ -59,6 +59,50 @@ class HideFormatter(logging.Formatter):
         return record
 
 
+class LazyStr:
+    """Defer building a str until it is formatted, i.e. when a log record is emitted.
+
+    Notes:
+        Pass as an argument to a logging method instead of building the message with an
+        f-string, so that the work is skipped when the logger is not enabled for the level.
+
+    Examples:
+        >>> LOG.debug("state=%s", LazyStr(json_dump, state))
+    """
+
+    __slots__ = ("func", "args", "kwargs")
+
+    def __init__(self, func: Callable, *args, **kwargs):
+        """Pass.
+
+        Args:
+            func: function that returns the object to convert to a str
+            *args: passed to func
+            **kwargs: passed to func
+        """
+        self.func: Callable = func
+        self.args: tuple = args
+        self.kwargs: dict = kwargs
+
+    def __str__(self) -> str:
+        """Call the function and return its result as a str."""
+        return str(self.func(*self.args, **self.kwargs))
+
+    def __repr__(self) -> str:
+        """Pass."""
+        return self.__str__()
+
+
+def lazy_json(obj: t.Any, **kwargs) -> LazyStr:
+    """Defer serializing an object into a JSON str until it is formatted.
+
+    Args:
+        obj: object to serialize
+        **kwargs: passed to :func:`axonius_api_client.tools.json_dump`
+    """
+    return LazyStr(json_dump, obj, **kwargs)
+
+
 def get_echoer(level: Union[int, str]) -> Callable:
     """Pass."""
     level_str = str_level(level=level)
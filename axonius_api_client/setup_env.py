@@ -89,6 +89,9 @@ KEY_DEBUG_PRINT: str = f"{KEY_PRE}DEBUG_PRINT"
 KEY_USER_AGENT: str = f"{KEY_PRE}USER_AGENT"
 """OS env to use a custom User Agent string."""
 
+KEY_JSON_BACKEND: str = f"{KEY_PRE}JSON_BACKEND"
+"""OS env to choose the JSON backend, see :mod:`axonius_api_client.json_backend`."""
+
 KEY_CREDENTIALS = f"{KEY_PRE}CREDENTIALS"
 DEFAULT_CREDENTIALS: str = "no"
 
@@ -109,6 +112,9 @@ DEFAULT_CERTWARN: str = "yes"
 DEFAULT_ENV_FILE: str = ".env"
 """Default for :attr:`KEY_ENV_FILE`"""
 
+DEFAULT_JSON_BACKEND: str = "auto"
+"""Default for :attr:`KEY_JSON_BACKEND`"""
+
 KEYS_HIDDEN: t.List[str] = [KEY_KEY, KEY_SECRET, KEY_CF_TOKEN]
 """t.List of keys to hide in :meth:`get_env_ax`"""
 
@@ -602,6 +608,11 @@ def get_env_user_agent(
     return get_env_str(key=KEY_USER_AGENT, default="", empty_ok=True)
 
 
+def get_env_json_backend() -> str:
+    """Get AX_JSON_BACKEND from OS env vars."""
+    return get_env_str(key=KEY_JSON_BACKEND, default=DEFAULT_JSON_BACKEND, lower=True)
+
+
 def load_schema(schema: dict, kwargs: t.Optional[dict] = None) -> t.Any:
     """Load a schema from an OS env var."""
     kwargs = {} if not isinstance(kwargs, dict) else kwargs
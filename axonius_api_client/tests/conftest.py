@@ -33,6 +33,11 @@ CF_ERROR = coerce_bool(
 )
 
 
+AX_BENCHMARKS_RAW = os.environ.get("AX_BENCHMARKS", False)
+AX_BENCHMARKS = coerce_bool(
+    obj=AX_BENCHMARKS_RAW, errmsg="AX_BENCHMARKS must be a bool", allow_none=True, as_none=False
+)
+
 AX_CREDENTIALS_RAW = os.environ.get("AX_CREDENTIALS", False)
 AX_CREDENTIALS = coerce_bool(
     obj=AX_CREDENTIALS_RAW, errmsg="AX_CREDENTIALS must be a bool", allow_none=True, as_none=False
@@ -93,6 +98,24 @@ def pytest_addoption(parser: pytest.Parser) -> None:
         required=False,
         help="Error if a token can not be obtained from cloudflare",
     )
+    parser.addoption(
+        "--benchmarks",
+        action="store_true",
+        default=AX_BENCHMARKS,
+        required=False,
+        help="Run tests marked as benchmark",
+    )
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list) -> None:
+    """Skip tests marked as benchmark unless --benchmarks is supplied."""
+    if config.getoption("--benchmarks"):
+        return
+
+    skip = pytest.mark.skip(reason="benchmark, supply --benchmarks to run")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
 
 
 def load_asset_api(obj):
@@ -52,3 +52,13 @@ class TestCallbacksBase(CallbacksFull):
 
         assert rows_proc != rows_orig
         cbobj.stop()
+
+    def test_row_transform_compiled_overridden(self, cbexport, apiobj):
+        cbobj = self.get_cbobj(apiobj=apiobj, cbexport=cbexport)
+
+        class Overridden(cbobj.__class__):
+            def do_join_values(self, rows):
+                return rows
+
+        cbobj.__class__ = Overridden
+        assert cbobj.callbacks_compiled == cbobj.callbacks
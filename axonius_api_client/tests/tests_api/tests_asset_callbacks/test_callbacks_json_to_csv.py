@@ -39,3 +39,55 @@ class TestCallbacksJsonToCsv(Exports):
         start_val = io_fd.getvalue().splitlines()[0]
         for i in cbobj.final_columns:
             assert f'"{i}"' in start_val
+
+    def test_row_single_pass(self, cbexport, apiobj):
+        rows = copy.deepcopy(apiobj.ORIGINAL_ROWS)
+
+        io_fd = io.StringIO()
+        cbobj = self.get_cbobj(
+            apiobj=apiobj,
+            cbexport=cbexport,
+            store={"fields_parsed": apiobj.fields_default},
+            getargs={"export_fd": io_fd, "export_fd_close": False, "csv_spill": False},
+        )
+        cbobj.start()
+
+        for row in rows:
+            cbobj.process_row(row=row)
+            assert cbobj._spill_file is None
+            assert io_fd.getvalue()
+
+        cbobj.stop()
+        assert len(io_fd.getvalue().splitlines()) > len(rows)
+
+    def test_row_spill_custom_cb(self, cbexport, apiobj):
+        def custom_cb(self, rows):
+            for row in rows:
+                if self.STATE["rows_processed_total"] % 2:
+                    row["badwolf"] = "badwolf"
+            return rows
+
+        rows = copy.deepcopy(apiobj.ORIGINAL_ROWS)
+
+        io_fd = io.StringIO()
+        cbobj = self.get_cbobj(
+            apiobj=apiobj,
+            cbexport=cbexport,
+            store={"fields_parsed": apiobj.fields_default},
+            getargs={"export_fd": io_fd, "export_fd_close": False, "custom_cbs": [custom_cb]},
+        )
+        cbobj.start()
+
+        for row in rows:
+            _id = row[apiobj.FIELD_AXON_ID]
+            new_rows = cbobj.process_row(row=row)
+            assert new_rows == [{apiobj.FIELD_AXON_ID: _id}]
+
+        assert cbobj._spill_file
+        assert not io_fd.getvalue().strip()
+        cbobj.stop()
+
+        start_val = io_fd.getvalue().splitlines()[0]
+        assert '"badwolf"' in start_val
+        assert cbobj.final_columns[-1] == "badwolf"
+        assert cbobj._spill_file.closed
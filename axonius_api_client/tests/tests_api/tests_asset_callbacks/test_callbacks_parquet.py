@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""Test suite for assets."""
+
+import copy
+
+import pytest
+
+from axonius_api_client.exceptions import ApiError
+
+from .test_callbacks import Callbacks
+
+pyarrow = pytest.importorskip("pyarrow")
+import pyarrow.parquet  # noqa: E402
+
+
+class TestCallbacksParquet(Callbacks):
+    @pytest.fixture(params=["api_devices"], scope="class")
+    def apiobj(self, request):
+        return request.getfixturevalue(request.param)
+
+    @pytest.fixture(scope="class", params=["parquet", "arrow"])
+    def cbexport(self, request):
+        return request.param
+
+    @staticmethod
+    def read(cbexport, path):
+        if cbexport == "parquet":
+            return pyarrow.parquet.read_table(str(path))
+        return pyarrow.ipc.open_file(str(path)).read_all()
+
+    def test_export(self, cbexport, apiobj, tmp_path):
+        export_file = tmp_path / f"badwolf.{cbexport}"
+        rows = copy.deepcopy(apiobj.ORIGINAL_ROWS)
+
+        getargs = {"export_file": export_file, "parquet_batch_size": 2, "export_schema": True}
+        cbobj = self.get_cbobj(apiobj=apiobj, cbexport=cbexport, getargs=getargs)
+        cbobj.start()
+
+        for row in rows:
+            row_id = row["internal_axon_id"]
+            rows_ret = cbobj.process_row(row=copy.deepcopy(row))
+            assert isinstance(rows_ret, list)
+            assert len(rows_ret) == 1
+            assert rows_ret[0] == {"internal_axon_id": row_id}
+
+        cbobj.stop()
+
+        table = self.read(cbexport=cbexport, path=export_file)
+        assert table.num_rows == len(rows)
+        assert table.schema.names[: len(cbobj.final_columns)] == cbobj.final_columns
+        for field, schema in zip(table.schema, cbobj.final_schemas):
+            assert field.type == cbobj.get_arrow_type(schema=schema)
+            assert field.metadata[b"name_qual"] == schema["name_qual"].encode()
+
+        if cbexport == "parquet":
+            row_groups = pyarrow.parquet.ParquetFile(str(export_file)).num_row_groups
+            assert row_groups == (len(rows) + 1) // 2
+
+    def test_export_added(self, cbexport, apiobj, tmp_path):
+        export_file = tmp_path / "badwolf"
+        rows = copy.deepcopy(apiobj.ORIGINAL_ROWS)
+
+        cbobj = self.get_cbobj(
+            apiobj=apiobj, cbexport=cbexport, getargs={"export_file": export_file}
+        )
+        cbobj.start()
+        for row in rows:
+            cbobj.process_row(row=copy.deepcopy(row))
+        cbobj.stop()
+
+        assert (tmp_path / f"badwolf.{cbexport}").is_file()
+
+    def test_export_no_rows(self, cbexport, apiobj, tmp_path):
+        export_file = tmp_path / f"badwolf.{cbexport}"
+        cbobj = self.get_cbobj(
+            apiobj=apiobj, cbexport=cbexport, getargs={"export_file": export_file}
+        )
+        cbobj.start()
+        cbobj.stop()
+
+        table = self.read(cbexport=cbexport, path=export_file)
+        assert table.num_rows == 0
+
+    def test_get_coercer(self, cbexport, apiobj):
+        cbobj = self.get_cbobj(apiobj=apiobj, cbexport=cbexport)
+        to_int = cbobj.get_coercer(arrow_type=pyarrow.int64())
+        assert [to_int(x) for x in [1, "2", "x", None, True]] == [1, 2, None, None, None]
+
+        to_list = cbobj.get_coercer(arrow_type=pyarrow.list_(pyarrow.string()))
+        assert to_list("a") == ["a"]
+        assert to_list([1, 2.5]) == ["1", "2.5"]
+        assert to_list(None) is None
+
+    def test_fail_no_export_file(self, cbexport, apiobj, tmp_path):
+        with pytest.raises(ApiError):
+            cbobj = self.get_cbobj(apiobj=apiobj, cbexport=cbexport, getargs={})
+            cbobj.start()
+
+    def test_fail_bad_batch_size(self, cbexport, apiobj, tmp_path):
+        getargs = {"export_file": tmp_path / "badwolf", "parquet_batch_size": 0}
+        with pytest.raises(ApiError):
+            cbobj = self.get_cbobj(apiobj=apiobj, cbexport=cbexport, getargs=getargs)
+            cbobj.start()
@@ -71,3 +71,60 @@ class TestCallbacksTable(Exports):
             cbobj.check_stop()
         assert cbobj.STATE["stop_fetch"]
         assert cbobj.STATE["stop_msg"]
+
+    def test_row_stream(self, cbexport, apiobj):
+        field_complex = apiobj.FIELD_COMPLEX
+        original_rows = copy.deepcopy(apiobj.COMPLEX_ROWS)
+
+        io_fd = io.StringIO()
+
+        cbobj = self.get_cbobj(
+            apiobj=apiobj,
+            cbexport=cbexport,
+            store={"fields_parsed": [field_complex]},
+            getargs={
+                "export_fd": io_fd,
+                "export_fd_close": False,
+                "table_max_rows": None,
+                "table_stream": True,
+                "table_stream_sample": 1,
+                "table_stream_width": 20,
+                "table_stream_header_every": 2,
+            },
+        )
+        cbobj.start()
+        assert cbobj._stream_fmt
+
+        for row in copy.deepcopy(original_rows):
+            cbobj.process_row(row=copy.deepcopy(row))
+            assert not cbobj._rows
+            assert io_fd.getvalue()
+
+        cbobj.stop()
+        lines = io_fd.getvalue().splitlines()
+        widths = {len(x) for x in lines if x}
+        assert len(widths) == 1
+        assert cbobj._stream_count == len(original_rows)
+        assert all(x <= 20 for x in cbobj._stream_widths)
+        assert lines[0].startswith("╒")
+        assert lines[-2].startswith("╘")
+
+    def test_row_stream_unsupported_format(self, cbexport, apiobj):
+        io_fd = io.StringIO()
+        cbobj = self.get_cbobj(
+            apiobj=apiobj,
+            cbexport=cbexport,
+            getargs={
+                "export_fd": io_fd,
+                "export_fd_close": False,
+                "table_stream": True,
+                "table_format": "html",
+            },
+        )
+        cbobj.start()
+        assert cbobj._stream_fmt is None
+        for row in copy.deepcopy(apiobj.ORIGINAL_ROWS[:2]):
+            cbobj.process_row(row=row)
+        assert len(cbobj._rows) == 2
+        cbobj.stop()
+        assert "<table>" in io_fd.getvalue()
@@ -391,6 +391,65 @@ class TestAssetsPublic(ModelMixinsBase):
                     and all_data["accurate_for_datetime"]
                 )
 
+    @FLAKY()
+    @pytest.mark.parametrize("ordered", [True, False])
+    def test_get_parallel_pages(self, apiobj, ordered):
+        rows_serial = apiobj.get(max_rows=6, page_size=2)
+        rows = apiobj.get(max_rows=6, page_size=2, parallel_pages=3, parallel_ordered=ordered)
+        check_assets(rows)
+        assert len(rows) == len(rows_serial)
+        assert apiobj.LAST_GET_REQUEST_OBJ.use_cursor is False
+        ids = [x["internal_axon_id"] for x in rows]
+        ids_serial = [x["internal_axon_id"] for x in rows_serial]
+        if ordered:
+            assert ids == ids_serial
+        else:
+            assert sorted(ids) == sorted(ids_serial)
+
+        state = apiobj.LAST_CALLBACKS.STATE
+        assert state["rows_processed_total"] == len(rows)
+        assert state["stop_fetch"] is True
+
+    @FLAKY()
+    def test_get_prefetch_pages(self, apiobj):
+        rows_serial = apiobj.get(max_rows=6, page_size=2)
+        rows = apiobj.get(max_rows=6, page_size=2, prefetch_pages=2)
+        check_assets(rows)
+        assert [x["internal_axon_id"] for x in rows] == [
+            x["internal_axon_id"] for x in rows_serial
+        ]
+
+        state = apiobj.LAST_CALLBACKS.STATE
+        assert state["rows_processed_total"] == len(rows)
+        assert isinstance(state["prefetch_seconds_fetch_stalled"], float)
+        assert isinstance(state["prefetch_seconds_process_stalled"], float)
+
+    @FLAKY()
+    def test_get_stream_pages(self, apiobj):
+        rows_serial = apiobj.get(max_rows=6, page_size=2)
+        rows = apiobj.get(max_rows=6, page_size=2, stream_pages=True)
+        check_assets(rows)
+        assert [x["internal_axon_id"] for x in rows] == [
+            x["internal_axon_id"] for x in rows_serial
+        ]
+
+        state = apiobj.LAST_CALLBACKS.STATE
+        assert state["rows_processed_total"] == len(rows)
+        assert state["rows_fetched_total"] >= len(rows)
+
+    @FLAKY()
+    def test_get_telemetry(self, apiobj):
+        rows = apiobj.get(max_rows=6, page_size=2)
+        telemetry = apiobj.LAST_CALLBACKS.TELEMETRY
+        assert len(telemetry.pages) == 3
+        assert all(x["bytes"] > 0 for x in telemetry.pages)
+        assert all(x["http_seconds"] > 0 for x in telemetry.pages)
+
+        summary = telemetry.summary()
+        assert summary["rows"]["total"] == len(rows)
+        assert summary["fetch_seconds"]["max"] >= summary["fetch_seconds"]["p50"]
+        assert summary["mb_per_second"] > 0
+
     @FLAKY()
     def test_get_id(self, apiobj):
         axon_id = apiobj.ORIGINAL_ROWS[0]["internal_axon_id"]
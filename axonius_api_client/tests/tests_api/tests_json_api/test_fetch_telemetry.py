@@ -0,0 +1,66 @@
+import datetime
+import json
+
+from axonius_api_client.api.json_api.assets import AssetsPage, FetchTelemetry
+
+
+def add_page(telemetry, rows, seconds):
+    start_dt = datetime.datetime.now(datetime.timezone.utc)
+    page = AssetsPage(assets=[{}] * rows)
+    page.page_start_dt = start_dt + datetime.timedelta(seconds=seconds)
+    page.RESPONSE_LOAD_SECONDS = seconds / 10
+    telemetry.start_page(page=page, start_dt=start_dt)
+    telemetry.add("process_seconds", 2.0)
+    telemetry.add("write_seconds", 0.5)
+    return page
+
+
+class TestFetchTelemetry:
+    def test_pages(self):
+        telemetry = FetchTelemetry()
+        for idx in range(1, 11):
+            add_page(telemetry=telemetry, rows=idx, seconds=idx)
+        telemetry.finish()
+
+        assert len(telemetry.pages) == 10
+        page = telemetry.pages[0]
+        assert page["page"] == 1
+        assert page["rows"] == 1
+        assert page["fetch_seconds"] == 1
+        assert page["decode_seconds"] == 0.1
+        assert page["callback_seconds"] == 1.5
+        assert page["bytes"] == 0
+
+        summary = telemetry.summary()
+        assert summary["pages"] == 10
+        assert summary["rows"]["total"] == 55
+        assert summary["fetch_seconds"]["p50"] == 5
+        assert summary["fetch_seconds"]["p95"] == 10
+        assert summary["fetch_seconds"]["max"] == 10
+        assert summary["write_seconds"]["total"] == 5
+        assert summary["rows_per_second"] > 0
+
+    def test_timer(self):
+        telemetry = FetchTelemetry()
+        with telemetry.timer("write_seconds"):
+            pass
+        assert not telemetry.pages
+
+        add_page(telemetry=telemetry, rows=1, seconds=1)
+        with telemetry.timer("write_seconds"):
+            pass
+        assert telemetry.current["write_seconds"] > 0.5
+
+    def test_to_json(self):
+        telemetry = FetchTelemetry()
+        add_page(telemetry=telemetry, rows=1, seconds=1)
+        telemetry.finish()
+        data = json.loads(telemetry.to_json())
+        assert data["summary"]["pages"] == 1
+        assert data["pages"][0]["rows"] == 1
+        assert "FetchTelemetry(pages=1" in str(telemetry)
+
+    def test_percentile(self):
+        assert FetchTelemetry.percentile([], 95) == 0
+        assert FetchTelemetry.percentile([3, 1, 2], 50) == 2
+        assert FetchTelemetry.percentile([3, 1, 2], 95) == 3
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""Test suite for the date window of axonius_api_client.api.system.ActivityLogs."""
+import datetime
+import logging
+
+from axonius_api_client.api.json_api.audit_logs import AuditLog
+from axonius_api_client.api.system.activity_logs import ActivityLogs
+from axonius_api_client.tools import dt_now
+
+NOW = dt_now().replace(microsecond=0)
+
+
+def get_row(hours_ago, action="login"):
+    date = NOW - datetime.timedelta(hours=hours_ago)
+    return AuditLog(action=action, category="c", date=date, message="m", type="t", user="u")
+
+
+class FakeActivityLogs(ActivityLogs):
+    def __init__(self, rows):
+        self.LOG = logging.getLogger(__name__)
+        self.rows = rows
+        self.calls = []
+
+    def _get(self, offset=0, limit=2, **kwargs):
+        self.calls.append({"offset": offset, "limit": limit, **kwargs})
+        return self.rows[offset : offset + limit]
+
+
+# newest first, like the REST API returns them
+ROWS = [get_row(x) for x in [1, 2, 3, 3, 5, 8, 13, 21]]
+
+
+class TestActivityLogsWindow:
+    def test_date_window_sent(self):
+        apiobj = FakeActivityLogs(rows=ROWS)
+        start = NOW - datetime.timedelta(hours=4)
+        found = apiobj.get(start_date=start, end_date=NOW, search="x", page_size=2)
+        assert found == ROWS[:4]
+        assert apiobj.calls[0]["date_from"] == start
+        assert apiobj.calls[0]["date_to"] == NOW
+        assert apiobj.calls[0]["search"] == "x"
+
+    def test_stop_early(self):
+        apiobj = FakeActivityLogs(rows=ROWS)
+        found = apiobj.get(within_last_hours=4, page_size=2)
+        assert found == ROWS[:4]
+        assert len(apiobj.calls) == 3
+
+        apiobj = FakeActivityLogs(rows=ROWS)
+        found = apiobj.get(within_last_hours=4, page_size=2, stop_early=False)
+        assert found == ROWS[:4]
+        assert len(apiobj.calls) == 5
+
+    def test_property_searches(self):
+        rows = [get_row(1, action="logout"), get_row(2)]
+        found = FakeActivityLogs(rows=rows).get(action="logout")
+        assert found == rows[:1]
+
+    def test_high_water_mark(self, tmp_path):
+        path = tmp_path / "activity_logs.json"
+        rows = ROWS[2:]
+        assert FakeActivityLogs(rows=rows).get(high_water_mark=path) == rows
+        assert path.is_file()
+
+        # one new record, and one record with the same date as the newest one fetched before
+        newer = get_row(0.5)
+        same = get_row(3, action="logout")
+        rows = [newer, same] + rows
+        apiobj = FakeActivityLogs(rows=rows)
+        assert apiobj.get(high_water_mark=path) == [newer, same]
+        assert apiobj.calls[0]["date_from"] == ROWS[2].date
+
+        assert FakeActivityLogs(rows=rows).get(high_water_mark=path) == []
+
+    def test_high_water_mark_max_rows(self, tmp_path):
+        path = tmp_path / "activity_logs.json"
+        found = FakeActivityLogs(rows=ROWS).get(high_water_mark=path, max_rows=2)
+        assert found == ROWS[:2]
+        assert not path.exists()
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""Test suite for axonius_api_client.async_connect."""
+import asyncio
+import threading
+import time
+
+import pytest
+
+from axonius_api_client.api.mixins import ChildMixins, ModelMixins
+from axonius_api_client.async_connect import AsyncConnect, AsyncHttp, AsyncModel
+from axonius_api_client.connect import Connect
+from axonius_api_client.exceptions import ConnectError
+
+
+class FakeHttp:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, **kwargs):
+        time.sleep(0.1)
+        self.calls.append((kwargs, threading.current_thread().name))
+        return kwargs
+
+
+class FakeChild(ChildMixins):
+    def __init__(self, parent):
+        self.parent = parent
+
+    def get(self, value):
+        return f"child {value}"
+
+
+class FakeModel(ModelMixins):
+    def __init__(self):
+        self.closed = False
+        self.child = FakeChild(parent=self)
+        self.name = "fake"
+
+    def count(self, query=None):
+        time.sleep(0.1)
+        return f"count {query}"
+
+    def get_generator(self, max_rows=10):
+        try:
+            for idx in range(max_rows):
+                yield {"idx": idx}
+        finally:
+            self.closed = True
+
+
+class TestAsyncHttp:
+    def test_call_concurrent(self):
+        http = FakeHttp()
+        ahttp = AsyncHttp(http=http, max_workers=10)
+
+        async def main():
+            return await asyncio.gather(*[ahttp(path=str(x)) for x in range(10)])
+
+        start = time.perf_counter()
+        results = asyncio.run(main())
+        took = time.perf_counter() - start
+        ahttp.close()
+
+        assert results == [{"path": str(x)} for x in range(10)]
+        assert took < 0.5
+        assert all(x[1].startswith("AsyncHttp") for x in http.calls)
+
+    def test_executor_shared(self):
+        ahttp1 = AsyncHttp(http=FakeHttp())
+        ahttp2 = AsyncHttp(http=FakeHttp(), executor=ahttp1.executor)
+        assert ahttp2.executor is ahttp1.executor
+        ahttp2.close()
+        assert asyncio.run(ahttp1(path="x")) == {"path": "x"}
+        ahttp1.close()
+
+
+class TestAsyncModel:
+    def test_wraps(self):
+        model = FakeModel()
+        amodel = AsyncModel(model=model, http=AsyncHttp(http=FakeHttp()))
+
+        async def main():
+            counts = await asyncio.gather(*[amodel.count(query=str(x)) for x in range(5)])
+            rows = [x async for x in amodel.get_generator(max_rows=25, chunk_size=10)]
+            child = await amodel.child.get("x")
+            return counts, rows, child
+
+        counts, rows, child = asyncio.run(main())
+        assert counts == [f"count {x}" for x in range(5)]
+        assert rows == [{"idx": x} for x in range(25)]
+        assert child == "child x"
+        assert isinstance(amodel.child, AsyncModel)
+        assert amodel.name == "fake"
+        assert model.closed is True
+
+    def test_generator_closed_early(self):
+        model = FakeModel()
+        amodel = AsyncModel(model=model, http=AsyncHttp(http=FakeHttp()))
+
+        async def main():
+            agen = amodel.get_generator(max_rows=100, chunk_size=10)
+            rows = []
+            async for row in agen:
+                rows.append(row)
+                if len(rows) == 5:
+                    break
+            await agen.aclose()
+            return rows
+
+        rows = asyncio.run(main())
+        assert len(rows) == 5
+        assert model.closed is True
+
+
+class TestAsyncConnect:
+    def test_not_started(self):
+        client = Connect(url="https://127.0.0.1", key="x", secret="y")
+        aclient = AsyncConnect(client=client)
+        assert aclient.client is client
+        assert aclient.http.http is client.http
+        assert "Not connected" in str(aclient)
+        with pytest.raises(ConnectError):
+            aclient.devices
+        assert aclient.CREDENTIALS is client.CREDENTIALS
+        aclient.close()
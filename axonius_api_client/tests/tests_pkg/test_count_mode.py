@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""Test suite for getting the total count of assets in AssetMixin.get_generator."""
+import concurrent.futures
+import logging
+import types
+
+import pytest
+
+from axonius_api_client.api.assets.asset_mixin import AssetMixin
+from axonius_api_client.api.json_api.assets import AssetsPage
+
+APIOBJ = types.SimpleNamespace(ASSET_TYPE="devices", LOG=logging.getLogger(__name__))
+
+
+def get_state(**kwargs):
+    return AssetsPage.create_state(page_size=10, **kwargs)
+
+
+def get_future(result=None, exc=None):
+    future = concurrent.futures.Future()
+    if exc:
+        future.set_exception(exc)
+    else:
+        future.set_result(result)
+    return future
+
+
+class TestIterPageOffsets:
+    def test_known(self):
+        state = get_state(initial_count=25)
+        assert list(AssetMixin._iter_page_offsets(state=state)) == [0, 10, 20]
+
+    def test_known_empty(self):
+        state = get_state(initial_count=0)
+        assert list(AssetMixin._iter_page_offsets(state=state)) == []
+
+    def test_unknown(self):
+        state = get_state(initial_count=None)
+        offsets = AssetMixin._iter_page_offsets(state=state)
+        assert next(offsets) == 0
+        state["rows_to_fetch_total"] = 15
+        assert list(offsets) == [10]
+
+    def test_unknown_empty(self):
+        state = get_state(initial_count=None)
+        offsets = AssetMixin._iter_page_offsets(state=state)
+        assert next(offsets) == 0
+        assert list(offsets) == []
+
+
+class TestSetInitialCount:
+    def test_page(self):
+        state, store = get_state(initial_count=None), {"initial_count": None}
+        AssetMixin._set_initial_count(APIOBJ, state=state, store=store)
+        assert state["rows_initial_count"] is None
+
+        state["page"] = {"totalResources": 15}
+        state["rows_to_fetch_total"] = 15
+        AssetMixin._set_initial_count(APIOBJ, state=state, store=store)
+        assert state["rows_initial_count"] == store["initial_count"] == 15
+
+    def test_future(self):
+        state, store = get_state(initial_count=None), {"initial_count": None}
+        AssetMixin._set_initial_count(APIOBJ, state=state, store=store, future=get_future(20))
+        assert state["rows_initial_count"] == store["initial_count"] == 20
+
+    @pytest.mark.parametrize("initial_count", [0, 5])
+    def test_already_set(self, initial_count):
+        state, store = get_state(initial_count=initial_count), {"initial_count": initial_count}
+        AssetMixin._set_initial_count(APIOBJ, state=state, store=store, future=get_future(20))
+        assert state["rows_initial_count"] == store["initial_count"] == initial_count
+
+    def test_future_error(self, caplog):
+        state, store = get_state(initial_count=None), {"initial_count": None}
+        future = get_future(exc=ValueError("badwolf"))
+        AssetMixin._set_initial_count(APIOBJ, state=state, store=store, future=future)
+        assert state["rows_initial_count"] is None
+        assert "badwolf" in caplog.text
+
+    def test_future_cancelled(self, caplog):
+        state, store = get_state(initial_count=None), {"initial_count": None}
+        future = concurrent.futures.Future()
+        future.cancel()
+        AssetMixin._set_initial_count(APIOBJ, state=state, store=store, future=future)
+        assert state["rows_initial_count"] is None
+        assert not caplog.text
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""Test suite for axonius_api_client.disk_cache."""
+import os
+import time
+
+import pytest
+
+from axonius_api_client.api.json_api.adapters import AdaptersList
+from axonius_api_client.connect import Connect
+from axonius_api_client.disk_cache import DiskCache
+
+KEY = ["https://10.0.0.1", "user"]
+STAMP = {"version": "4.8", "build_date": "today", "package": "5.0"}
+
+
+class Counter:
+    def __init__(self, value):
+        self.value = value
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.value
+
+
+class TestDiskCache:
+    def test_get(self, tmp_path):
+        cache = DiskCache(path=tmp_path)
+        func = Counter({"agg": [{"name": "hostname"}]})
+
+        assert cache.get(name="fields", func=func, key=KEY, stamp=STAMP) == func.value
+        assert cache.get(name="fields", func=func, key=KEY, stamp=STAMP) == func.value
+        assert func.calls == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+
+        other = DiskCache(path=tmp_path)
+        assert other.get(name="fields", func=func, key=KEY, stamp=STAMP) == func.value
+        assert func.calls == 1
+        assert list(tmp_path.glob("*/*.tmp")) == []
+
+    def test_key(self, tmp_path):
+        cache = DiskCache(path=tmp_path)
+        func = Counter(1)
+        cache.get(name="fields", func=func, key=KEY, stamp=STAMP)
+        cache.get(name="fields", func=func, key=[KEY[0], "other"], stamp=STAMP)
+        assert func.calls == 2
+        assert len(list(tmp_path.iterdir())) == 2
+
+    def test_stamp(self, tmp_path):
+        cache = DiskCache(path=tmp_path)
+        func = Counter(1)
+        cache.get(name="fields", func=func, key=KEY, stamp=STAMP)
+        cache.get(name="fields", func=func, key=KEY, stamp={**STAMP, "version": "4.9"})
+        assert func.calls == 2
+
+    def test_ttl(self, tmp_path):
+        cache = DiskCache(path=tmp_path, ttl=0.1)
+        func = Counter(1)
+        cache.get(name="fields", func=func, key=KEY, stamp=STAMP)
+        time.sleep(0.2)
+        cache.get(name="fields", func=func, key=KEY, stamp=STAMP)
+        assert func.calls == 2
+        cache.get(name="fields", func=func, key=KEY, stamp=STAMP, ttl=None)
+        cache.get(name="fields", func=func, key=KEY, stamp=STAMP, ttl=60)
+        assert func.calls == 2
+
+    def test_corrupt(self, tmp_path):
+        cache = DiskCache(path=tmp_path)
+        func = Counter(1)
+        cache.get(name="fields", func=func, key=KEY, stamp=STAMP)
+        cache.get_file(name="fields", key=KEY).write_bytes(b"badwolf")
+        assert cache.get(name="fields", func=func, key=KEY, stamp=STAMP) == 1
+        assert func.calls == 2
+
+    @pytest.mark.skipif(not hasattr(os, "getuid"), reason="no file ownership")
+    def test_insecure(self, tmp_path):
+        cache = DiskCache(path=tmp_path)
+        func = Counter(1)
+        cache.get(name="fields", func=func, key=KEY, stamp=STAMP)
+        cache.get_file(name="fields", key=KEY).chmod(0o664)
+        assert cache.get(name="fields", func=func, key=KEY, stamp=STAMP) == 1
+        assert func.calls == 2
+        assert cache.hits == 0
+
+    def test_default_path(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        assert DiskCache().path == tmp_path / "axonius_api_client"
+
+    def test_disabled(self, tmp_path):
+        cache = DiskCache(path=tmp_path, enabled=False)
+        func = Counter(1)
+        cache.get(name="fields", func=func, key=KEY, stamp=STAMP)
+        cache.get(name="fields", func=func, key=KEY, stamp=STAMP)
+        assert func.calls == 2
+        assert list(tmp_path.iterdir()) == []
+
+    def test_clear(self, tmp_path):
+        cache = DiskCache(path=tmp_path)
+        cache.get(name="fields", func=Counter(1), key=KEY, stamp=STAMP)
+        cache.get(name="adapters", func=Counter(2), key=KEY, stamp=STAMP)
+        assert cache.clear() == 2
+        assert cache.to_dict()["misses"] == 2
+
+
+class TestConnectDiskCache:
+    def test_not_started(self, tmp_path):
+        client = Connect(
+            url="https://127.0.0.1", key="x", secret="y", disk_cache=True, disk_cache_path=tmp_path
+        )
+        func = Counter(1)
+        assert client.get_disk_cached(name="fields", func=func) == 1
+        assert client.get_disk_cached(name="fields", func=func) == 1
+        assert func.calls == 2
+        assert client.DISK_CACHE.enabled is True
+        assert client.DISK_CACHE.path == tmp_path
+
+    def test_started(self, tmp_path):
+        client = Connect(
+            url="https://127.0.0.1", key="x", secret="y", disk_cache=True, disk_cache_path=tmp_path
+        )
+        client.STARTED = True
+        client.ABOUT_CACHE = {"Version": "4_8", "Build Date": "today"}
+        func = Counter(1)
+        assert client.get_disk_cached(name="fields", func=func) == 1
+        assert client.get_disk_cached(name="fields", func=func) == 1
+        assert func.calls == 1
+        assert client.DISK_CACHE.hits == 1
+
+
+class TestAdaptersListRebuild:
+    def test_idempotent(self):
+        document_meta = {"adapter_list": [{"name": "aws_adapter"}]}
+        first = AdaptersList(document_meta=document_meta)
+        second = AdaptersList(document_meta=first.document_meta)
+        assert second.adapters["aws"]["name_raw"] == "aws_adapter"
+        assert second.adapters["aws"]["name"] == "aws"
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""Test suite for axonius_api_client.api.json_api.assets.FetchCheckpoint."""
+import json
+import logging
+import types
+
+import pytest
+
+from axonius_api_client.api.asset_callbacks.base_json import Json
+from axonius_api_client.api.json_api.assets import AssetRequest, FetchCheckpoint
+from axonius_api_client.exceptions import ApiError
+
+APIOBJ = types.SimpleNamespace(
+    LOG=logging.getLogger(__name__), fields=types.SimpleNamespace(get=lambda: {})
+)
+ROWS = [{"internal_axon_id": str(x)} for x in range(6)]
+
+
+def get_checkpoint():
+    request_obj = AssetRequest(filter='(x == "1")', fields={"devices": ["a"]}, use_cursor=True)
+    request_obj.set_page(limit=2, offset=0)
+    state = {"rows_offset": 4, "page_cursor": "cursor2", "page_number": 2, "extra": 1}
+    store = {"export": "json", "query": '(x == "1")', "fields_parsed": ["a"], "extra": 1}
+    return FetchCheckpoint.create(
+        asset_type="devices", request_obj=request_obj, state=state, store=store
+    )
+
+
+class TestFetchCheckpoint:
+    def test_save_load(self, tmp_path):
+        path = tmp_path / "devices.checkpoint"
+        checkpoint = get_checkpoint()
+        checkpoint.save(path=path)
+        assert list(tmp_path.iterdir()) == [path]
+
+        loaded = FetchCheckpoint.load(path=path)
+        assert loaded.state["rows_offset"] == 4
+        assert "extra" not in loaded.state and "extra" not in loaded.store
+        assert loaded.store["fields_parsed"] == ["a"]
+
+        request_obj = loaded.get_request()
+        assert request_obj.page.offset == 4
+        assert request_obj.cursor_id == "cursor2"
+        assert request_obj.filter == '(x == "1")'
+
+    def test_getargs(self, tmp_path):
+        getargs = {
+            "json_flat": True,
+            "field_titles": False,
+            "field_excludes": ["a", "b"],
+            "export_templates": {"{X}": "y"},
+            "export_fd": tmp_path,
+            "custom_cbs": [print],
+        }
+        request_obj = AssetRequest(filter="", fields={"devices": ["a"]})
+        checkpoint = FetchCheckpoint.create(
+            asset_type="devices", request_obj=request_obj, state={}, store={}, getargs=getargs
+        )
+        path = checkpoint.save(path=tmp_path / "devices.checkpoint")
+        loaded = FetchCheckpoint.load(path=path)
+        assert loaded.getargs == {
+            "json_flat": True,
+            "field_titles": False,
+            "field_excludes": ["a", "b"],
+            "export_templates": {"{X}": "y"},
+        }
+
+        supplied = {"json_flat": False, "field_titles": False, "export_fd": tmp_path}
+        resumed, replaced = loaded.get_getargs(getargs=supplied)
+        assert replaced == ["json_flat"]
+        assert resumed["json_flat"] is True
+        assert resumed["export_fd"] is tmp_path
+        assert resumed["field_excludes"] == ["a", "b"]
+        assert supplied["json_flat"] is False
+
+    def test_getargs_old_checkpoint(self):
+        checkpoint = get_checkpoint()
+        assert checkpoint.getargs == {}
+        assert checkpoint.get_getargs(getargs={"json_flat": True}) == ({"json_flat": True}, [])
+
+    def test_load_invalid(self, tmp_path):
+        with pytest.raises(ApiError):
+            FetchCheckpoint.load(path=tmp_path / "missing")
+
+        path = tmp_path / "bad"
+        path.write_text("badwolf")
+        with pytest.raises(ApiError):
+            FetchCheckpoint.load(path=path)
+
+    def test_check(self):
+        checkpoint = get_checkpoint()
+        checkpoint.check(asset_type="devices")
+        with pytest.raises(ApiError):
+            checkpoint.check(asset_type="users")
+
+
+class TestJsonResume:
+    def get_cbobj(self, path, flat, resume_export=None):
+        getargs = {"export_file": path, "json_flat": flat, "do_echo": False}
+        store = {"resume_export": resume_export or {}}
+        return Json(apiobj=APIOBJ, store=store, getargs=getargs)
+
+    @pytest.mark.parametrize("flat", [True, False])
+    def test_resume(self, tmp_path, flat):
+        path = tmp_path / "devices.json"
+        cbobj = self.get_cbobj(path=path, flat=flat)
+        cbobj.start()
+        cbobj.write_rows(rows=ROWS[:2])
+        export = cbobj.get_checkpoint()
+        assert export["export_file"] == str(path)
+
+        # rows of a page that was not finished before the fetch died
+        cbobj.write_rows(rows=ROWS[2:3])
+        cbobj._fd.close()
+
+        cbobj = self.get_cbobj(path=path, flat=flat, resume_export=export)
+        cbobj.start()
+        cbobj.write_rows(rows=ROWS[2:])
+        cbobj.stop()
+
+        text = path.read_text()
+        if flat:
+            rows = [json.loads(x) for x in text.splitlines() if x]
+        else:
+            rows = json.loads(text)
+        assert rows == ROWS
+
+    def test_resume_missing_file(self, tmp_path):
+        export = {"export_file": str(tmp_path / "missing.json"), "export_position": 10}
+        cbobj = self.get_cbobj(path=tmp_path / "missing.json", flat=True, resume_export=export)
+        with pytest.raises(ApiError):
+            cbobj.start()
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""Test suite for axonius_api_client.api.assets.fields.SchemasIndex."""
+import pytest
+
+from axonius_api_client.api.assets.fields import Fields, SchemasIndex
+
+
+def schema(name, title, selectable=True, is_root=True):
+    return {
+        "name": name,
+        "name_base": name,
+        "name_qual": f"specific_data.data.{name}",
+        "column_name": f"agg:{name}",
+        "title": title,
+        "selectable": selectable,
+        "is_root": is_root,
+    }
+
+
+SCHEMAS = [
+    schema("hostname", "Host Name"),
+    schema("hostname_preferred", "Preferred Host Name"),
+    schema("network_interfaces", "Network Interfaces"),
+    schema("ips", "IPs", is_root=False),
+    schema("hidden", "Hidden", selectable=False),
+    schema("os.type", "OS: Type"),
+]
+
+
+class TestSchemasIndex:
+    @pytest.mark.parametrize(
+        "value,exp",
+        [
+            ("hostname", "hostname"),
+            (" HOST NAME ", "hostname"),
+            ("specific_data.data.ips", "ips"),
+            ("agg:os.type", "os.type"),
+            ("badwolf", None),
+            ("hidden", None),
+        ],
+    )
+    def test_find(self, value, exp):
+        index = SchemasIndex(schemas=SCHEMAS)
+        found = index.find(value=value, keys=["name", "name_qual", "title", "column_name"])
+        assert (found or {}).get("name") == exp
+
+    def test_find_not_selectable(self):
+        index = SchemasIndex(schemas=SCHEMAS)
+        assert index.find(value="hidden", keys=["name"], selectable_only=False) is SCHEMAS[4]
+
+    def test_candidates(self):
+        index = SchemasIndex(schemas=SCHEMAS)
+        keys = ["name_base", "title"]
+        assert index.get_candidates(search="host", keys=keys) == SCHEMAS[:2]
+        assert index.get_candidates(search="ip", keys=keys) == [SCHEMAS[3]]
+        assert index.get_candidates(search="", keys=keys) == SCHEMAS
+        assert SCHEMAS[0] in index.get_candidates(search="HSTNM", keys=keys, fuzzy=True)
+
+    @pytest.mark.parametrize(
+        "search,root_only",
+        [("host", False), ("ip", False), ("os", True), ("hstnme", True), ("ntwrk", False)],
+    )
+    def test_fuzzy_filter_same(self, search, root_only):
+        index = SchemasIndex(schemas=SCHEMAS)
+        exp = Fields.fuzzy_filter(search=search, schemas=SCHEMAS, root_only=root_only)
+        found = Fields.fuzzy_filter(
+            search=search, schemas=SCHEMAS, root_only=root_only, index=index
+        )
+        assert found == exp
+        assert found
+
+    def test_fuzzy_filter_other_schemas(self):
+        index = SchemasIndex(schemas=SCHEMAS)
+        other = SCHEMAS[2:]
+        found = Fields.fuzzy_filter(search="host", schemas=other, index=index)
+        assert found == []
@@ -1,6 +1,10 @@
 # -*- coding: utf-8 -*-
 """Test suite for axonius_api_client.http."""
+import gzip
+import http.server
 import logging
+import threading
+import time
 
 import pytest
 import requests
@@ -8,7 +12,14 @@ import requests
 import urllib3.exceptions
 
 from axonius_api_client.exceptions import HttpError
-from axonius_api_client.http import Http
+from axonius_api_client.http import (
+    Http,
+    Http2Adapter,
+    PoolAdapter,
+    RateLimiter,
+    ResponseHistory,
+    RetryPolicy,
+)
 from axonius_api_client.projects.url_parser import UrlParser
 from axonius_api_client.projects import cert_human
 from axonius_api_client.version import __version__
@@ -28,6 +39,377 @@ from ..utils import (
 InsecureRequestWarning = urllib3.exceptions.InsecureRequestWarning
 
 
+class KeepAliveHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        self.do_GET()
+
+    def log_message(self, *args):
+        pass
+
+
+class FlakyHandler(KeepAliveHandler):
+    """Respond with the status in the path until the count in the path is used up."""
+
+    counts = {}
+
+    def do_GET(self):
+        _, status, count, retry_after = self.path.split("/")
+        seen = self.counts[self.path] = self.counts.get(self.path, 0) + 1
+        if seen > int(count):
+            return super().do_GET()
+        self.send_response(int(status))
+        if retry_after:
+            self.send_header("Retry-After", retry_after)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+
+def serve(handler):
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+@pytest.fixture(scope="module")
+def local_url():
+    server, url = serve(KeepAliveHandler)
+    yield url
+    server.shutdown()
+
+
+@pytest.fixture(scope="module")
+def flaky_url():
+    server, url = serve(FlakyHandler)
+    yield url
+    server.shutdown()
+
+
+class TestHttpPool:
+    """Test connection pool options of Http."""
+
+    def test_pool_options(self, local_url):
+        http = Http(url=local_url, pool_connections=2, pool_maxsize=5, pool_block=True)
+        adapter = http.session.get_adapter(local_url)
+        assert isinstance(adapter, PoolAdapter)
+        assert adapter._pool_connections == 2
+        assert adapter._pool_maxsize == 5
+        assert adapter._pool_block is True
+
+    def test_connections_reused(self, local_url):
+        http = Http(url=local_url)
+        for _ in range(5):
+            assert http().json() == {"ok": True}
+        assert http.CONNECTIONS.to_dict() == {"opened": 1, "reused": 4, "requests": 5}
+
+    def test_keep_alive_false(self, local_url):
+        http = Http(url=local_url, keep_alive=False)
+        for _ in range(3):
+            assert http().json() == {"ok": True}
+        assert http.CONNECTIONS.to_dict() == {"opened": 3, "reused": 0, "requests": 3}
+
+    def test_http2(self, local_url):
+        pytest.importorskip("httpx")
+        pytest.importorskip("h2")
+        http = Http(url=local_url, http2=True)
+        assert isinstance(http.session.get_adapter(local_url), Http2Adapter)
+        for _ in range(3):
+            response = http()
+            assert isinstance(response, requests.Response)
+            assert response.status_code == 200
+            assert response.json() == {"ok": True}
+            assert list(response.iter_content(chunk_size=4))
+        assert http.CONNECTIONS.to_dict() == {"opened": 1, "reused": 2, "requests": 3}
+
+    def test_http2_stream(self, local_url):
+        pytest.importorskip("httpx")
+        pytest.importorskip("h2")
+        http = Http(url=local_url, http2=True)
+        response = http(stream=True)
+        assert response._content_consumed is False
+        assert b"".join(response.iter_content(chunk_size=4)) == b'{"ok": true}'
+        response.close()
+        assert http().json() == {"ok": True}
+
+    def test_http2_connect_error(self):
+        pytest.importorskip("httpx")
+        http = Http(url="http://127.0.0.1:1", http2=True, max_retries=1)
+        with pytest.raises(requests.ConnectionError):
+            http()
+
+
+class TestRetryPolicy:
+    """Test RetryPolicy."""
+
+    def test_backoff(self):
+        policy = RetryPolicy(max_attempts=10, backoff=1, backoff_factor=2, backoff_max=5, jitter=0)
+        assert [policy.get_backoff(attempt=x) for x in range(1, 6)] == [1, 2, 4, 5, 5]
+
+    def test_backoff_jitter(self):
+        policy = RetryPolicy(backoff=4, jitter=0.5)
+        delays = [policy.get_backoff(attempt=1) for _ in range(100)]
+        assert all(2 <= x <= 4 for x in delays)
+        assert len(set(delays)) > 1
+
+    def test_is_retryable(self):
+        policy = RetryPolicy()
+        response = requests.Response()
+        response.status_code = 503
+        assert policy.is_retryable(method="get", response=response)
+        assert not policy.is_retryable(method="post", response=response)
+        assert policy.is_retryable(method="post", response=response, idempotent=True)
+        response.status_code = 500
+        assert not policy.is_retryable(method="get", response=response)
+
+        read_error = requests.ReadTimeout("read")
+        assert policy.is_retryable(method="get", exc=read_error)
+        assert not policy.is_retryable(method="post", exc=read_error)
+
+        connect_error = requests.ConnectTimeout("connect")
+        assert policy.is_retryable(method="post", exc=connect_error)
+
+    def test_retry_after(self):
+        policy = RetryPolicy(jitter=0)
+        response = requests.Response()
+        response.status_code = 429
+        response.headers["Retry-After"] = "7"
+        assert policy.get_delay(attempt=1, method="get", response=response) == 7
+        response.headers["Retry-After"] = "Wed, 21 Oct 2015 07:28:00 GMT"
+        assert policy.get_delay(attempt=1, method="get", response=response) == 0
+
+        policy = RetryPolicy(retry_after=False, backoff=1, jitter=0)
+        response.headers["Retry-After"] = "7"
+        assert policy.get_delay(attempt=1, method="get", response=response) == 1
+
+    def test_limits(self):
+        policy = RetryPolicy(max_attempts=2, backoff=10, jitter=0, budget=15)
+        response = requests.Response()
+        response.status_code = 503
+        assert policy.get_delay(attempt=1, method="get", response=response) == 10
+        assert policy.get_delay(attempt=2, method="get", response=response) is None
+        assert policy.get_delay(attempt=1, waited=10, method="get", response=response) is None
+
+
+class TestHttpRetry:
+    """Test Http retrying requests with RetryPolicy."""
+
+    def get_http(self, url, **kwargs):
+        policy = RetryPolicy(backoff=0.01, jitter=0, **kwargs)
+        return Http(url=url, retry_policy=policy)
+
+    def test_default_policy(self, local_url):
+        http = Http(url=local_url, max_retries=4, retry_backoff=2)
+        assert http.RETRY_POLICY.max_attempts == 4
+        assert http.RETRY_POLICY.backoff == 2
+
+    def test_retry_status(self, flaky_url):
+        http = self.get_http(flaky_url, max_attempts=3)
+        response = http(path="503/2/")
+        assert response.status_code == 200
+        assert http.CONNECTIONS.requests == 3
+
+    def test_retry_status_exhausted(self, flaky_url):
+        http = self.get_http(flaky_url, max_attempts=2)
+        response = http(path="502/5/")
+        assert response.status_code == 502
+        assert http.CONNECTIONS.requests == 2
+
+    def test_retry_not_idempotent(self, flaky_url):
+        http = self.get_http(flaky_url, max_attempts=3)
+        response = http(path="503/1/", method="post")
+        assert response.status_code == 503
+        assert http.CONNECTIONS.requests == 1
+
+    def test_retry_after_budget(self, flaky_url):
+        http = self.get_http(flaky_url, max_attempts=3, budget=5)
+        response = http(path="429/1/60")
+        assert response.status_code == 429
+        assert http.CONNECTIONS.requests == 1
+
+    def test_retry_connect_error(self):
+        http = self.get_http("http://127.0.0.1:1", max_attempts=2)
+        with pytest.raises(requests.ConnectionError):
+            http(method="post")
+        assert http.CONNECTIONS.requests == 2
+
+
+class TestRateLimiter:
+    """Test RateLimiter."""
+
+    @staticmethod
+    def get_response(status_code):
+        response = requests.Response()
+        response.status_code = status_code
+        return response
+
+    def test_no_limits(self):
+        limiter = RateLimiter()
+        start = time.perf_counter()
+        waits = []
+        for _ in range(100):
+            waits.append(limiter.acquire())
+            limiter.release()
+        assert time.perf_counter() - start < 0.5
+        assert limiter.requests == 100
+        assert set(waits) == {0.0}
+        assert limiter.wait_seconds == 0.0
+
+    def test_rate(self):
+        limiter = RateLimiter(rate=20, burst=1)
+        start = time.perf_counter()
+        waits = [limiter.acquire() for _ in range(6)]
+        assert time.perf_counter() - start >= 0.24
+        assert waits[0] == 0.0
+        assert all(wait > 0 for wait in waits[1:])
+        assert limiter.wait_seconds == pytest.approx(sum(waits))
+
+    def test_max_in_flight(self):
+        limiter = RateLimiter(max_in_flight=2)
+
+        def work():
+            limiter.acquire()
+            time.sleep(0.1)
+            limiter.release()
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert time.perf_counter() - start >= 0.2
+        assert limiter.wait_seconds_max >= 0.09
+
+    def test_adapt(self):
+        limiter = RateLimiter(rate=10, adapt_recover=2)
+        assert limiter.check_response(response=self.get_response(429)) == 5
+        assert limiter.check_response(response=self.get_response(429)) == 2.5
+        assert limiter.throttled == 2
+        for _ in range(2):
+            limiter.check_response(response=self.get_response(200))
+        assert limiter.rate == 5
+        for _ in range(2):
+            limiter.check_response(response=self.get_response(200))
+        assert limiter.rate == 10
+
+    def test_adapt_no_rate(self):
+        limiter = RateLimiter(adapt_recover=1)
+        for _ in range(5):
+            limiter.acquire()
+        rate = limiter.check_response(response=self.get_response(429))
+        assert rate is not None and rate >= limiter.adapt_min
+        limiter.check_response(response=self.get_response(200))
+        assert limiter.rate is None
+
+    def test_adapt_false(self):
+        limiter = RateLimiter(rate=10, adapt=False)
+        assert limiter.check_response(response=self.get_response(429)) == 10
+
+    def test_http_adapt_configured(self, local_url):
+        assert Http(url=local_url).RATE_LIMITER.adapt is False
+        assert Http(url=local_url, rate_limit=5).RATE_LIMITER.adapt is True
+        assert Http(url=local_url, max_in_flight=2).RATE_LIMITER.adapt is True
+
+    def test_http_no_wait_not_logged(self, local_url, caplog):
+        http = Http(url=local_url, log_level="debug")
+        with caplog.at_level(logging.DEBUG, logger=http.LOG.name):
+            http()
+            http()
+        assert [x for x in caplog.messages if x.startswith("Attempt 1")]
+        assert not [x for x in caplog.messages if x.startswith("Waited")]
+
+    def test_http_shared(self, flaky_url):
+        limiter = RateLimiter(rate=50)
+        policy = RetryPolicy(backoff=0.01, jitter=0)
+        http1 = Http(url=flaky_url, rate_limiter=limiter, retry_policy=policy)
+        http2 = Http(url=flaky_url, rate_limiter=limiter)
+        assert http2.RATE_LIMITER is limiter
+
+        response = http1(path="429/1/")
+        assert response.status_code == 200
+        assert limiter.throttled == 1
+        assert limiter.rate == 25
+        assert limiter.requests == 2
+        assert response.RATE_LIMIT_SECONDS >= 0
+
+
+class TestResponseHistory:
+    """Test ResponseHistory."""
+
+    def test_max_items(self, local_url):
+        http = Http(url=local_url, save_history=True, history_max_items=3)
+        responses = [http() for _ in range(5)]
+        assert len(http.HISTORY) == 3
+        assert list(http.HISTORY) == responses[2:]
+        assert responses[0] not in http.HISTORY
+        assert http.HISTORY.dropped == 2
+
+    def test_max_bytes(self, local_url):
+        http = Http(url=local_url, save_history=True, history_max_bytes=30)
+        for _ in range(5):
+            http()
+        assert len(http.HISTORY) == 2
+        assert http.HISTORY.bytes == 24
+
+    def test_sample_rate(self, local_url):
+        http = Http(url=local_url, save_history=True, history_sample_rate=0)
+        http()
+        assert len(http.HISTORY) == 0
+        assert http.HISTORY.received == 1
+
+    def test_metadata_only(self, local_url):
+        http = Http(url=local_url, save_history=True, history_metadata_only=True)
+        http(path="meta", method="post", data="abc")
+        item = http.HISTORY[0]
+        assert isinstance(item, dict)
+        assert item["method"] == "POST"
+        assert item["url"].endswith("/meta")
+        assert item["status_code"] == 200
+        assert item["request_bytes"] == 3
+        assert item["response_bytes"] == 12
+        assert http.HISTORY.to_list() == [item]
+
+    def test_spill(self, local_url, tmp_path):
+        path = tmp_path / "history.jsonl.gz"
+        history = ResponseHistory(spill_path=path, spill_bodies=True)
+        http = Http(url=local_url, save_history=True, history=history)
+        for _ in range(3):
+            http()
+        assert all(isinstance(x, dict) for x in http.HISTORY)
+
+        # readable while the client is still running
+        lines = list(ResponseHistory.read_spill(path=path))
+        assert len(lines) == 3
+        assert lines[0]["status_code"] == 200
+        assert lines[0]["response_body"] == '{"ok": true}'
+        http.close()
+
+    def test_spill_truncated(self, local_url, tmp_path):
+        path = tmp_path / "history.jsonl.gz"
+        http = Http(url=local_url, save_history=True, history_spill_path=path)
+        for _ in range(2):
+            http()
+        # a line that was being written when the client died
+        path.write_bytes(path.read_bytes() + gzip.compress(b'{"status_code": 200}\n' * 50)[:-20])
+        assert len(list(ResponseHistory.read_spill(path=path))) == 2
+
+    def test_slice(self, local_url):
+        http = Http(url=local_url, save_history=True)
+        responses = [http() for _ in range(5)]
+        assert http.HISTORY[-2:] == responses[-2:]
+        assert http.HISTORY[-1] is responses[-1]
+
+
 class TestHttp:
     """Test Http."""
 
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+"""Test suite for axonius_api_client.json_backend."""
+import datetime
+import functools
+import json
+import logging
+import textwrap
+import time
+import types
+
+import pytest
+
+from axonius_api_client import json_backend
+from axonius_api_client.api.asset_callbacks.base_json import Json
+from axonius_api_client.tools import AxJSONEncoder, json_dump
+
+BACKENDS = json_backend.get_backends()
+
+
+def get_page(count: int = 10000) -> dict:
+    """Build a synthetic page of assets shaped like a response from the assets endpoint."""
+    data = []
+    for idx in range(count):
+        attributes = {
+            "internal_axon_id": f"{idx:032x}",
+            "adapters": ["active_directory_adapter", "aws_adapter", "crowd_strike_adapter"],
+            "specific_data.data.hostname": [f"host-{idx}.example.com"],
+            "specific_data.data.network_interfaces.ips": [f"10.0.{idx % 256}.{idx % 254 + 1}"],
+            "specific_data.data.last_seen": "2022-01-01T00:00:00+00:00",
+            "specific_data.data.os.type": ["Windows"],
+            "specific_data.data.installed_software": [
+                {"name": f"software-{x}", "version": f"1.{x}", "vendor": "vendor"}
+                for x in range(5)
+            ],
+            "labels": ["tag1", "tag2"],
+            "adapter_list_length": 3,
+            "score": idx / 3,
+        }
+        data.append({"type": "entities_schema", "id": str(idx), "attributes": attributes})
+    meta = {"page": {"number": 1, "size": count, "totalPages": 1, "totalResources": count}}
+    return {"data": data, "meta": meta}
+
+
+class TestJsonBackend:
+    """Test json_backend."""
+
+    @pytest.fixture(autouse=True)
+    def reset_backend(self):
+        """Restore the backend that was in use before each test."""
+        backend = json_backend.BACKEND
+        yield
+        json_backend.BACKEND = backend
+
+    def test_stdlib_always_available(self):
+        assert json_backend.BACKEND_STDLIB in BACKENDS
+
+    def test_set_backend_auto(self):
+        backend = json_backend.set_backend(name=json_backend.BACKEND_AUTO)
+        assert backend.name in BACKENDS
+        assert json_backend.get_backend() is backend
+
+    def test_set_backend_invalid(self):
+        with pytest.raises(ValueError):
+            json_backend.set_backend(name="badwolf")
+
+    @pytest.mark.parametrize("name", list(BACKENDS))
+    def test_round_trip(self, name):
+        json_backend.set_backend(name=name)
+        obj = {"x": [1, 2.5, None, True, "✓ / \"y\""], 1: {"z": {}}}
+        exp = {"x": [1, 2.5, None, True, "✓ / \"y\""], "1": {"z": {}}}
+        for indent in [None, 2]:
+            dumped = json_backend.dumps(obj, indent=indent)
+            assert isinstance(dumped, str)
+            assert json.loads(dumped) == exp
+            assert json_backend.loads(dumped) == exp
+            assert json_backend.loads(dumped.encode()) == exp
+
+    @pytest.mark.parametrize("name", list(BACKENDS))
+    def test_json_dump_matches_stdlib(self, name):
+        json_backend.set_backend(name=name)
+        obj = {"x": "✓ / 1", "nan": float("nan"), "small": 1e-7, "sorted": {"b": 1, "a": 2}}
+        for indent in [None, 2, 4]:
+            ret = json_dump(obj, indent=indent, sort_keys=True)
+            exp = json.dumps(obj, indent=indent, sort_keys=True, cls=AxJSONEncoder)
+            assert ret == exp
+
+    @pytest.mark.parametrize("name", list(BACKENDS))
+    def test_json_dump_fast(self, name):
+        json_backend.set_backend(name=name)
+        now = datetime.datetime.now(datetime.timezone.utc)
+        obj = {"now": now, "func": json_dump, "big": 2**70, "sorted": {"b": 1, "a": 2}}
+        exp = {"now": now.isoformat(), "func": str(json_dump), "big": 2**70}
+        exp["sorted"] = {"a": 2, "b": 1}
+        for indent in [None, 2, 4]:
+            ret = json_dump(obj, indent=indent, sort_keys=True, fast=True)
+            assert json.loads(ret) == exp
+
+    @pytest.mark.parametrize("name", list(BACKENDS))
+    def test_get_dumps(self, name):
+        backend = json_backend.set_backend(name=name)
+        obj = {"x": "✓", "big": 2**70}
+        for indent in [None, 2, 4]:
+            dumps = json_backend.get_dumps(indent=indent)
+            if name == json_backend.BACKEND_STDLIB or not backend.supports(indent):
+                assert isinstance(dumps, functools.partial)
+                assert dumps.func is json.dumps
+            assert json.loads(dumps(obj)) == obj
+
+    def test_orjson_indents(self):
+        if "orjson" not in BACKENDS:
+            pytest.skip("orjson not installed")
+        backend = BACKENDS["orjson"]
+        assert backend.supports(None) and backend.supports(2)
+        assert not backend.supports(4)
+
+    @pytest.mark.parametrize("name", list(BACKENDS))
+    @pytest.mark.parametrize("flat", [True, False])
+    def test_json_export(self, name, flat, tmp_path):
+        json_backend.set_backend(name=name)
+        rows = [{"internal_axon_id": "1", "x": "é ✓", "nan": float("nan")}]
+        apiobj = types.SimpleNamespace(
+            LOG=logging.getLogger(__name__), fields=types.SimpleNamespace(get=lambda: {})
+        )
+        indent = None if flat else 2
+        for fast in [False, True]:
+            path = tmp_path / f"{fast}.json"
+            getargs = {"export_file": path, "json_flat": flat, "json_fast": fast, "do_echo": False}
+            cbobj = Json(apiobj=apiobj, store={}, getargs=getargs)
+            cbobj.start()
+            cbobj.write_rows(rows=rows)
+            cbobj.stop()
+            text = path.read_text()
+            if not fast:
+                exp = json.dumps(rows[0], indent=indent)
+                assert (exp if flat else textwrap.indent(exp, prefix="  ")) in text
+            loaded = [json.loads(x) for x in text.splitlines()] if flat else json.loads(text)
+            assert loaded[0]["x"] == rows[0]["x"]
+
+    @pytest.mark.benchmark
+    @pytest.mark.parametrize("name", [x for x in BACKENDS if x != json_backend.BACKEND_STDLIB])
+    def test_benchmark_page(self, name):
+        """Check that a backend dumps and loads a 10k asset page faster than the stdlib."""
+        page = get_page()
+        took = {}
+        for backend in [json_backend.BACKEND_STDLIB, name]:
+            json_backend.set_backend(name=backend)
+            start = time.perf_counter()
+            loaded = json_backend.loads(json_backend.dumps(page).encode())
+            took[backend] = time.perf_counter() - start
+            assert loaded == page
+
+        assert took[name] < took[json_backend.BACKEND_STDLIB]
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""Test suite for bulk add and remove of tags in axonius_api_client.api.assets.Labels."""
+import logging
+import types
+
+import requests
+
+from axonius_api_client.api.assets.labels import Labels
+from axonius_api_client.api.json_api.generic import IntValue
+from axonius_api_client.http import RetryPolicy
+
+POLICY = RetryPolicy(backoff=0, jitter=0)
+
+
+class FakeLabels(Labels):
+    def __init__(self, fail=None, error=requests.ConnectionError):
+        self.LOG = logging.getLogger(__name__)
+        self.auth = types.SimpleNamespace(http=types.SimpleNamespace(RETRY_POLICY=POLICY))
+        self.fail = fail or {}
+        self.error = error
+        self.calls = []
+
+    def _send(self, method, labels, ids, include=True, **kwargs):
+        self.calls.append({"method": method, "labels": labels, "ids": ids, **kwargs})
+        if self.fail.get(ids[0], 0) > 0:
+            self.fail[ids[0]] -= 1
+            raise self.error(f"badwolf {ids[0]}")
+        return IntValue(value=len(ids) if include else 0)
+
+    def _add(self, labels, ids, include=True, expirable_tags=None, http_args=None):
+        return self._send(
+            "add", labels, ids, include, expirable_tags=expirable_tags, http_args=http_args
+        )
+
+    def _remove(self, labels, ids, include=True, http_args=None):
+        return self._send("remove", labels, ids, include, http_args=http_args)
+
+
+def get_rows(count):
+    return ({"internal_axon_id": f"id{x:03d}"} for x in range(count))
+
+
+class TestLabelsBulk:
+    def test_add_bulk(self):
+        apiobj = FakeLabels()
+        progress = []
+        result = apiobj.add_bulk(
+            rows=get_rows(25),
+            labels="x",
+            chunk_size=10,
+            workers=4,
+            progress=lambda x: progress.append(x.chunks),
+        )
+        assert result.value == result.ids == 25
+        assert result.chunks == 3
+        assert not result.failed
+        assert progress == [1, 2, 3]
+        assert sorted(len(x["ids"]) for x in apiobj.calls) == [5, 10, 10]
+        assert all(x["labels"] == "x" for x in apiobj.calls)
+
+    def test_chunk_bytes(self):
+        apiobj = FakeLabels()
+        # '["id000","id001","id002","id003"]' is 33 bytes
+        result = apiobj.remove_bulk(rows=get_rows(10), labels="x", chunk_bytes=33)
+        assert result.chunks == 3
+        assert [x["method"] for x in apiobj.calls] == ["remove"] * 3
+
+    def test_retry(self, caplog):
+        apiobj = FakeLabels(fail={"id010": 1})
+        result = apiobj.add_bulk(rows=get_rows(20), labels="x", chunk_size=10)
+        assert result.value == 20
+        assert not result.failed
+        assert len(apiobj.calls) == 3
+        assert "badwolf id010" in caplog.text
+
+    def test_http_retries_off(self):
+        apiobj = FakeLabels(fail={"id000": 1})
+        apiobj.remove_bulk(rows=get_rows(10), labels="x")
+        assert len(apiobj.calls) == 2
+        for call in apiobj.calls:
+            assert call["http_args"]["retry_policy"].max_attempts == 1
+
+    def test_failed(self):
+        apiobj = FakeLabels(fail={"id010": 5})
+        result = apiobj.add_bulk(
+            rows=get_rows(25),
+            labels="x",
+            chunk_size=10,
+            retry_policy=RetryPolicy(max_attempts=2, backoff=0),
+            workers=2,
+        )
+        assert result.value == 15
+        assert result.ids == 25
+        assert [x.index for x in result.failed] == [1]
+        assert result.failed[0].attempts == 2
+        assert "badwolf id010" in result.failed[0].error
+        assert result.failed_ids == [f"id{x:03d}" for x in range(10, 20)]
+
+        apiobj.fail = {}
+        retried = apiobj.add_bulk(rows=result.failed_ids, labels="x")
+        assert retried.value == 10
+        assert not retried.failed
+
+    def test_not_retryable(self):
+        apiobj = FakeLabels(fail={"id000": 1}, error=ValueError)
+        result = apiobj.add_bulk(rows=get_rows(10), labels="x")
+        assert result.failed[0].attempts == 1
+        assert len(apiobj.calls) == 1
+
+    def test_add_not_chunked(self, monkeypatch):
+        monkeypatch.setattr("axonius_api_client.api.assets.labels.LABELS_CHUNK_SIZE", 10)
+        apiobj = FakeLabels()
+        assert apiobj.add(rows=list(get_rows(25)), labels="x") == 25
+        assert len(apiobj.calls) == 1
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""Test suite for the lazy imports of axonius_api_client."""
+import json
+import subprocess
+import sys
+
+import pytest
+
+import axonius_api_client
+import axonius_api_client.api
+import axonius_api_client.api.json_api
+
+LAZY_MODULES = [
+    "axonius_api_client.api",
+    "axonius_api_client.api.api_endpoints",
+    "axonius_api_client.api.json_api.assets",
+    "axonius_api_client.cli",
+    "axonius_api_client.connect",
+    "axonius_api_client.http",
+    "axonius_api_client.projects.cert_human",
+    "OpenSSL",
+    "xlsxwriter",
+]
+"""Modules that must not be imported by ``import axonius_api_client``."""
+
+IMPORT_SECONDS_MAX = 2.0
+"""Upper bound of seconds that ``import axonius_api_client`` may take in a fresh interpreter."""
+
+
+def run_import(code: str) -> dict:
+    """Run code in a fresh interpreter and load the JSON it prints."""
+    proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, timeout=120)
+    assert proc.returncode == 0, proc.stderr
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+class TestLazyImports:
+    def test_import_time(self):
+        code = (
+            "import json, sys, time\n"
+            "start = time.perf_counter()\n"
+            "import axonius_api_client\n"
+            "took = time.perf_counter() - start\n"
+            f"mods = [x for x in {LAZY_MODULES!r} if x in sys.modules]\n"
+            "print(json.dumps({'took': took, 'mods': mods}))\n"
+        )
+        result = run_import(code=code)
+        assert result["mods"] == []
+        assert result["took"] < IMPORT_SECONDS_MAX
+
+    def test_loaded_on_access(self):
+        code = (
+            "import json, sys\n"
+            "import axonius_api_client as axonapi\n"
+            "before = 'axonius_api_client.connect' in sys.modules\n"
+            "connect = axonapi.Connect\n"
+            "after = 'axonius_api_client.connect' in sys.modules\n"
+            "print(json.dumps({'before': before, 'after': after, 'name': connect.__name__}))\n"
+        )
+        result = run_import(code=code)
+        assert result == {"before": False, "after": True, "name": "Connect"}
+
+    @pytest.mark.parametrize(
+        "module", [axonius_api_client, axonius_api_client.api, axonius_api_client.api.json_api]
+    )
+    def test_all(self, module):
+        for name in module.__all__:
+            assert getattr(module, name) is not None
+            assert name in dir(module)
+
+    @pytest.mark.parametrize(
+        "module", [axonius_api_client, axonius_api_client.api, axonius_api_client.api.json_api]
+    )
+    def test_invalid(self, module):
+        with pytest.raises(AttributeError):
+            module.badwolf
+
+    def test_same_objects(self):
+        from axonius_api_client.api.assets import Devices
+        from axonius_api_client.projects import cert_human
+
+        assert axonius_api_client.Devices is Devices
+        assert axonius_api_client.api.Devices is Devices
+        assert axonius_api_client.cert_human is cert_human
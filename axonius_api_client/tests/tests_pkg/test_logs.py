@@ -14,8 +14,11 @@ from axonius_api_client.constants.logs import (
     LOG_NAME_STDOUT,
 )
 from axonius_api_client.exceptions import ToolsError
+from axonius_api_client.tools import json_dump
+from axonius_api_client.api.json_api.assets import AssetsPage
 from axonius_api_client.logs import (
     LOG,
+    LazyStr,
     add_file,
     add_null,
     add_stderr,
@@ -26,6 +29,7 @@ from axonius_api_client.logs import (
     del_stdout,
     get_obj_log,
     gmtime,
+    lazy_json,
     localtime,
     set_log_level,
     str_level,
@@ -144,3 +148,80 @@ class TestLogs:
         assert isinstance(dh[LOG.name], list)
         assert h in dh[LOG.name]
         assert h not in LOG.handlers
+
+
+class TestLazyStr:
+    """Test LazyStr and lazy_json."""
+
+    def test_str(self):
+        calls = []
+
+        def func(value, suffix=""):
+            calls.append(value)
+            return f"{value}{suffix}"
+
+        lazy = LazyStr(func, 1, suffix="x")
+        assert not calls
+        assert str(lazy) == "1x"
+        assert repr(lazy) == "1x"
+        assert calls == [1, 1]
+
+    def test_lazy_json(self):
+        obj = {"x": [1, 2]}
+        assert str(lazy_json(obj)) == json_dump(obj)
+        assert str(lazy_json(obj, indent=None)) == json_dump(obj, indent=None)
+
+    def test_not_formatted_above_level(self, caplog):
+        calls = []
+        log = LOG.getChild("test_lazy")
+        log.setLevel(logging.INFO)
+        log.debug("value=%s", LazyStr(calls.append, 1))
+        assert not calls
+
+        caplog.set_level(logging.DEBUG, logger=log.name)
+        log.debug("value=%s", LazyStr(lambda: calls.append(1) or "done"))
+        assert calls
+        assert "value=done" in caplog.text
+
+    def test_page_state_not_formatted_above_level(self, caplog):
+        class Counter:
+            calls = 0
+
+            def __str__(self):
+                Counter.calls += 1
+                return "counted"
+
+        log = LOG.getChild("test_lazy_state")
+        log.setLevel(logging.INFO)
+        state = AssetsPage.create_state(initial_count=100000)
+        state["counter"] = Counter()
+        for _ in range(100):
+            log.debug("CURRENT PAGING STATE: %s", lazy_json(state))
+        assert Counter.calls == 0
+
+        caplog.set_level(logging.DEBUG, logger=log.name)
+        log.debug("CURRENT PAGING STATE: %s", lazy_json(state))
+        assert Counter.calls
+        assert '"counter": "counted"' in caplog.text
+
+    @pytest.mark.benchmark
+    def test_benchmark_page_state(self):
+        """Check that logging the paging state lazily removes the per page formatting cost."""
+        log = LOG.getChild("test_lazy_benchmark")
+        log.setLevel(logging.INFO)
+        state = AssetsPage.create_state(initial_count=100000)
+        state["page"] = {"number": 1, "size": 2000, "totalPages": 50, "totalResources": 100000}
+        pages = 500
+
+        start = time.perf_counter()
+        for _ in range(pages):
+            log.debug(f"CURRENT PAGING STATE: {json_dump(state)}")
+        eager_took = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(pages):
+            log.debug("CURRENT PAGING STATE: %s", lazy_json(state))
+        lazy_took = time.perf_counter() - start
+
+        per_page = f"eager {eager_took / pages:.6f}s, lazy {lazy_took / pages:.6f}s per page"
+        assert lazy_took * 5 < eager_took, per_page
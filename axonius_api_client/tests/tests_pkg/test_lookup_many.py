@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""Test suite for axonius_api_client.api.assets.AssetMixin.lookup_many."""
+import logging
+import re
+import types
+
+from axonius_api_client.api.assets.asset_mixin import AssetMixin
+
+FIELD = "specific_data.data.hostname"
+ASSETS = [
+    {"internal_axon_id": "a1", FIELD: ["host1", "alias1"]},
+    {"internal_axon_id": "a2", FIELD: "host2"},
+    {"internal_axon_id": "a3", FIELD: ["host2", 'we"ird']},
+]
+
+
+def get_values(asset):
+    value = asset[FIELD]
+    return value if isinstance(value, list) else [value]
+
+
+class FakeAssets(AssetMixin):
+    ASSET_TYPE = "devices"
+
+    def __init__(self, url="https://instance1"):
+        self.LOG = logging.getLogger(__name__)
+        self.http = types.SimpleNamespace(url=url)
+        self.fields = types.SimpleNamespace(get_field_name=lambda value, field_manual: FIELD)
+        self.calls = []
+
+    def get(self, query, **kwargs):
+        self.calls.append({"query": query, **kwargs})
+        inner = re.search(r"in \[(.*)\]", query).group(1)
+        values = [x.replace('\\"', '"') for x in re.findall(r'"((?:[^"\\]|\\.)*)"', inner)]
+        return [dict(x) for x in ASSETS if any(y in values for y in get_values(x))]
+
+
+class TestLookupMany:
+    def test_mapping(self):
+        apiobj = FakeAssets()
+        values = ["host1", "host2", "alias1", "host1", "missing", 'we"ird', ""]
+        found = apiobj.lookup_many(values=values, field="hostname", chunk_size=2, workers=2)
+        assert list(found) == ["host1", "host2", "alias1", "missing", 'we"ird']
+        assert [x["internal_axon_id"] for x in found["host1"]] == ["a1"]
+        assert [x["internal_axon_id"] for x in found["host2"]] == ["a2", "a3"]
+        assert [x["internal_axon_id"] for x in found["alias1"]] == ["a1"]
+        assert [x["internal_axon_id"] for x in found['we"ird']] == ["a3"]
+        assert found["missing"] == []
+        assert len(apiobj.calls) == 3
+        assert all(x["fields_manual"] == [FIELD] for x in apiobj.calls)
+
+    def test_cache(self):
+        apiobj = FakeAssets()
+        cache = {}
+        found = apiobj.lookup_many(values=["host1", "missing"], field="hostname", cache=cache)
+        assert len(apiobj.calls) == 1
+        assert len(cache) == 2
+
+        again = apiobj.lookup_many(
+            values=["host1", "missing", "host2"], field="hostname", cache=cache
+        )
+        assert again["host1"] == found["host1"]
+        assert again["missing"] == []
+        assert len(apiobj.calls) == 2
+        assert "host1" not in apiobj.calls[1]["query"]
+        assert "host2" in apiobj.calls[1]["query"]
+
+        apiobj.lookup_many(values=["host1"], field="hostname", fields=["os.type"], cache=cache)
+        assert len(apiobj.calls) == 3
+
+    def test_cache_key(self):
+        cache = {}
+        apiobj = FakeAssets()
+        apiobj.lookup_many(values=["host1"], field="hostname", cache=cache)
+        apiobj.lookup_many(values=["host1"], field="hostname", cache=cache, history_date="x")
+        assert len(apiobj.calls) == 2
+        assert apiobj.calls[1]["history_date"] == "x"
+
+        other = FakeAssets(url="https://instance2")
+        other.lookup_many(values=["host1"], field="hostname", cache=cache)
+        assert len(other.calls) == 1
+        assert len(cache) == 3
+
+    def test_cache_copies(self):
+        apiobj = FakeAssets()
+        found = apiobj.lookup_many(values=["host1"], field="hostname", cache=True)
+        found["host1"][0]["row"] = "changed"
+        found["host1"].append({})
+
+        again = apiobj.lookup_many(values=["host1"], field="hostname", cache=True)
+        assert len(apiobj.calls) == 1
+        assert again["host1"] == [ASSETS[0]]
+        assert "row" not in ASSETS[0]
+        assert FakeAssets().lookup_many(values=["host1"], field="hostname", cache=True)
+        assert FakeAssets._lookup_cache is None
+
+    def test_no_cache(self):
+        apiobj = FakeAssets()
+        apiobj.lookup_many(values=["host1"], field="hostname")
+        apiobj.lookup_many(values=["host1"], field="hostname")
+        assert len(apiobj.calls) == 2
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""Test suite for fetching pages of assets concurrently in AssetMixin.get_generator."""
+import logging
+import time
+import types
+
+import pytest
+
+from axonius_api_client.api.assets.asset_mixin import AssetMixin
+from axonius_api_client.api.json_api.assets import AssetRequest, AssetsPage
+
+STORE = {"query": None, "fields_parsed": [], "include_details": False, "include_notes": False}
+
+
+class FakeAssets(AssetMixin):
+    ASSET_TYPE = "devices"
+
+    def __init__(self, rows, delays):
+        self.LOG = logging.getLogger(__name__)
+        self.rows = rows
+        self.delays = delays
+
+    def _get_page(self, request_obj, http_args=None):
+        offset = request_obj.page.offset
+        time.sleep(self.delays.get(offset, 0))
+        count = max(0, min(request_obj.page.limit, self.rows - offset))
+        return types.SimpleNamespace(
+            offset=offset, asset_count_page=count, asset_count_total=self.rows
+        )
+
+
+def get_offsets(apiobj, initial_count, ordered):
+    state = AssetsPage.create_state(page_size=10, initial_count=initial_count)
+    pages = apiobj._get_pages_parallel(
+        request_obj=AssetRequest(), state=state, store=STORE, workers=3, ordered=ordered
+    )
+    return [(x.offset, x.asset_count_page) for x, _ in pages]
+
+
+class TestGetPagesParallel:
+    @pytest.mark.parametrize("ordered", [True, False])
+    def test_empty_page_first(self, ordered):
+        # the count shrank to 20 after the initial count of 30, and the empty page past the
+        # end is received before the pages with rows
+        apiobj = FakeAssets(rows=20, delays={0: 0.2, 10: 0.1})
+        offsets = get_offsets(apiobj=apiobj, initial_count=30, ordered=ordered)
+        assert offsets[-1] == (20, 0)
+        assert sorted(offsets[:-1]) == [(0, 10), (10, 10)]
+
+    def test_unordered_yields_as_received(self):
+        apiobj = FakeAssets(rows=30, delays={0: 0.2, 10: 0.1})
+        offsets = get_offsets(apiobj=apiobj, initial_count=30, ordered=False)
+        assert offsets == [(20, 10), (10, 10), (0, 10)]
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""Test suite for the columns of files written by the Parquet and Arrow callbacks."""
+import logging
+
+import pytest
+
+from axonius_api_client.api.asset_callbacks.base_parquet import Arrow
+
+pyarrow = pytest.importorskip("pyarrow")
+
+SCHEMAS = [
+    {"name_qual": "internal_axon_id", "column_title": "Asset Unique ID", "type": "string"},
+    {"name_qual": "adapter_list_length", "column_title": "Adapter Count", "type": "integer"},
+]
+
+
+class FakeArrow(Arrow):
+    def __init__(self, path, batch_size):
+        self.LOG = logging.getLogger(__name__)
+        self.GETARGS = {
+            "export_file": str(path),
+            "parquet_batch_size": batch_size,
+            "export_schema": False,
+            "field_explode": None,
+            "do_echo": False,
+        }
+        self._final_schemas = SCHEMAS
+        self._final_columns = [x["name_qual"] for x in SCHEMAS]
+        self._file_path = path
+        self._fd_info = str(path)
+        self._batch_size = batch_size
+        self._batch = []
+        self._writer = None
+        self._schema = None
+        self._coercers = []
+        self._coerced = {}
+        self._dropped = {}
+        self._rowtracker = 0
+
+
+def get_row(index, **kwargs):
+    return {"internal_axon_id": f"{index:032x}", "adapter_list_length": index, **kwargs}
+
+
+class TestDroppedColumns:
+    def test_late_columns_warned(self, tmp_path, caplog):
+        path = tmp_path / "badwolf.arrow"
+        cbobj = FakeArrow(path=path, batch_size=2)
+        rows = [
+            get_row(0, extra="a"),
+            get_row(1),
+            get_row(2, late="b"),
+            get_row(3, late="c", later=1),
+            get_row(4, extra="d", late="e"),
+        ]
+        with caplog.at_level(logging.WARNING, logger=__name__):
+            for row in rows:
+                cbobj.write_rows(rows=row)
+            cbobj.do_stop()
+
+        table = pyarrow.ipc.open_file(str(path)).read_all()
+        assert table.column_names == ["internal_axon_id", "adapter_list_length", "extra"]
+        assert table.num_rows == 5
+        assert cbobj._dropped == {"late": 3, "later": 1}
+        assert any("from 3 rows in 'late'" in x for x in caplog.messages)
+        assert any("from 1 rows in 'later'" in x for x in caplog.messages)
+
+    def test_no_late_columns(self, tmp_path, caplog):
+        path = tmp_path / "badwolf.arrow"
+        cbobj = FakeArrow(path=path, batch_size=2)
+        with caplog.at_level(logging.WARNING, logger=__name__):
+            for index in range(5):
+                cbobj.write_rows(rows=get_row(index))
+            cbobj.do_stop()
+        assert cbobj._dropped == {}
+        assert not [x for x in caplog.messages if "Dropped" in x]
@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+"""Test suite for the compiled row transform of axonius_api_client.api.asset_callbacks."""
+import copy
+import logging
+import time
+
+import pytest
+
+from axonius_api_client.api.asset_callbacks.tools import get_callbacks_cls
+from axonius_api_client.api.assets.asset_mixin import AssetMixin
+from axonius_api_client.api.assets.fields import Fields
+from axonius_api_client.parsers.fields import parse_fields
+
+RAW_FIELDS = {
+    "generic": [
+        {"name": "internal_axon_id", "title": "Asset Unique ID", "type": "string"},
+        {
+            "name": "adapters",
+            "title": "Adapter Connections",
+            "type": "array",
+            "items": {"type": "string"},
+        },
+        {
+            "name": "adapter_list_length",
+            "title": "Distinct Adapter Connections Count",
+            "type": "integer",
+        },
+        {
+            "name": "labels",
+            "title": "Tags",
+            "type": "array",
+            "items": {"type": "string", "format": "tag"},
+        },
+        {
+            "name": "specific_data.data.hostname",
+            "title": "Host Name",
+            "type": "array",
+            "items": {"type": "string"},
+        },
+        {
+            "name": "specific_data.data.last_seen",
+            "title": "Last Seen",
+            "type": "string",
+            "format": "date-time",
+        },
+        {"name": "specific_data.data.os.type", "title": "OS: Type", "type": "string"},
+        {
+            "name": "specific_data.data.network_interfaces",
+            "title": "Network Interfaces",
+            "type": "array",
+            "items": {
+                "type": "array",
+                "items": [
+                    {"name": "mac", "title": "MAC", "type": "string"},
+                    {
+                        "name": "ips",
+                        "title": "IPs",
+                        "type": "array",
+                        "items": {"type": "string"},
+                    },
+                ],
+            },
+        },
+    ],
+    "specific": {
+        "aws_adapter": [
+            {
+                "name": "adapters_data.aws_adapter.aws_device_type",
+                "title": "AWS Device Type",
+                "type": "string",
+            }
+        ]
+    },
+}
+"""Field schemas in the format returned by the REST API."""
+
+GETARGS = [
+    {},
+    {
+        "field_excludes": ["adapters"],
+        "field_flatten": True,
+        "field_titles": True,
+        "field_join": True,
+        "field_null": True,
+    },
+    {"field_compress": True, "field_replace": ["_=-", "."], "field_null": True},
+    {"explode_entities": True, "field_null": True},
+]
+
+
+class FakeFields(Fields):
+    def __init__(self):
+        self.LOG = logging.getLogger(__name__)
+        self._indexes = {}
+        self._indexes_fields = None
+        self._schemas = parse_fields(raw=copy.deepcopy(RAW_FIELDS))
+
+    def get(self):
+        return self._schemas
+
+
+class FakeAssets(AssetMixin):
+    ASSET_TYPE = "devices"
+
+    def __init__(self):
+        self.LOG = logging.getLogger(__name__)
+        self.fields = FakeFields()
+
+
+def get_row(idx):
+    return {
+        "internal_axon_id": f"{idx:032x}",
+        "adapters": ["aws_adapter", "active_directory_adapter"],
+        "adapter_list_length": 2,
+        "labels": ["tag1"],
+        "specific_data.data.hostname": [f"host{idx}", f"alias{idx}"],
+        "specific_data.data.hostname_details": [[f"host{idx}"], [f"alias{idx}"]],
+        "specific_data.data.last_seen": "2022-01-01T00:00:00+00:00",
+        "specific_data.data.os.type": "Windows",
+        "specific_data.data.network_interfaces": [
+            {"mac": f"00:00:00:00:00:{idx % 100:02d}", "ips": ["10.0.0.1", "10.0.0.2"]},
+            {"mac": "00:00:00:00:01:00"},
+        ],
+        "adapters_data.aws_adapter.aws_device_type": "EC2",
+    }
+
+
+def transform(getargs, rows, compiled):
+    cbobj = get_callbacks_cls(export="base")(
+        apiobj=FakeAssets(), getargs=dict(getargs), state={}, store={}
+    )
+    cbobj.start()
+    ret = []
+    start = time.perf_counter()
+    for row in copy.deepcopy(rows):
+        if compiled:
+            ret += cbobj.process_row(row=row)
+        else:
+            each = cbobj.do_pre_row(rows=row)
+            for cb in cbobj.callbacks:
+                each = cb(rows=each)
+            ret += each
+    took = time.perf_counter() - start
+    if compiled:
+        assert cbobj.callbacks_compiled[-1] == cbobj.do_row_transform
+    return ret, took
+
+
+class TestRowTransformCompiled:
+    @pytest.mark.parametrize("getargs", GETARGS)
+    def test_same_as_callbacks(self, getargs):
+        rows = [get_row(idx) for idx in range(20)]
+        rows_each, _ = transform(getargs=getargs, rows=rows, compiled=False)
+        rows_compiled, _ = transform(getargs=getargs, rows=rows, compiled=True)
+        assert rows_compiled == rows_each
+        assert [list(x) for x in rows_compiled] == [list(x) for x in rows_each]
+        assert rows_compiled != rows or not getargs
+
+    @pytest.mark.benchmark
+    @pytest.mark.parametrize("getargs", GETARGS)
+    def test_benchmark(self, getargs):
+        """Check that the compiled row transform is faster than each callback on 100k rows."""
+        rows = [get_row(idx) for idx in range(100000)]
+        rows_each, took_each = transform(getargs=getargs, rows=rows, compiled=False)
+        rows_compiled, took_compiled = transform(getargs=getargs, rows=rows, compiled=True)
+        assert rows_compiled == rows_each
+        assert took_compiled < took_each
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""Test suite for verifying Asset IDs in chunks in axonius_api_client.api.assets.Runner."""
+import logging
+import re
+import types
+
+import pytest
+
+from axonius_api_client.api.assets.asset_mixin import AssetMixin
+from axonius_api_client.api.assets.runner import Runner
+from axonius_api_client.exceptions import ApiError, RunnerError
+
+IDS = [f"{x:032x}" for x in range(25)]
+
+
+class FakeApiObj:
+    LOG = logging.getLogger(__name__)
+
+    def __init__(self, missing=None):
+        self.missing = missing or []
+        self.queries = []
+        self.runs = []
+        self.enforcements = types.SimpleNamespace(
+            get_set=lambda value, refetch: types.SimpleNamespace(name=value)
+        )
+
+    def count(self, query):
+        self.queries.append(query)
+        ids = re.findall(r'"([0-9a-f]{32})"', query)
+        return len([x for x in ids if x not in self.missing])
+
+    def _run_enforcement(self, **kwargs):
+        self.runs.append(kwargs)
+
+
+def get_runner(apiobj, **kwargs):
+    kwargs.setdefault("chunk_size", 10)
+    return Runner(apiobj=apiobj, eset="badwolf", ids=IDS, do_echo=False, **kwargs)
+
+
+class TestRunnerChunks:
+    def test_count_match(self):
+        apiobj = FakeApiObj()
+        runner = get_runner(apiobj=apiobj, workers=4)
+        runner.get_count()
+        assert len(apiobj.queries) == 3
+        assert runner.count_results == [10, 10, 5]
+        assert runner.count_result == 25
+        assert runner.is_match is True
+        assert runner.count_mismatches == []
+
+    def test_count_single_chunk(self):
+        apiobj = FakeApiObj()
+        runner = get_runner(apiobj=apiobj, chunk_size=100)
+        runner.get_count()
+        assert apiobj.queries == [runner.query]
+        assert runner.is_match is True
+
+    def test_count_mismatch(self):
+        apiobj = FakeApiObj(missing=[IDS[12], IDS[13]])
+        runner = get_runner(apiobj=apiobj)
+        with pytest.raises(RunnerError, match="chunk 2: 8 found for 10 Asset IDs"):
+            runner.verify()
+        assert runner.count_result == 23
+        assert runner.count_mismatches == [{"chunk": 1, "count_ids": 10, "count_result": 8}]
+
+    def test_ids_deduped(self):
+        apiobj = FakeApiObj()
+        runner = Runner(
+            apiobj=apiobj,
+            eset="badwolf",
+            ids=[*IDS, IDS[3], ",".join(IDS[:5])],
+            do_echo=False,
+            chunk_size=10,
+        )
+        assert runner.ids == IDS
+        assert runner.count_ids == 25
+        runner.get_count()
+        assert runner.is_match is True
+
+    def test_chunks_computed_once(self):
+        runner = get_runner(apiobj=FakeApiObj())
+        assert runner.chunks is runner.chunks
+        assert [len(x) for x in runner.chunks] == [10, 10, 5]
+
+    @pytest.mark.parametrize("run_chunked,chunk_size", [(True, 10), (False, None)])
+    def test_run_chunked(self, run_chunked, chunk_size):
+        apiobj = FakeApiObj()
+        runner = get_runner(apiobj=apiobj, verified=True, run_chunked=run_chunked)
+        runner.verify_and_run()
+        assert apiobj.runs[0]["chunk_size"] == chunk_size
+
+
+class FakeAssets:
+    LOG = logging.getLogger(__name__)
+
+    def __init__(self):
+        self.runs = []
+
+    def _run_enforcement(self, **kwargs):
+        if kwargs.get("chunk_size"):
+            return AssetMixin._run_enforcement(self, **kwargs)
+        self.runs.append(kwargs)
+
+
+class TestRunEnforcementChunks:
+    def test_chunks(self):
+        apiobj = FakeAssets()
+        ret = AssetMixin._run_enforcement(apiobj, name="badwolf", ids=IDS, chunk_size=10)
+        assert len(ret) == 3
+        assert [x["ids"] for x in apiobj.runs] == [IDS[:10], IDS[10:20], IDS[20:]]
+
+    def test_chunks_exclude(self):
+        with pytest.raises(ApiError):
+            AssetMixin._run_enforcement(
+                FakeAssets(), name="badwolf", ids=IDS, chunk_size=10, include=False
+            )
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""Test suite for streaming tables in axonius_api_client.api.asset_callbacks.base_table."""
+import io
+import logging
+import types
+
+import pytest
+import tabulate
+
+from axonius_api_client.api.asset_callbacks.base_table import Table
+from axonius_api_client.exceptions import StopFetch
+
+
+def get_cbobj(table_format):
+    cbobj = types.SimpleNamespace(warnings=[])
+    cbobj.get_arg_value = lambda arg: table_format
+    cbobj.echo = lambda msg, warning=False: cbobj.warnings.append(msg)
+    return cbobj
+
+
+class TestGetStreamFormat:
+    def test_supported(self):
+        cbobj = get_cbobj("simple")
+        assert isinstance(Table.get_stream_format(cbobj), tabulate.TableFormat)
+        assert cbobj.warnings == []
+
+    @pytest.mark.parametrize("table_format", ["badwolf", "html"])
+    def test_unsupported(self, table_format):
+        cbobj = get_cbobj(table_format)
+        assert Table.get_stream_format(cbobj) is None
+        assert "can not be streamed" in cbobj.warnings[0]
+
+    def test_no_private_formats(self, monkeypatch):
+        monkeypatch.delattr(tabulate, "_table_formats")
+        cbobj = get_cbobj("simple")
+        assert Table.get_stream_format(cbobj) is None
+        assert len(cbobj.warnings) == 1
+
+
+class FakeTable(Table):
+    def __init__(self, **getargs):
+        self.LOG = logging.getLogger(__name__)
+        self.APIOBJ = types.SimpleNamespace(LOG=self.LOG)
+        self.GETARGS = {"table_stream": True, "table_stream_sample": 2, "do_echo": False}
+        self.GETARGS.update(getargs)
+        self.STATE = {}
+        self._final_columns = ["id"]
+        self._fd = io.StringIO()
+        self._rows = []
+        self._stream_fmt = self.get_stream_format()
+        self._stream_columns = None
+        self._stream_columns_set = set()
+        self._stream_widths = None
+        self._stream_count = 0
+        self._stream_dropped = set()
+
+
+class TestStream:
+    def test_late_columns_warned_once(self, caplog):
+        cbobj = FakeTable()
+        rows = [{"id": 1, "a": "x"}, {"id": 2}, {"id": 3, "b": "y"}, {"id": 4, "b": "z"}]
+        with caplog.at_level(logging.WARNING, logger=__name__):
+            for row in rows:
+                cbobj.write_stream(rows=[row])
+            cbobj.write_stream(rows=[], final=True)
+
+        assert cbobj._stream_columns == ["id", "a"]
+        assert cbobj._stream_count == 4
+        warnings = [x for x in caplog.messages if "Dropping columns" in x]
+        assert len(warnings) == 1
+        assert "['b']" in warnings[0]
+
+    def test_default_max_rows_ignored(self):
+        cbobj = FakeTable()
+        cbobj.STATE["rows_processed_total"] = 1000
+        cbobj.check_stop()
+
+    def test_supplied_max_rows(self):
+        cbobj = FakeTable(table_max_rows=10)
+        cbobj.STATE["rows_processed_total"] = 10
+        with pytest.raises(StopFetch):
+            cbobj.check_stop()
+
+    def test_default_max_rows_not_streamed(self):
+        cbobj = FakeTable()
+        cbobj._stream_fmt = None
+        cbobj.STATE["rows_processed_total"] = 1000
+        with pytest.raises(StopFetch):
+            cbobj.check_stop()
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""Test suite for axonius_api_client.api.enforcements.tasks.Tasks.get_full_generator."""
+import logging
+import types
+
+import pytest
+
+from axonius_api_client.api.enforcements.tasks import Tasks
+from axonius_api_client.exceptions import ApiError
+
+APIOBJ = types.SimpleNamespace(LOG=logging.getLogger(__name__))
+
+
+class FakeBasic:
+    def __init__(self, uuid, fail=False):
+        self.uuid = uuid
+        self.fail = fail
+
+    def get_full(self):
+        if self.fail:
+            raise ValueError(f"badwolf {self.uuid}")
+        return f"full {self.uuid}"
+
+
+def get_full(basics, **kwargs):
+    return list(Tasks.get_full_generator(APIOBJ, basics=basics, **kwargs))
+
+
+class TestGetFullGenerator:
+    def test_ordered(self):
+        basics = [FakeBasic(uuid=x) for x in range(20)]
+        results = get_full(basics=(x for x in basics), workers=4)
+        assert [x[0] for x in results] == basics
+        assert [x[1] for x in results] == [f"full {x}" for x in range(20)]
+
+    def test_errors_raise(self):
+        basics = [FakeBasic(uuid=0), FakeBasic(uuid=1, fail=True), FakeBasic(uuid=2)]
+        with pytest.raises(ValueError):
+            get_full(basics=basics, workers=2)
+
+    def test_errors_skip(self, caplog):
+        progress = []
+        basics = [FakeBasic(uuid=0), FakeBasic(uuid=1, fail=True), FakeBasic(uuid=2)]
+        results = get_full(
+            basics=basics,
+            workers=2,
+            errors="skip",
+            progress=lambda done, failed: progress.append((done, failed)),
+        )
+        assert [x[1] for x in results] == ["full 0", "full 2"]
+        assert progress == [(1, 0), (2, 1), (3, 1)]
+        assert "badwolf 1" in caplog.text
+
+    def test_errors_invalid(self):
+        with pytest.raises(ApiError):
+            get_full(basics=[], errors="badwolf")
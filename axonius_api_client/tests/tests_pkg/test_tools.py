@@ -2,7 +2,10 @@
 """Test suite for axonius_api_client."""
 import codecs
 import io
+import json
 import tempfile
+import threading
+import time
 from datetime import timezone
 
 import dateutil.tz
@@ -14,12 +17,14 @@ from axonius_api_client.constants.general import IS_WINDOWS
 from axonius_api_client.exceptions import ToolsError
 from axonius_api_client.tools import (
     bom_strip,
+    bounded_map,
     calc_perc_gb,
     calc_percent,
     check_empty,
     check_gui_page_size,
     check_path_is_not_dir,
     check_type,
+    chunk_by_size,
     coerce_bool,
     coerce_int,
     coerce_int_float,
@@ -55,6 +60,7 @@ from axonius_api_client.tools import (
     json_dump,
     json_load,
     json_reload,
+    json_stream_items,
     kv_dump,
     listify,
     longest_str,
@@ -1012,6 +1018,85 @@ class TestGrouper:
         assert x == [(1, 2), (3, 4), (5, 6), (7, "x")]
 
 
+class TestChunkBySize:
+    """Test chunk_by_size."""
+
+    def test_items(self):
+        """Simple test."""
+        x = list(chunk_by_size((y for y in range(7)), max_items=3))
+        assert x == [[0, 1, 2], [3, 4, 5], [6]]
+
+    def test_bytes(self):
+        """Simple test."""
+        # '["aaaa","bbbb"]' is 15 bytes
+        x = list(chunk_by_size(["aaaa", "bbbb", "cccc"], max_items=10, max_bytes=15))
+        assert x == [["aaaa", "bbbb"], ["cccc"]]
+
+    def test_bytes_item_too_big(self):
+        """Simple test."""
+        x = list(chunk_by_size(["a" * 20, "b"], max_items=10, max_bytes=10))
+        assert x == [["a" * 20], ["b"]]
+
+    def test_empty(self):
+        """Simple test."""
+        assert list(chunk_by_size([], max_items=3)) == []
+
+
+class TestBoundedMap:
+    """Test bounded_map."""
+
+    @pytest.mark.parametrize("workers", [1, 4])
+    def test_ordered(self, workers):
+        """Simple test."""
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0, "pulled": 0}
+
+        def items():
+            for x in range(20):
+                state["pulled"] += 1
+                yield x
+
+        def func(x):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.02 if x % 3 == 0 else 0)
+            with lock:
+                state["active"] -= 1
+            return x * 2
+
+        for item, future in bounded_map(func=func, iterable=items(), workers=workers):
+            assert state["pulled"] - item <= workers
+            assert future.result() == item * 2
+        assert state["peak"] <= workers
+
+    def test_error(self):
+        """Simple test."""
+
+        def func(x):
+            if x == 1:
+                raise ValueError("badwolf")
+            return x
+
+        results = list(bounded_map(func=func, iterable=range(3), workers=2))
+        assert [x[0] for x in results] == [0, 1, 2]
+        with pytest.raises(ValueError):
+            results[1][1].result()
+
+    def test_close(self):
+        """Simple test."""
+        calls = []
+        gen = bounded_map(func=calls.append, iterable=range(100), workers=2)
+        next(gen)
+        gen.close()
+        assert len(calls) <= 3
+
+    def test_workers_invalid(self):
+        """Simple test."""
+        results = bounded_map(func=lambda x: x, iterable=range(3), workers=999, default=2)
+        assert [x[1].result() for x in results] == [0, 1, 2]
+
+
 '''
 class TestNestDepth:
     """Test listify."""
@@ -1390,6 +1475,100 @@ class TestJsonReload:
             json_reload(obj=x, error=True)
 
 
+class TestJsonStreamItems:
+    """Test json_stream_items."""
+
+    @staticmethod
+    def chunkify(obj, size):
+        """Pass."""
+        data = json_dump(obj, indent=None).encode()
+        return [data[i : i + size] for i in range(0, len(data), size)]
+
+    @pytest.mark.parametrize("size", [1, 3, 64, 100000])
+    def test_items(self, size):
+        """Simple test."""
+        obj = {
+            "data": [{"attributes": {"x": i, "y": "\u2713 \"z\"", "n": None}} for i in range(20)],
+            "meta": {"page": {"number": 1}},
+            "other": 123456,
+        }
+        others = {}
+        items = list(json_stream_items(chunks=self.chunkify(obj, size), others=others))
+        assert items == obj["data"]
+        assert others == {"meta": obj["meta"], "other": obj["other"]}
+
+    def test_items_str_chunks(self):
+        """Simple test."""
+        assert list(json_stream_items(chunks=['{"data": [1,', " 2]}"])) == [1, 2]
+
+    def test_empty(self):
+        """Simple test."""
+        others = {}
+        assert list(json_stream_items(chunks=self.chunkify({"data": None}, 1), others=others)) == []
+        assert others == {"data": None}
+
+    def test_error_not_object(self):
+        """Simple test."""
+        with pytest.raises(ToolsError):
+            list(json_stream_items(chunks=[b"[1, 2]"]))
+
+    def test_error_truncated(self):
+        """Simple test."""
+        with pytest.raises(ToolsError):
+            list(json_stream_items(chunks=[b'{"data": [{"x": 1}, {"x"']))
+
+    @pytest.mark.parametrize("size", [1, 2, 7])
+    def test_items_tricky(self, size):
+        """Simple test."""
+        obj = {
+            "data": ['a "[{" \\', {"x": ["}", "\\\"]", -1.5e10]}, 123456789, True, None, []],
+            "meta": "]}",
+        }
+        others = {}
+        items = list(json_stream_items(chunks=self.chunkify(obj, size), others=others))
+        assert items == obj["data"]
+        assert others == {"meta": obj["meta"]}
+
+    def test_decode_once(self, monkeypatch):
+        """Simple test."""
+        calls = []
+        raw_decode = json.JSONDecoder.raw_decode
+
+        def counted(self, s, idx=0):
+            calls.append(idx)
+            return raw_decode(self, s, idx)
+
+        monkeypatch.setattr(json.JSONDecoder, "raw_decode", counted)
+        obj = {"data": [{"x": "y" * 100} for _ in range(5)]}
+        assert list(json_stream_items(chunks=self.chunkify(obj, 1))) == obj["data"]
+        # one for the key and one for each item
+        assert len(calls) == 6
+
+    def test_error_max_buffer(self):
+        """Simple test."""
+        obj = {"data": [{"x": "y" * 1000}]}
+        with pytest.raises(ToolsError, match="max_buffer"):
+            list(json_stream_items(chunks=self.chunkify(obj, 10), max_buffer=500))
+
+    def test_error_invalid_not_read_whole(self):
+        """Simple test."""
+        read = []
+
+        def chunks():
+            for chunk in [b'{"data": [{"x": 1 2}, ', b'{"x": 1}', b"]}"]:
+                read.append(chunk)
+                yield chunk
+
+        with pytest.raises(ToolsError):
+            list(json_stream_items(chunks=chunks()))
+        assert len(read) == 1
+
+    def test_error_invalid_scalar(self):
+        """Simple test."""
+        with pytest.raises(ToolsError, match="invalid value"):
+            list(json_stream_items(chunks=[b'{"data": [12abc]}']))
+
+
 class TestDtMinAgo:
     """Test dt_*."""
 
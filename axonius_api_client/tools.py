@@ -1,5 +1,7 @@
 """Utilities and tools."""
 import codecs
+import collections
+import concurrent.futures
 import contextlib
 import csv
 import dataclasses
@@ -27,8 +29,14 @@ import dateutil.tz
 import marshmallow
 import typing_extensions as te
 
-from . import INIT_DOTENV, PACKAGE_FILE, PACKAGE_ROOT, VERSION
-from .constants.api import GUI_PAGE_SIZES, REFRESH, FolderDefaults
+from . import INIT_DOTENV, PACKAGE_FILE, PACKAGE_ROOT, VERSION, json_backend
+from .constants.api import (
+    GUI_PAGE_SIZES,
+    MAP_WORKERS_MAX,
+    REFRESH,
+    STREAM_BUFFER_MAX,
+    FolderDefaults,
+)
 from .constants.ctypes import (
     PathLike,
     PatternLike,
@@ -220,6 +228,93 @@ def grouper(
     return zip_longest(*([iter(iterable)] * n), fillvalue=fillvalue)
 
 
+def chunk_by_size(
+    iterable: t.Iterable,
+    max_items: int,
+    max_bytes: t.Optional[int] = None,
+) -> t.Generator[list, None, None]:
+    """Split an iterable into lists bounded by number of items and size as JSON.
+
+    Args:
+        iterable: iterable to split into lists, consumed lazily
+        max_items: maximum number of items in each list
+        max_bytes: maximum size in bytes of the items in each list as a JSON array,
+            a single item larger than this is yielded in a list by itself
+
+    Yields:
+        lists of items
+    """
+    max_items = max(1, int(max_items))
+    chunk: list = []
+    chunk_bytes: int = 1
+    for item in iterable:
+        item_bytes: int = len(json.dumps(item).encode("utf-8")) + 1
+        if chunk and (
+            len(chunk) >= max_items or (max_bytes and chunk_bytes + item_bytes > max_bytes)
+        ):
+            yield chunk
+            chunk, chunk_bytes = [], 1
+        chunk.append(item)
+        chunk_bytes += item_bytes
+
+    if chunk:
+        yield chunk
+
+
+def bounded_map(
+    func: t.Callable[[t.Any], t.Any],
+    iterable: t.Iterable,
+    workers: int = 1,
+    default: int = 1,
+    name: str = "bounded_map",
+) -> t.Generator[t.Tuple[t.Any, concurrent.futures.Future], None, None]:
+    """Call a function with each item of an iterable in a pool of threads, in order.
+
+    Notes:
+        At most ``workers`` items are being processed or waiting to be yielded at any time,
+        so iterable can be a generator of any number of items. If the generator is closed
+        before it is exhausted, the items that have not started are cancelled and it waits
+        for the items that have started.
+
+    Args:
+        func: function to call with each item
+        iterable: items to call func with, consumed lazily
+        workers: number of items to call func with concurrently
+        default: number of workers to use if workers is not between 1 and
+            :data:`axonius_api_client.constants.api.MAP_WORKERS_MAX`
+        name: prefix of the names of the threads
+
+    Yields:
+        tuple of (item, finished future of func(item)) for each item in the order of iterable
+    """
+    workers: int = parse_int_min_max(
+        value=workers, default=default, min_value=1, max_value=MAP_WORKERS_MAX
+    )
+    items: t.Iterator = iter(iterable)
+    futures: t.Deque[t.Tuple[t.Any, concurrent.futures.Future]] = collections.deque()
+
+    def submit() -> bool:
+        for item in items:
+            futures.append((item, executor.submit(func, item)))
+            return True
+        return False
+
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=workers, thread_name_prefix=name)
+    try:
+        while len(futures) < workers and submit():
+            pass
+
+        while futures:
+            item, future = futures.popleft()
+            concurrent.futures.wait([future])
+            yield item, future
+            submit()
+    finally:
+        for _, future in futures:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
 def coerce_int(
     obj: t.Any,
     max_value: t.Optional[int] = None,
@@ -477,6 +572,7 @@ def json_dump(
     fallback: t.Any = str,
     to_dict: bool = True,
     cls: t.Type = AxJSONEncoder,
+    fast: bool = False,
     **kwargs,
 ) -> t.Any:
     """Serialize an object into json str.
@@ -486,7 +582,14 @@ def json_dump(
         indent: json str indent level
         sort_keys: sort dict keys
         error: if json error happens, raise it
+        fast: use the backend from :func:`axonius_api_client.json_backend.get_backend`
+            if cls is :obj:`AxJSONEncoder` and no kwargs are supplied
         **kwargs: passed to :func:`json.dumps`
+
+    Notes:
+        The output of the non standard library backends is equivalent JSON, but not byte for
+        byte identical to :func:`json.dumps`, so fast is only for callers that do not
+        depend on the exact output.
     """
     obj = bytes_to_str(value=obj)
 
@@ -494,6 +597,13 @@ def json_dump(
         obj = obj.to_dict()
 
     try:
+        if fast and cls is AxJSONEncoder and not kwargs:
+            return json_backend.dumps(
+                obj,
+                indent=indent,
+                sort_keys=sort_keys,
+                default=AxJSONEncoder(fallback=fallback).default,
+            )
         return json.dumps(
             obj,
             indent=indent,
@@ -735,6 +845,152 @@ def json_reload(
     return obj
 
 
+JSON_WS_RE: t.Pattern = re.compile(r"[ \t\n\r]*")
+JSON_SCAN_RE: t.Pattern = re.compile(r'"(?:[^"\\]+|\\.)*("?)|[\[\]{}]')
+JSON_SCALAR_RE: t.Pattern = re.compile(r"[^ \t\n\r,:\]}]*")
+
+
+def json_stream_items(
+    chunks: t.Iterable[t.Union[str, bytes]],
+    key: str = "data",
+    others: t.Optional[dict] = None,
+    encoding: str = "utf-8",
+    max_buffer: int = STREAM_BUFFER_MAX,
+) -> t.Generator[t.Any, None, None]:
+    """Incrementally deserialize a JSON object and yield the items of one of its arrays.
+
+    Args:
+        chunks: str or bytes chunks of a JSON object, i.e. :meth:`requests.Response.iter_content`
+        key: key in the top level object that holds the array to yield items from
+        others: dict to store the values of every other key in the top level object in
+        encoding: encoding to use to decode bytes chunks
+        max_buffer: maximum number of characters of a single value to hold while waiting
+            for the rest of it to arrive
+
+    Notes:
+        Only the item being deserialized and the unparsed text of the current chunk are held
+        in memory, so a large response can be processed without holding the whole body,
+        the whole str of the body, and the whole deserialized body all at once.
+
+        Each value is scanned for its end as chunks arrive, tracking the depth of brackets and
+        braces outside of strings, and is only deserialized once it is complete.
+
+        The values of all other keys in the top level object are deserialized whole and
+        stored in ``others`` as they are reached in the stream, so any that come after
+        ``key`` are only available once this generator has been exhausted.
+
+    Raises:
+        :exc:`ToolsError`: if the stream is not a JSON object, ends unexpectedly, or has a
+            value larger than ``max_buffer``
+    """
+    others = others if isinstance(others, dict) else {}
+    chunks = iter(chunks)
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder(encoding)()
+    text = ""
+    pos = 0
+
+    def fill() -> bool:
+        nonlocal text, pos
+        for chunk in chunks:
+            if isinstance(chunk, bytes):
+                chunk = text_decoder.decode(chunk)
+            if chunk:
+                text = text[pos:] + chunk
+                pos = 0
+                if len(text) > max_buffer:
+                    raise ToolsError(
+                        f"JSON stream value is larger than max_buffer={max_buffer} characters"
+                    )
+                return True
+        return False
+
+    def peek() -> str:
+        nonlocal pos
+        while True:
+            pos = JSON_WS_RE.match(text, pos).end()
+            if pos < len(text):
+                return text[pos]
+            if not fill():
+                raise ToolsError(f"Unexpected end of JSON stream after {len(text)} characters")
+
+    def expect(value: str):
+        nonlocal pos
+        found = peek()
+        if found != value:
+            raise ToolsError(f"Expected {value!r} in JSON stream, found {found!r}")
+        pos += 1
+
+    def find_end() -> int:
+        # numbers and literals at the end of a chunk may continue in the next chunk
+        if peek() not in '"[{':
+            while True:
+                end = JSON_SCALAR_RE.match(text, pos).end()
+                if end < len(text) or not fill():
+                    return end
+
+        # offset from pos of the first character not yet scanned
+        scanned = 0
+        depth = 0
+        while True:
+            for match in JSON_SCAN_RE.finditer(text, pos + scanned):
+                token = match.group(0)
+                if token[0] == '"':
+                    if not match.group(1):
+                        break
+                elif token in "[{":
+                    depth += 1
+                else:
+                    depth -= 1
+                scanned = match.end() - pos
+                if depth <= 0:
+                    return match.end()
+            else:
+                scanned = len(text) - pos
+            if not fill():
+                raise ToolsError(f"Unexpected end of JSON stream after {len(text)} characters")
+
+    def decode() -> t.Any:
+        nonlocal pos
+        end = find_end()
+        try:
+            value, found = decoder.raw_decode(text, pos)
+        except json.JSONDecodeError as exc:
+            raise ToolsError(f"Unable to deserialize JSON stream, error: {exc}")
+        if found != end:
+            raise ToolsError(
+                f"Unable to deserialize JSON stream, invalid value {text[pos:found]!r}"
+            )
+        pos = end
+        return value
+
+    expect("{")
+    if peek() == "}":
+        return
+
+    while True:
+        name = decode()
+        expect(":")
+        if name == key and peek() == "[":
+            pos += 1
+            if peek() == "]":
+                pos += 1
+            else:
+                while True:
+                    yield decode()
+                    if peek() != ",":
+                        expect("]")
+                        break
+                    pos += 1
+        else:
+            others[name] = decode()
+
+        if peek() != ",":
+            expect("}")
+            break
+        pos += 1
+
+
 def text_load(
     value: t.Union[str, t.List[str], t.IO],
     close_fh: bool = True,
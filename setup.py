@@ -44,6 +44,11 @@ setup(
     include_package_data=True,
     python_requires=">=3.5",
     install_requires=INSTALL_REQUIRES,
+    extras_require={
+        "parquet": ["pyarrow"],
+        "orjson": ["orjson"],
+        "ujson": ["ujson"],
+    },
     keywords=["Axonius", "API Library"],
     tests_require=["pytest", "pytest-cov", "flaky", "coverage"],
     license=ABOUT["__license__"],